@@ -0,0 +1,309 @@
+import io
+import sys
+import json
+import random
+import time
+import argparse
+import multiprocessing
+from multiprocessing import shared_memory
+from collections import deque
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import engine
+import codec
+import library
+import rarity
+import stream
+import columnar
+import tables
+import tablehits
+from stats import Stats
+
+
+################### BATCH GENERATION ###################
+#generate complete characters without the GUI, e.g.
+#   python batch.py --count 100000 --seed 42 --jobs 8 --format jsonl -o roster.jsonl
+#   python batch.py --count 5000000 --seed 42 --jobs 8 --format columnar -o npcs
+
+formats = ["text", "jsonl", "csv", "binary", "columnar", "library"]
+#formats the workers hand back as codec.py records
+record_formats = ["binary", "columnar"]
+text_sinks = {"text": stream.TextSink, "jsonl": stream.JSONLSink, "csv": stream.CSVSink}
+
+#largest number of characters a worker generates before handing them back
+max_chunk_size = 1000
+#seconds between rewrites of the --stats file while a batch runs
+stats_interval = 2
+
+#workers are forked where possible so they share the tables, power index and
+#power graph the parent has already built instead of importing them again
+if "fork" in multiprocessing.get_all_start_methods():
+    worker_context = multiprocessing.get_context("fork")
+else:
+    worker_context = None
+#the shared record buffer in a worker process (see attach_buffer)
+worker_buffer = None
+
+
+
+#generate the characters numbered start to stop (not including stop); each
+#character has its own random stream so the roster is the same no matter
+#how many jobs generate it. Returns the text (or the records for
+#record_formats), the chunk's Stats if collect is set, else None, and the
+#chunk's table hit counts if count_hits is set, else None.
+def generate_chunk(seed, start, stop, format, physical_form=None, score=False, collect=False,
+                   count_hits=False):
+    if format == "library":
+        #only the seed; library.CharacterLibrary regenerates the character
+        overrides = {"physical_form": physical_form} if physical_form else {}
+        return "".join(json.dumps({"rules": library.rules_hash, "seed": seed, "index": index,
+                                   "overrides": overrides}, separators=(",", ":")) + "\n"
+                       for index in range(start, stop)), None, None
+    start_counting(count_hits)
+    characters = stream.iter_characters(seed, count=stop - start, start=start,
+                                        physical_form=physical_form)
+    chunk_stats = Stats() if collect else None
+    if collect:
+        characters = chunk_stats.tally(characters)
+    if format in record_formats:
+        buffer = io.BytesIO()
+        sink = stream.BinarySink(buffer, header=False)
+    else:
+        buffer = io.StringIO()
+        scorer = partial(rarity.rarity, physical_form_given=physical_form is not None) if score else None
+        if format == "csv":
+            sink = stream.CSVSink(buffer, scorer, header=start == 0)
+        else:
+            sink = text_sinks[format](buffer, scorer)
+    stream.write_stream(characters, sink)
+    return buffer.getvalue(), chunk_stats, tablehits.take() if count_hits else None
+
+
+
+#count the table hits of a worker's chunk from zero
+def start_counting(count_hits):
+    if count_hits:
+        tablehits.enable()
+        tablehits.reset()
+
+
+
+#split count characters into chunks so each job gets several to work on
+def chunks(count, jobs):
+    size = max(1, min(max_chunk_size, count // (jobs * 4)))
+    for start in range(0, count, size):
+        yield start, min(start + size, count)
+
+
+
+#merges the Stats of each chunk and rewrites the stats file every
+#stats_interval seconds and at the end
+class StatsCollector:
+    def __init__(self, file_path):
+        self.stats = Stats()
+        self.file_path = file_path
+        self.saved = time.monotonic()
+
+
+
+    def add(self, chunk_stats):
+        self.stats.merge(chunk_stats)
+        if self.file_path and time.monotonic() - self.saved >= stats_interval:
+            self.save()
+
+
+
+    def save(self):
+        if self.file_path:
+            self.stats.save(self.file_path)
+        self.saved = time.monotonic()
+
+
+
+#write count characters to file in order, using a process pool if jobs > 1;
+#only a few chunks per job are in flight at once, so memory use does not
+#grow with count. collector (a StatsCollector) gets each chunk's Stats. If
+#table hits are being counted, the workers' counts are added to this
+#process's.
+def generate(count, file, seed=0, jobs=1, format="text", physical_form=None, score=False,
+             collector=None):
+    collect = collector is not None
+    count_hits = jobs > 1 and tables.hits is not None
+
+    def write(result):
+        output, chunk_stats, chunk_hits = result
+        file.write(output)
+        if collect:
+            collector.add(chunk_stats)
+        if chunk_hits:
+            tablehits.merge(chunk_hits)
+
+    if jobs > 1 and format in record_formats:
+        generate_records(count, write, seed, jobs, physical_form, collect, count_hits)
+    elif jobs > 1:
+        with ProcessPoolExecutor(max_workers=jobs, mp_context=worker_context) as executor:
+            pending = deque()
+            for start, stop in chunks(count, jobs):
+                pending.append(executor.submit(generate_chunk, seed, start, stop,
+                                               format, physical_form, score, collect, count_hits))
+                if len(pending) >= jobs * 2:
+                    write(pending.popleft().result())
+            while pending:
+                write(pending.popleft().result())
+    else:
+        for start, stop in chunks(count, 1):
+            write(generate_chunk(seed, start, stop, format, physical_form, score, collect))
+    if collect:
+        collector.save()
+
+
+
+################### SHARED MEMORY RECORDS ###################
+#For the record formats the workers encode each character straight into a
+#shared memory buffer and hand back only (slot, count), so nothing but the
+#task arguments is pickled. The buffer is split into two slots per job of
+#max_chunk_size records; a slot is reused once its records are written out.
+
+#open the parent's shared buffer once when a worker starts
+def attach_buffer(name):
+    global worker_buffer
+    worker_buffer = shared_memory.SharedMemory(name=name)
+
+
+
+#encode the characters numbered start to stop into slot of the shared
+#buffer; returns the slot, the number of records, the chunk's Stats if
+#collect is set and its table hit counts if count_hits is set
+def generate_into_buffer(slot, seed, start, stop, physical_form=None, collect=False,
+                         count_hits=False):
+    offset = slot * max_chunk_size * codec.record_size
+    start_counting(count_hits)
+    characters = stream.iter_characters(seed, count=stop - start, start=start,
+                                        physical_form=physical_form)
+    chunk_stats = Stats() if collect else None
+    if collect:
+        characters = chunk_stats.tally(characters)
+    for character in characters:
+        worker_buffer.buf[offset:offset + codec.record_size] = codec.encode(character)
+        offset += codec.record_size
+    return slot, stop - start, chunk_stats, tablehits.take() if count_hits else None
+
+
+
+#generate count characters with jobs workers and call write with
+#(records, Stats or None, table hits or None) for each chunk in order; the
+#records are a memoryview valid only during the call
+def generate_records(count, write, seed=0, jobs=1, physical_form=None, collect=False,
+                     count_hits=False):
+    slot_size = max_chunk_size * codec.record_size
+    buffer = shared_memory.SharedMemory(create=True, size=jobs * 2 * slot_size)
+    try:
+        with ProcessPoolExecutor(max_workers=jobs, mp_context=worker_context,
+                                 initializer=attach_buffer, initargs=(buffer.name,)) as executor:
+            free = list(range(jobs * 2))
+            pending = deque()
+
+            def write_next():
+                slot, written, chunk_stats, chunk_hits = pending.popleft().result()
+                with buffer.buf[slot * slot_size:slot * slot_size + written * codec.record_size] as records:
+                    write((records, chunk_stats, chunk_hits))
+                free.append(slot)
+
+            for start, stop in chunks(count, jobs):
+                if not free:
+                    write_next()
+                pending.append(executor.submit(generate_into_buffer, free.pop(), seed,
+                                               start, stop, physical_form, collect, count_hits))
+            while pending:
+                write_next()
+    finally:
+        buffer.close()
+        buffer.unlink()
+
+
+
+#takes codec.py records like a binary file and appends them to a column store
+class ColumnStoreWriter:
+    def __init__(self, path):
+        self.store = columnar.ColumnStore(path)
+
+
+
+    def write(self, records):
+        self.store.append_decoded(codec.decode_array(np.frombuffer(records, dtype=np.uint8)))
+
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate Marvel Super Heroes characters without the GUI.")
+    parser.add_argument("--count", type=int, default=1,
+                        help="number of characters to generate (default 1)")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="seed for a repeatable roster (default random)")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="number of worker processes (default 1)")
+    parser.add_argument("--format", choices=formats, default="text",
+                        help="character sheets as text, JSON lines, CSV rows, binary records "
+                             "(codec.py), a column store directory (columnar.py) or library seed entries")
+    parser.add_argument("--form", choices=engine.physical_form_names, default=None,
+                        metavar="PHYSICAL_FORM",
+                        help="generate only this physical form (default random)")
+    parser.add_argument("--rarity", action="store_true",
+                        help="add each character's rarity in bits (see rarity.py)")
+    parser.add_argument("--stats", default=None, metavar="FILE",
+                        help="write running statistics of the characters to a JSON file")
+    parser.add_argument("--table-hits", default=None, metavar="FILE",
+                        help="count the roll table rows hit and write them to a JSON file")
+    parser.add_argument("-o", "--output", default=None,
+                        help="file to write to (default stdout); the directory for --format columnar")
+    args = parser.parse_args(argv)
+    if args.count < 0:
+        parser.error("--count must be 0 or more")
+    if args.jobs < 1:
+        parser.error("--jobs must be 1 or more")
+    if args.rarity and args.format in ["library"] + record_formats:
+        parser.error(f"--rarity can not be used with --format {args.format}")
+    if args.stats and args.format == "library":
+        parser.error("--stats can not be used with --format library")
+    if args.table_hits and args.format == "library":
+        parser.error("--table-hits can not be used with --format library")
+    if args.format == "columnar" and not args.output:
+        parser.error("--format columnar needs an -o/--output directory")
+    if args.seed is None:
+        args.seed = random.randrange(2**32)
+    return args
+
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.table_hits:
+        tablehits.enable()
+    collector = StatsCollector(args.stats) if args.stats else None
+    options = (args.seed, args.jobs, args.format, args.form, args.rarity, collector)
+    if args.format == "columnar":
+        generate(args.count, ColumnStoreWriter(args.output), *options)
+    elif args.format == "binary":
+        if args.output:
+            with open(args.output, "wb") as file:
+                file.write(codec.header())
+                generate(args.count, file, *options)
+        else:
+            sys.stdout.buffer.write(codec.header())
+            generate(args.count, sys.stdout.buffer, *options)
+    elif args.output:
+        with open(args.output, "w", newline="" if args.format == "csv" else None) as file:
+            generate(args.count, file, *options)
+    else:
+        generate(args.count, sys.stdout, *options)
+    if args.table_hits:
+        tablehits.dump(args.table_hits)
+    return 0
+
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,287 @@
+import struct
+
+import numpy as np
+
+import engine
+import tables
+import powerindex
+import powergraph
+import library
+
+
+################### BINARY CHARACTER ENCODING ###################
+#Packs the generated parts of a character into a fixed-size record of bit
+#fields: ranks in 5 bits, power IDs in 9 bits, and the physical form, origin,
+#talents, contacts and weakness as small vocabulary indices. Every record has
+#the same layout, so a file of records can be decoded a whole block at a time
+#with NumPy. The text the physical form adds (bonuses, penalties, notes) and
+#the details the user types in are not encoded; keep the seed (see
+#library.py) to get those back.
+#
+#A file is a header followed by the records:
+#   magic "MSHC", version, record size, max powers/talents/contacts/compound
+#   forms, and the hash of the rules the vocabularies were built from
+
+version = 1
+magic = b"MSHC"
+header_format = "<4sBHBBBB8s"
+header_size = struct.calcsize(header_format)
+
+max_compound_forms = 5
+max_powers = 24
+max_talents = 8
+max_contacts = 7
+
+################### VOCABULARIES ###################
+origins = list(tables.origin_table.outcomes)
+#(power class, power name); bonus and optional powers that are not in any
+#power list have the class "", and winged forms get Winged Flight
+powers = (list(powerindex.powers) +
+          sorted(("", name) for name in powergraph.forward if name not in powerindex.powers_by_name) +
+          [("Travel", "Winged Flight")])
+power_ids = {power: id for id, power in enumerate(powers)}
+#(variant, note) of a power
+power_details = ([("", "")] +
+                 [("", f"emitted from {epoint}") for epoint in
+                  list(tables.energy_emission_table.outcomes) + ["Horns"]] +
+                 [("", f"growth type: {growth}") for growth in tables.growth_table.outcomes] +
+                 [("", f"shrink type: {shrink}") for shrink in tables.shrink_table.outcomes] +
+                 [(option, "") for option in engine.biophysical_options])
+power_detail_ids = {detail: id for id, detail in enumerate(power_details)}
+power_prefixes = ["", "Antennae: "]
+talents = sorted({talent for table in tables.talent_tables.values()
+                  for outcome in table.outcomes for talent in outcome})
+talent_ids = {talent: id for id, talent in enumerate(talents)}
+#the contact lists plus the contacts a physical form gives
+contacts = [contact for contact_list in engine.contact_classes.values() for contact in contact_list]
+for notes in (engine.notes1, engine.notes2, engine.notes3):
+    for note in notes.values():
+        contact = note.get("effects", {}).get("contact")
+        if contact and contact not in contacts:
+            contacts.append(contact)
+contact_ids = {contact: id for id, contact in enumerate(contacts)}
+weakness_stimuli = list(tables.weakness_stimulus_table.outcomes)
+weakness_effects = list(tables.weakness_effect_table.outcomes)
+weakness_durations = list(tables.weakness_duration_table.outcomes)
+
+
+
+#number of bits needed to store count different values
+def bits_for(count):
+    return max(1, (count - 1).bit_length())
+
+
+
+################### LAYOUT ###################
+#(field, bits) in the order they are packed, lowest bit first
+layout = [("physical_form", bits_for(len(engine.physical_form_names))),
+          ("form_option", 3),
+          ("origin", bits_for(len(origins))),
+          ("compound_count", bits_for(max_compound_forms + 1))]
+for i in range(max_compound_forms):
+    layout += [(f"compound{i}_form", bits_for(len(engine.physical_form_names))),
+               (f"compound{i}_option", 3)]
+layout += [("std_rank_scores", 1)]
+layout += [(f"{ability}_rank", 5) for ability in engine.primary_abilities + engine.secondary_abilities]
+layout += [("health", 16), ("karma", 16), ("has_weakness", 1),
+           ("weakness_stimulus", bits_for(len(weakness_stimuli))),
+           ("weakness_effect", bits_for(len(weakness_effects))),
+           ("weakness_duration", bits_for(len(weakness_durations))),
+           ("power_count", bits_for(max_powers + 1))]
+for i in range(max_powers):
+    layout += [(f"power{i}_id", 9), (f"power{i}_rank", 5),
+               (f"power{i}_detail", bits_for(len(power_details))),
+               (f"power{i}_prefix", 1), (f"power{i}_locked", 1)]
+layout += [("talent_count", bits_for(max_talents + 1))]
+layout += [(f"talent{i}", bits_for(len(talents))) for i in range(max_talents)]
+layout += [("contact_count", bits_for(max_contacts + 1))]
+layout += [(f"contact{i}", bits_for(len(contacts))) for i in range(max_contacts)]
+
+#field: (bit offset, bits)
+fields = {}
+offset = 0
+for field, bits in layout:
+    fields[field] = (offset, bits)
+    offset += bits
+record_bits = offset
+record_size = (record_bits + 7) // 8
+
+if len(powers) > 2**9:
+    raise ValueError(f"{len(powers)} powers do not fit in a 9 bit power ID")
+if max(bits for field, bits in layout) > 17:
+    raise ValueError("Fields over 17 bits can not be decoded from three bytes")
+
+
+
+def header():
+    return struct.pack(header_format, magic, version, record_size, max_powers,
+                       max_talents, max_contacts, max_compound_forms,
+                       bytes.fromhex(library.rules_hash))
+
+
+
+#check a file header matches this version and rules; returns the header size
+def check_header(data):
+    file_magic, file_version, size, *_, rules = struct.unpack_from(header_format, data)
+    if file_magic != magic:
+        raise ValueError("Not a character record file")
+    if file_version != version or size != record_size:
+        raise ValueError(f"Character record file version {file_version} is not supported")
+    if rules.hex() != library.rules_hash:
+        raise ValueError("Character records were encoded with different power lists or tables")
+    return header_size
+
+
+
+#index of the option text in the physical form's option list, + 1 (0 for none)
+def option_code(form_index, option_text):
+    if not option_text:
+        return 0
+    return engine.form_options[form_index].index(option_text) + 1
+
+
+
+#the field values of a character
+def character_fields(character):
+    if len(character.powers) > max_powers:
+        raise ValueError(f"A character can have at most {max_powers} powers to be encoded")
+    if len(character.talents) > max_talents or len(character.contacts) > max_contacts:
+        raise ValueError("Too many talents or contacts to encode")
+    values = {"physical_form": character.form_index,
+              "form_option": character.form_option + 1,
+              "origin": origins.index(character.origin),
+              "compound_count": character.compound_forms,
+              "std_rank_scores": character.std_rank_scores,
+              "health": character.health, "karma": character.karma}
+    for i in range(character.compound_forms):
+        form = character.compound_form_list[i]
+        form_index = engine.physical_form_names.index(form)
+        values[f"compound{i}_form"] = form_index
+        values[f"compound{i}_option"] = option_code(form_index, character.compound_form_options_list[i])
+    for ability in engine.primary_abilities + engine.secondary_abilities:
+        values[f"{ability}_rank"] = character.ability_rank(ability)
+    if character.weakness:
+        values["has_weakness"] = 1
+        stimulus, rest = character.weakness.split(" causes ")
+        effect, duration = rest.split(" that is ")
+        values["weakness_stimulus"] = weakness_stimuli.index(stimulus)
+        values["weakness_effect"] = weakness_effects.index(effect)
+        values["weakness_duration"] = weakness_durations.index(duration)
+    values["power_count"] = len(character.powers)
+    for i, power in enumerate(character.powers):
+        values[f"power{i}_id"] = power_ids[(power["class"], power["name"])]
+        values[f"power{i}_rank"] = power["rank"]
+        values[f"power{i}_detail"] = power_detail_ids[(power["variant"], power["note"])]
+        values[f"power{i}_prefix"] = power_prefixes.index(power["prefix"])
+        values[f"power{i}_locked"] = int(power["locked"])
+    values["talent_count"] = len(character.talents)
+    for i, talent in enumerate(character.talents):
+        values[f"talent{i}"] = talent_ids[talent["name"]]
+    values["contact_count"] = len(character.contacts)
+    for i, contact in enumerate(character.contacts):
+        values[f"contact{i}"] = contact_ids[contact["name"]]
+    return values
+
+
+
+def encode(character):
+    packed = 0
+    for field, value in character_fields(character).items():
+        offset, bits = fields[field]
+        if not 0 <= value < 1 << bits:
+            raise ValueError(f"{field} value {value} does not fit in {bits} bits")
+        packed |= value << offset
+    return packed.to_bytes(record_size, "little")
+
+
+
+def encode_many(characters):
+    return b"".join(encode(character) for character in characters)
+
+
+
+#write the header and the records of the characters to an open binary file
+def write(file, characters):
+    file.write(header())
+    for character in characters:
+        file.write(encode(character))
+
+
+
+################### DECODING ###################
+#field values of an (N, record_size) uint8 array of records as a dict of
+#(N,) arrays; no field is over 17 bits, so each one is read from the three
+#bytes it starts in
+def decode_array(records):
+    records = np.asarray(records, dtype=np.uint8).reshape(-1, record_size)
+    #one contiguous row per byte of the record, with two bytes of padding
+    columns = np.zeros((record_size + 2, len(records)), dtype=np.uint32)
+    columns[:record_size] = records.T
+    values = {}
+    for field, (offset, count) in fields.items():
+        byte, shift = divmod(offset, 8)
+        window = columns[byte] | (columns[byte + 1] << 8) | (columns[byte + 2] << 16)
+        values[field] = (window >> shift) & ((1 << count) - 1)
+    return values
+
+
+
+#the records in a file as a read-only (N, record_size) memmap
+def open_records(file_path):
+    with open(file_path, "rb") as file:
+        start = check_header(file.read(header_size))
+    data = np.memmap(file_path, dtype=np.uint8, mode="r", offset=start)
+    return data.reshape(-1, record_size)
+
+
+
+#decode the records of a file a block at a time; yields dicts of arrays
+def read_blocks(file_path, block_size=65536):
+    records = open_records(file_path)
+    for start in range(0, len(records), block_size):
+        yield decode_array(records[start:start + block_size])
+
+
+
+#the character described by the field values of one record
+def record_to_dict(values):
+    def value(field):
+        return int(values[field])
+
+    form_index = value("physical_form")
+    record = {"physical_form": engine.physical_form_names[form_index],
+              "form_option": value("form_option") - 1,
+              "compound_forms": [],
+              "origin": origins[value("origin")],
+              "std_rank_scores": value("std_rank_scores"),
+              "abilities": {},
+              "health": value("health"), "karma": value("karma"),
+              "weakness": "", "powers": [], "talents": [], "contacts": []}
+    for i in range(value("compound_count")):
+        compound_index = value(f"compound{i}_form")
+        option = value(f"compound{i}_option")
+        option_text = engine.form_options[compound_index][option - 1] if option else ""
+        record["compound_forms"].append((engine.physical_form_names[compound_index], option_text))
+    for ability in engine.primary_abilities + engine.secondary_abilities:
+        record["abilities"][ability] = value(f"{ability}_rank")
+    if value("has_weakness"):
+        record["weakness"] = (f"{weakness_stimuli[value('weakness_stimulus')]} causes "
+                              f"{weakness_effects[value('weakness_effect')]} that is "
+                              f"{weakness_durations[value('weakness_duration')]}")
+    for i in range(value("power_count")):
+        power_class, name = powers[value(f"power{i}_id")]
+        variant, note = power_details[value(f"power{i}_detail")]
+        record["powers"].append({"name": name, "class": power_class,
+                                 "rank": value(f"power{i}_rank"),
+                                 "prefix": power_prefixes[value(f"power{i}_prefix")],
+                                 "variant": variant, "note": note,
+                                 "locked": bool(value(f"power{i}_locked"))})
+    record["talents"] = [talents[value(f"talent{i}")] for i in range(value("talent_count"))]
+    record["contacts"] = [contacts[value(f"contact{i}")] for i in range(value("contact_count"))]
+    return record
+
+
+
+def decode(data):
+    values = decode_array(np.frombuffer(data, dtype=np.uint8))
+    return record_to_dict({field: column[0] for field, column in values.items()})
@@ -0,0 +1,223 @@
+import os
+import json
+
+import numpy as np
+
+import engine
+import codec
+import library
+
+
+################### COLUMNAR STORE ###################
+#A directory of column files for a generated population, one NumPy array per
+#column, read back as memory maps so a query only reads the columns (and
+#pages) it uses. Rows are only ever appended. Powers, talents and contacts
+#are ragged: their values are stored end to end with an end offset per row.
+#Vocabulary indices are the ones used by codec.py.
+#
+#meta.json holds the number of rows and values; bytes past those counts
+#(from an append that did not finish) are ignored and overwritten.
+
+version = 1
+
+abilities = engine.primary_abilities + engine.secondary_abilities
+
+#column: (dtype, shape of one row)
+columns = {"physical_form": ("u1", ()),
+           "form_option": ("i1", ()),
+           "origin": ("u1", ()),
+           "std_rank_scores": ("u1", ()),
+           "ranks": ("u1", (len(abilities),)),
+           "health": ("<i4", ()),
+           "karma": ("<i4", ()),
+           "power_count": ("u1", ()),
+           "talent_count": ("u1", ()),
+           "contact_count": ("u1", ())}
+
+#ragged column: (dtype, count column the rows are split by)
+ragged_columns = {"power_ids": ("<u2", "power_count"),
+                  "power_ranks": ("u1", "power_count"),
+                  "talent_ids": ("u1", "talent_count"),
+                  "contact_ids": ("u1", "contact_count")}
+
+#count column: file of the end offset of each row's values
+offset_columns = {"power_count": "power_ends",
+                  "talent_count": "talent_ends",
+                  "contact_count": "contact_ends"}
+
+
+
+#create=False opens an existing store only, for reading it
+class ColumnStore:
+    def __init__(self, path, create=True):
+        self.path = path
+        meta_path = os.path.join(path, "meta.json")
+        if not create and not os.path.exists(meta_path):
+            raise FileNotFoundError(f"{path} is not a column store (no meta.json)")
+        if os.path.exists(meta_path):
+            with open(meta_path) as file:
+                self.meta = json.load(file)
+            if self.meta["version"] != version:
+                raise ValueError(f"Column store version {self.meta['version']} is not supported")
+            if self.meta["rules"] != library.rules_hash:
+                raise ValueError("Column store was written with different power lists or tables")
+        else:
+            os.makedirs(path, exist_ok=True)
+            self.meta = {"version": version, "rules": library.rules_hash, "rows": 0,
+                         "values": {column: 0 for column in ragged_columns},
+                         #vocabularies the indices refer to
+                         "abilities": abilities, "ranks": engine.ranks,
+                         "physical_forms": engine.physical_form_names,
+                         "origins": codec.origins, "powers": codec.powers,
+                         "talents": codec.talents, "contacts": codec.contacts}
+            self.write_meta()
+
+
+
+    def __len__(self):
+        return self.meta["rows"]
+
+
+
+    def write_meta(self):
+        meta_path = os.path.join(self.path, "meta.json")
+        with open(meta_path + ".tmp", "w") as file:
+            json.dump(self.meta, file)
+        os.replace(meta_path + ".tmp", meta_path)
+
+
+
+    def file_path(self, column):
+        return os.path.join(self.path, f"{column}.bin")
+
+
+
+    #write array after the first size rows of the column's file
+    def append_to_file(self, column, array, size):
+        dtype = np.dtype(array.dtype)
+        row_size = dtype.itemsize * int(np.prod(array.shape[1:], dtype=np.int64))
+        mode = "r+b" if os.path.exists(self.file_path(column)) else "wb"
+        with open(self.file_path(column), mode) as file:
+            file.truncate(size * row_size)
+            file.seek(size * row_size)
+            array.tofile(file)
+
+
+
+    #append generated characters as new rows
+    def append(self, characters):
+        if not characters:
+            return
+        data = {column: [] for column in columns}
+        ragged = {column: [] for column in ragged_columns}
+        for character in characters:
+            data["physical_form"].append(character.form_index)
+            data["form_option"].append(character.form_option)
+            data["origin"].append(codec.origins.index(character.origin))
+            data["std_rank_scores"].append(character.std_rank_scores)
+            data["ranks"].append([character.ability_rank(ability) for ability in abilities])
+            data["health"].append(character.health)
+            data["karma"].append(character.karma)
+            data["power_count"].append(len(character.powers))
+            data["talent_count"].append(len(character.talents))
+            data["contact_count"].append(len(character.contacts))
+            for power in character.powers:
+                ragged["power_ids"].append(codec.power_ids[(power["class"], power["name"])])
+                ragged["power_ranks"].append(power["rank"])
+            ragged["talent_ids"].extend(codec.talent_ids[talent["name"]] for talent in character.talents)
+            ragged["contact_ids"].extend(codec.contact_ids[contact["name"]] for contact in character.contacts)
+
+        self.append_columns({column: np.array(values, dtype=columns[column][0])
+                             for column, values in data.items()},
+                            {column: np.array(values, dtype=ragged_columns[column][0])
+                             for column, values in ragged.items()})
+
+
+
+    #append rows from codec.decode_array field values, e.g. the records
+    #worker processes made
+    def append_decoded(self, values):
+        data = {"physical_form": values["physical_form"],
+                "form_option": values["form_option"].astype(np.int64) - 1,
+                "origin": values["origin"],
+                "std_rank_scores": values["std_rank_scores"],
+                "ranks": np.stack([values[f"{ability}_rank"] for ability in abilities], axis=1),
+                "health": values["health"], "karma": values["karma"],
+                "power_count": values["power_count"],
+                "talent_count": values["talent_count"],
+                "contact_count": values["contact_count"]}
+        #the first count fields of each row, row after row
+        def ragged_values(fields, count):
+            stacked = np.stack([values[field] for field in fields], axis=1)
+            return stacked[np.arange(len(fields)) < count[:, None]]
+        powers = range(codec.max_powers)
+        ragged = {"power_ids": ragged_values([f"power{i}_id" for i in powers], data["power_count"]),
+                  "power_ranks": ragged_values([f"power{i}_rank" for i in powers], data["power_count"]),
+                  "talent_ids": ragged_values([f"talent{i}" for i in range(codec.max_talents)],
+                                              data["talent_count"]),
+                  "contact_ids": ragged_values([f"contact{i}" for i in range(codec.max_contacts)],
+                                               data["contact_count"])}
+        self.append_columns({column: np.asarray(array).astype(columns[column][0])
+                             for column, array in data.items()},
+                            {column: np.asarray(array).astype(ragged_columns[column][0])
+                             for column, array in ragged.items()})
+
+
+
+    #append arrays of new rows: data has a (rows,) or (rows, 9) array for each
+    #column and ragged the values of each ragged column
+    def append_columns(self, data, ragged):
+        rows = self.meta["rows"]
+        added = len(data["physical_form"])
+        if not added:
+            return
+        for column, array in data.items():
+            self.append_to_file(column, array, rows)
+        for count_column, ends_column in offset_columns.items():
+            start = self.ends(count_column)[-1] if rows else 0
+            ends = start + np.cumsum(data[count_column], dtype="<i8")
+            self.append_to_file(ends_column, ends, rows)
+        for column, array in ragged.items():
+            self.append_to_file(column, array, self.meta["values"][column])
+            self.meta["values"][column] += len(array)
+        self.meta["rows"] = rows + added
+        self.write_meta()
+
+
+
+    #read-only memmap of a column, (rows,) or (rows, 9) for ranks
+    def column(self, name):
+        if name in ragged_columns:
+            return self.memmap(name, ragged_columns[name][0], (self.meta["values"][name],))
+        if name in offset_columns.values():
+            return self.memmap(name, "<i8", (len(self),))
+        dtype, shape = columns[name]
+        return self.memmap(name, dtype, (len(self),) + shape)
+
+
+
+    def memmap(self, name, dtype, shape):
+        if shape[0] == 0:
+            return np.zeros(shape, dtype=dtype)
+        return np.memmap(self.file_path(name), dtype=dtype, mode="r", shape=shape)
+
+
+
+    def ends(self, count_column):
+        return self.column(offset_columns[count_column])
+
+
+
+    #(values, starts, ends) of a ragged column; row i's values are
+    #values[starts[i]:ends[i]]
+    def ragged(self, name):
+        ends = self.ends(ragged_columns[name][1])
+        starts = np.zeros(len(ends), dtype="<i8")
+        starts[1:] = ends[:-1]
+        return self.column(name), starts, ends
+
+
+
+    #a column by ability name, e.g. rank("strength")
+    def rank(self, ability):
+        return self.column("ranks")[:, abilities.index(ability)]
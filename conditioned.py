@@ -0,0 +1,415 @@
+from itertools import product
+
+import engine
+import tables
+import powerindex
+import probability
+from rng import RNG
+
+
+################### CONDITIONED GENERATION ###################
+#Generate characters that meet constraints by drawing every roll the
+#constraints touch from its conditional distribution, instead of rerolling
+#whole characters until one fits:
+#   physical_forms: the forms allowed, e.g. the four Cyborgs
+#   min_ranks: {ability: lowest rank} the abilities must reach once the
+#              form's ability bonuses are spent
+#   power_classes: power classes the character must end up with a power in
+#              (an automatic, rolled or bonus power)
+#A character comes out with exactly the chance generate_character would
+#give it among the characters that meet the constraints. The draws that
+#make this so, in the order they are made:
+#   the physical form and option, with their table chance times the chance
+#   the form meets the constraints;
+#   how many of the form's ability bonuses go to each ability with a
+#   minimum, given the d100 rolls can still reach the minimums;
+#   each d100 roll of an ability with a minimum, from the rolls that reach
+#   the minimum less the bonuses it gets;
+#   the row of the power slot table, with the chance the powers rolled for
+#   its class rolls give the required classes;
+#   the power class rolls and the power (and bonus power) of each class,
+#   one class at a time in the order complete_character adds them, given
+#   the classes and slots still to come can give the classes still needed;
+#   this includes powers that do not fit and a Magical Power Simulation
+#   replacing its class, exactly as complete_character meets them.
+#Every other roll is made as generate_character makes it. Every draw is a
+#single alias table or weighted pick, so a rare constraint costs the same
+#as a common one. Compound and Changeling forms are only generated when
+#there are no ability or power class constraints, as their shifts depend
+#on the forms rolled for them.
+
+class ConstraintError(ValueError):
+    pass
+
+
+
+#(physical forms, min ranks, power classes): Constraints
+cache = {}
+power_class_chances = {power_class: count / tables.power_class_table.sides
+                       for power_class, count in tables.power_class_table.outcome_counts().items()}
+#power class: [(power, [bonus power], slots used, power classes it gives, chance)]
+class_powers = {}
+
+
+
+#(min, max) power slots of each slot table row for a power bonus and the
+#row's count, as Character.roll_number_powers applies the bonus
+def power_slots(power_bonus):
+    counts = []
+    for (low, high), count in tables.number_tables["powers"].outcome_counts().items():
+        if low == 1 and power_bonus == -1:
+            counts.append(((low, high), count))
+        else:
+            counts.append(((low + power_bonus, high + power_bonus), count))
+    return counts
+
+
+
+#the powers complete_character can roll for a class with the bonus power it
+#picks and their chance; a Power Simulation gives no power class, as it
+#replaces its class with another
+def powers_of(power_class):
+    if power_class not in class_powers:
+        table = tables.power_tables[power_class]
+        result = []
+        for power, count in table.outcome_counts().items():
+            cost = powerindex.power_cost(power_class, power)
+            given = frozenset() if power == "Power Simulation" else frozenset([power_class])
+            bonus_powers = powerindex.bonus_optional_powers(power_class, power)[0]
+            chance = count / table.sides
+            if bonus_powers:
+                for bonus_power in bonus_powers:
+                    bonus_class = powerindex.power_class_of(bonus_power)
+                    result.append((power, [bonus_power], cost + engine.slot_cost(bonus_power),
+                                   given | {bonus_class}, chance / len(bonus_powers)))
+            else:
+                result.append((power, [], cost, given, chance))
+        class_powers[power_class] = result
+    return class_powers[power_class]
+
+
+
+#(number of bonuses spent on each of the abilities, chance) for every way
+#complete_character can spend count ability bonuses, each on a primary
+#ability picked at random
+def ability_spends(count, abilities):
+    spends = {}
+    for picks in product(engine.primary_abilities, repeat=count):
+        spent = tuple(picks.count(ability) for ability in abilities)
+        spends[spent] = spends.get(spent, 0) + 1
+    total = len(engine.primary_abilities) ** count
+    return [(spent, ways / total) for spent, ways in spends.items()]
+
+
+
+#a Character of the physical form (and option) with the form's automatic
+#powers added, as far as Character.roll_power_classes goes before the slots
+def form_character(physical_form, option):
+    character = engine.Character(RNG(0))
+    character.select_physical_form(engine.physical_form_names.index(physical_form))
+    if character.form_options:
+        character.select_form_option(option or 0)
+    character.roll_automatic_powers()
+    return character
+
+
+
+class Constraints:
+    def __init__(self, physical_forms=None, min_ranks=None, power_classes=None):
+        self.min_ranks = {}
+        for ability, rank in (min_ranks or {}).items():
+            if ability not in probability.abilities:
+                raise ConstraintError(f"Unknown ability: {ability}")
+            self.min_ranks[ability] = engine.ranks.index(rank) if isinstance(rank, str) else rank
+        #the primary abilities with a minimum, which ability bonuses can raise
+        self.bonus_abilities = tuple(ability for ability in engine.primary_abilities
+                                     if ability in self.min_ranks)
+        self.power_classes = tuple(dict.fromkeys(power_classes or ()))
+        for power_class in self.power_classes:
+            if power_class not in power_class_chances:
+                raise ConstraintError(f"Unknown power class: {power_class}")
+        self.required = frozenset(self.power_classes)
+        #(ability table, bonus, pf rank, min rank): rolls that reach the minimum
+        self.rolls = {}
+        #(form classes, rolled classes, slots, classes had): power_chance
+        self.power_chances = {}
+        forms = physical_forms or engine.physical_form_names
+        for form in forms:
+            if form not in engine.physical_form_names:
+                raise ConstraintError(f"Unknown physical form: {form}")
+
+        #(physical form index, option index or None) and its weight
+        self.choices = []
+        weights = []
+        counts = tables.physical_form_table.outcome_counts()
+        for form in forms:
+            index = engine.physical_form_names.index(form)
+            if not counts.get(index):
+                continue
+            if form in probability.unsupported_forms:
+                if not self.min_ranks and not self.power_classes:
+                    self.choices.append((index, None))
+                    weights.append(counts[index])
+                continue
+            options = list(range(len(engine.form_options[index]))) if index in engine.form_options else [None]
+            for option in options:
+                weight = counts[index] / len(options) * self.chance(form_character(form, option))
+                if weight > 0:
+                    self.choices.append((index, option))
+                    weights.append(weight)
+        if not weights:
+            raise ConstraintError("No physical form can meet the constraints")
+        self.table = tables.AliasTable(weights)
+
+
+
+    #chance that a character of a form (see form_character) meets the
+    #constraints
+    def chance(self, character):
+        result = 1.0
+        if self.min_ranks:
+            result *= sum(weight for spent, weight in self.bonus_spends(character))
+        if self.power_classes:
+            result *= sum(count / tables.number_tables["powers"].sides * weight
+                          for count, weight in self.slot_weights(character))
+        return result
+
+
+
+    def ability_rolls(self, table, bonus, pf_rank, rank):
+        key = (table, bonus, pf_rank, rank)
+        if key not in self.rolls:
+            ability_table = tables.ability_tables[table]
+            self.rolls[key] = [roll for roll in range(1, ability_table.sides + 1)
+                               if (pf_rank if pf_rank > -1 else max(ability_table[roll] + bonus, 1)) >= rank]
+        return self.rolls[key]
+
+
+
+    #the d100 rolls of a character's ability that reach rank
+    def reaching_rolls(self, character, ability, rank):
+        pf_rank = -1
+        if ability == "resources":
+            pf_rank = character.pf_resources_rank
+        elif ability == "popularity":
+            pf_rank = character.pf_popularity_rank
+        return self.ability_rolls(character.ability_table(), getattr(character, f"{ability}_bonus"),
+                                  pf_rank, rank)
+
+
+
+    #(bonuses spent on each of bonus_abilities, weight) of a character's
+    #ability bonus spends; the weight is the chance of the spend times the
+    #chance the ability rolls reach the minimums with it
+    def bonus_spends(self, character):
+        sides = tables.ability_tables[character.ability_table()].sides
+        result = []
+        for spent, chance in ability_spends(character.ability_bonus, self.bonus_abilities):
+            bonuses = dict(zip(self.bonus_abilities, spent))
+            for ability, rank in self.min_ranks.items():
+                chance *= len(self.reaching_rolls(character, ability, rank - bonuses.get(ability, 0))) / sides
+            result.append((spent, chance))
+        return result
+
+
+
+    #(row count, chance the row's power class rolls give the required
+    #classes) of each power slot table row for a character whose automatic
+    #powers have been added
+    def slot_weights(self, character):
+        had = frozenset(power["class"] for power in character.powers) & self.required
+        return [(count, self.power_chance(tuple(character.power_classes), max(low, 0),
+                                          high - len(character.powers), had))
+                for (low, high), count in power_slots(character.power_bonus)]
+
+
+
+    #(power, [bonus power], slots, classes had, replaced, chance) of each
+    #power that can be rolled for a class with slots left: a power that does
+    #not fit drops the class; a Power Simulation that fits replaces it
+    def outcomes(self, power_class, slots, had):
+        for power, bonus, cost, given, chance in powers_of(power_class):
+            if cost > slots:
+                yield power, bonus, slots, had, False, chance
+            elif power == "Power Simulation":
+                yield power, bonus, slots, had, True, chance
+            else:
+                yield power, bonus, slots - cost, had | (given & self.required), False, chance
+
+
+
+    #chance that the power classes still to come give a power in each
+    #required class: form_classes are the classes the form put at the top
+    #of the list, rolled the number of random classes after them (rolled
+    #ones and ones that replace a Power Simulation), slots the power slots
+    #left and had the required classes the character already has a power in
+    def power_chance(self, form_classes, rolled, slots, had):
+        if had == self.required:
+            return 1.0
+        if not form_classes and not rolled:
+            return 0.0
+        key = (form_classes, rolled, slots, had)
+        if key not in self.power_chances:
+            if form_classes:
+                result = sum(chance * self.power_chance(form_classes[1:], rolled + replaced, left, have)
+                             for power, bonus, left, have, replaced, chance
+                             in self.outcomes(form_classes[0], slots, had))
+            else:
+                #a Power Simulation leaves the same classes to come, so the
+                #chance of this state is the rest over the chance of leaving it
+                result = 0.0
+                same = 0.0
+                for power_class, class_chance in power_class_chances.items():
+                    for power, bonus, left, have, replaced, chance in self.outcomes(power_class, slots, had):
+                        if replaced:
+                            same += class_chance * chance
+                        else:
+                            result += class_chance * chance * self.power_chance((), rolled - 1, left, have)
+                result /= 1 - same
+            self.power_chances[key] = result
+        return self.power_chances[key]
+
+
+
+def constraints(physical_forms=None, min_ranks=None, power_classes=None):
+    key = (tuple(physical_forms or ()), tuple(sorted((min_ranks or {}).items())),
+           tuple(power_classes or ()))
+    if key not in cache:
+        cache[key] = Constraints(physical_forms, min_ranks, power_classes)
+    return cache[key]
+
+
+
+#a Character whose constrained rolls are drawn from their conditional
+#distributions
+class ConditionedCharacter(engine.Character):
+    def __init__(self, constraints, rng=None):
+        self.constraints = constraints
+        #ability: bonuses still to be spent on it
+        self.bonus_spends = {}
+        #the power classes and powers drawn for complete_character to roll,
+        #in the order it rolls them
+        self.rolled_classes = []
+        self.simulated_classes = []
+        self.class_powers = []
+        super().__init__(rng)
+
+
+
+    def roll_abilities(self):
+        if self.constraints.min_ranks:
+            spends = self.constraints.bonus_spends(self)
+            spent, weight = spends[self.weighted_index([weight for spent, weight in spends])]
+            self.bonus_spends = dict(zip(self.constraints.bonus_abilities, spent))
+        super().roll_abilities()
+
+
+
+    def ability_d100(self, ability, table):
+        rank = self.constraints.min_ranks.get(ability)
+        if rank is None:
+            return super().ability_d100(ability, table)
+        rolls = self.constraints.reaching_rolls(self, ability, rank - self.bonus_spends.get(ability, 0))
+        return rolls[self.rng.index(len(rolls))]
+
+
+
+    #a bonus goes to an ability with a minimum as often as drawn for it; the
+    #rest go to the other primary abilities at random
+    def choose_bonus_ability(self):
+        if not self.constraints.min_ranks:
+            return super().choose_bonus_ability()
+        others = [ability for ability in engine.primary_abilities if ability not in self.bonus_spends]
+        left = self.ability_bonus - sum(self.bonus_spends.values())
+        abilities = list(self.bonus_spends) + [None]
+        index = self.weighted_index(list(self.bonus_spends.values()) + [left])
+        ability = abilities[index]
+        if ability is None:
+            return others[self.rng.index(len(others))]
+        self.bonus_spends[ability] -= 1
+        return ability
+
+
+
+    def roll_slots(self, type):
+        if type != "powers" or not self.constraints.power_classes:
+            return super().roll_slots(type)
+        #each slot table row weighted by the chance its class rolls give the
+        #required classes
+        rows = list(tables.number_tables["powers"].outcome_counts().items())
+        weights = [count * weight for count, weight in self.constraints.slot_weights(self)]
+        low, high = rows[self.weighted_index(weights)][0]
+        return {"min": low, "max": high}
+
+
+
+    #draw the power classes and their powers one at a time in the order
+    #complete_character adds them, each given the classes and slots still to
+    #come can give the required classes still needed
+    def roll_minimum_power_classes(self, count):
+        constraints = self.constraints
+        if not constraints.power_classes:
+            return super().roll_minimum_power_classes(count)
+        form_classes = tuple(self.power_classes)
+        rolled = max(count, 0)
+        slots = self.number_of_powers["max"] - len(self.powers)
+        had = frozenset(power["class"] for power in self.powers) & constraints.required
+        self.rolled_classes = []
+        self.simulated_classes = []
+        self.class_powers = []
+        while form_classes or rolled:
+            random_class = not form_classes
+            if not random_class:
+                outcomes = [(form_classes[0],) + outcome
+                            for outcome in constraints.outcomes(form_classes[0], slots, had)]
+                form_classes = form_classes[1:]
+                weights = [chance * constraints.power_chance(form_classes, rolled + replaced, left, have)
+                           for power_class, power, bonus, left, have, replaced, chance in outcomes]
+            else:
+                rolled -= 1
+                outcomes = [(power_class,) + outcome
+                            for power_class in power_class_chances
+                            for outcome in constraints.outcomes(power_class, slots, had)]
+                weights = [power_class_chances[power_class] * chance *
+                           constraints.power_chance((), rolled + replaced, left, have)
+                           for power_class, power, bonus, left, have, replaced, chance in outcomes]
+            power_class, power, bonus, slots, had, replaced, chance = outcomes[self.weighted_index(weights)]
+            #the first count random classes are the rolled ones, the rest are
+            #the classes Power Simulations are replaced with
+            if random_class:
+                if len(self.rolled_classes) < count:
+                    self.rolled_classes.append(power_class)
+                else:
+                    self.simulated_classes.append(power_class)
+            self.class_powers.append((power, list(bonus)))
+            if replaced:
+                rolled += 1
+        return list(self.rolled_classes)
+
+
+
+    def roll_simulated_class(self):
+        if not self.constraints.power_classes:
+            return super().roll_simulated_class()
+        return self.simulated_classes.pop(0)
+
+
+
+    def roll_class_power(self, power_class):
+        if not self.constraints.power_classes:
+            return super().roll_class_power(power_class)
+        return self.class_powers.pop(0)
+
+
+
+    def weighted_index(self, weights):
+        return tables.AliasTable(weights).sample(self.rng.random)
+
+
+
+#generate a character that meets the constraints
+def generate_character(physical_forms=None, min_ranks=None, power_classes=None, rng=None):
+    conditions = constraints(physical_forms, min_ranks, power_classes)
+    character = ConditionedCharacter(conditions, rng)
+    index, option = conditions.choices[conditions.table.sample(character.rng.random)]
+    return engine.complete_character(character, index, option)
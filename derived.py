@@ -0,0 +1,187 @@
+################### DERIVED VALUES ###################
+#A small dependency graph of values computed from other values, e.g. a
+#character's Health from its rank scores and Health multiplier. A Graph
+#declares the inputs and the derived values once; each Values made from it
+#holds one set of values. bind() calls a function with a value's new value
+#each time it changes, which is how the GUI keeps its text boxes up to
+#date. Once something is bound, setting an input recomputes only the
+#derived values that depend on it, each once and after everything it
+#depends on, and stops at a value that comes out the same. Until then
+#setting an input only marks the derived values stale, and they are all
+#computed the next time one is read: batch generation sets the inputs many
+#times per character but reads the derived values about once.
+
+class Graph:
+    def __init__(self):
+        #name: value of a new Values
+        self.defaults = {}
+        #name: (function, names of the values it is computed from)
+        self.functions = {}
+        #name: derived values computed from it
+        self.dependents = {}
+        #name: place in the order the values were declared in; a value is
+        #always declared after the values it is computed from
+        self.order = {}
+        #set of names: downstream(names)
+        self.downstream_values = {}
+        #(name, function, inputs) of every derived value in declaration order
+        self.derived = []
+
+
+
+    def input(self, name, default=None):
+        self.declare(name)
+        self.defaults[name] = default
+
+
+
+    def derive(self, name, inputs, function):
+        for input in inputs:
+            if input not in self.order:
+                raise KeyError(f"{name} is computed from {input}, which has not been declared")
+        self.declare(name)
+        for input in inputs:
+            self.dependents[input].append(name)
+        self.functions[name] = (function, tuple(inputs))
+        self.derived.append((name, function, tuple(inputs)))
+        self.defaults[name] = function(*(self.defaults[input] for input in inputs))
+
+
+
+    def declare(self, name):
+        if name in self.order:
+            raise KeyError(f"{name} is already declared")
+        self.order[name] = len(self.order)
+        self.dependents[name] = []
+        self.downstream_values.clear()
+
+
+
+    #(name, function, inputs) of every value computed, directly or not, from
+    #the named values, in declaration order
+    def downstream(self, names):
+        result = self.downstream_values.get(names)
+        if result is None:
+            found = set()
+            pending = list(names)
+            while pending:
+                for dependent in self.dependents[pending.pop()]:
+                    if dependent not in found:
+                        found.add(dependent)
+                        pending.append(dependent)
+            result = [(name,) + self.functions[name] for name in sorted(found, key=self.order.get)]
+            self.downstream_values[names] = result
+        return result
+
+
+
+    def new(self):
+        return Values(self)
+
+
+
+class Values:
+    __slots__ = ("graph", "values", "listeners", "stale")
+
+    def __init__(self, graph):
+        self.graph = graph
+        self.values = dict(graph.defaults)
+        #name: functions bound to it; None until something is bound
+        self.listeners = None
+        #whether inputs were set since the derived values were computed
+        self.stale = False
+
+
+
+    def __getitem__(self, name):
+        if self.stale:
+            self.recompute()
+        return self.values[name]
+
+
+
+    def set(self, name, value):
+        if self.listeners is None:
+            if name in self.graph.functions:
+                raise KeyError(f"{name} is derived and cannot be set")
+            self.values[name] = value
+            self.stale = True
+        elif self.values[name] != value or name in self.graph.functions:
+            self.update({name: value})
+
+
+
+    #set several inputs at once; each value computed from them is
+    #recomputed once
+    def update(self, changes):
+        graph = self.graph
+        values = self.values
+        listeners = self.listeners
+        if listeners is None:
+            for name, value in changes.items():
+                if name in graph.functions:
+                    raise KeyError(f"{name} is derived and cannot be set")
+                values[name] = value
+            self.stale = True
+            return
+        changed = set()
+        for name, value in changes.items():
+            if name in graph.functions:
+                raise KeyError(f"{name} is derived and cannot be set")
+            if values[name] != value:
+                values[name] = value
+                changed.add(name)
+                if name in listeners:
+                    self.changed(name, value)
+        if not changed:
+            return
+        for name, function, inputs in graph.downstream(frozenset(changed)):
+            if changed.isdisjoint(inputs):
+                continue
+            value = function(*map(values.__getitem__, inputs))
+            if values[name] != value:
+                values[name] = value
+                changed.add(name)
+                if name in listeners:
+                    self.changed(name, value)
+
+
+
+    #compute every derived value from the inputs
+    def recompute(self):
+        values = self.values
+        for name, function, inputs in self.graph.derived:
+            values[name] = function(*map(values.__getitem__, inputs))
+        self.stale = False
+
+
+
+    #go back to the values of a new Values
+    def reset(self):
+        old = self.values
+        self.values = dict(self.graph.defaults)
+        self.stale = False
+        if self.listeners:
+            for name in self.listeners:
+                if old[name] != self.values[name]:
+                    self.changed(name, self.values[name])
+
+
+
+    #call function(value) whenever the value changes
+    def bind(self, name, function):
+        if name not in self.values:
+            raise KeyError(f"Unknown value: {name}")
+        if self.listeners is None:
+            #from here on each change is passed on as it is made
+            if self.stale:
+                self.recompute()
+            self.listeners = {}
+        self.listeners.setdefault(name, []).append(function)
+
+
+
+    def changed(self, name, value):
+        if self.listeners and name in self.listeners:
+            for function in self.listeners[name]:
+                function(value)
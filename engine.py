@@ -0,0 +1,1378 @@
+import powerlists
+import tables
+import powerindex
+import derived
+from rng import RNG
+
+
+################### RULE TABLES ###################
+#physical form name: ability table to roll on
+physical_forms = {"Normal Human": 2,"Mutant-Induced": 1,"Mutant-Random": 1,
+                  "Mutant-Breed": 1,"Android": 4,"Humanoid Race": 5,
+                  "Surgical Composite": 2,"Modified Human-Organic": 1,
+                  "Modified Human-Muscular": 1,"Modified Human-Skeletal": 1,
+                  "Modified Human-Extra Parts": 1,"Demihuman-Centaur": 5,
+                  "Demihuman-Equiman": 3,"Demihuman-Faun": 2,
+                  "Demihuman-Felinoid": 1,"Demihuman-Lupinoid": 4,
+                  "Demihuman-Avian": {"Angelic": 3, "Harpy": 2},
+                  "Demihuman-Chiropteran": 2,"Demihuman-Lamian": 3,
+                  "Demihuman-Merhuman": 2,"Demihuman-Other": 3,
+                  "Cyborg-Artificial limbs/organs": 4,"Cyborg-Exoskeleton": 4,
+                  "Cyborg-Mechanical Body": 4,"Cyborg-Mechanically Augmented": 3,
+                  "Robot-Human Shape": 4,"Robot-Usuform": 4,"Robot-Metamorphic": 4,
+                  "Robot-Computer": 4,"Angel/Demon": 5,"Deity": 5,
+                  "Animal": {"Terrestrial": 1, "Extraterrestrial": 5},
+                  "Vegetable": 1,"Abnormal Chemistry": 2,"Mineral": 2,
+                  "Gaseous": 5,"Liquid": 5,"Energy": 5,"Ethereal": 1,
+                  "Undead": 1,"Compound": 0,"Changeling": 5,"Collective Mass": 1}
+
+physical_form_names = list(physical_forms)
+
+abilities = ["Fighting","Agility","Strength","Endurance","Reason",
+             "Intuition","Psyche","Resources","Popularity"]
+
+#attribute prefixes used for the rolled abilities, in the order they are rolled
+primary_abilities = ["fighting","agility","strength","endurance",
+                     "reason","intuition","psyche"]
+secondary_abilities = ["resources","popularity"]
+health_abilities = {"fighting", "agility", "strength", "endurance"}
+karma_abilities = {"reason", "intuition", "psyche"}
+
+ranks = ["Shift 0","Feeble","Poor","Typical","Good", "Excellent",
+         "Remarkable", "Incredible", "Amazing", "Monstrous",
+         "Unearthly", "Shift X", "Shift Y", "Shift Z", "Class 1000",
+         "Class 3000", "Class 5000", "Beyond"]
+
+#rank name: [minimum score, standard score]
+rank_scores = {"Shift 0": [0,0], "Feeble": [1,2], "Poor": [3,4],
+               "Typical": [5,6], "Good": [8,10], "Excellent": [16,20],
+               "Remarkable": [26,30], "Incredible": [36,40],
+               "Amazing": [46,50], "Monstrous": [63,75],
+               "Unearthly": [88,100], "Shift X": [126,150],
+               "Shift Y": [176,200], "Shift Z": [351,500],
+               "Class 1000": [1000,1000], "Class 3000": [3000,3000],
+               "Class 5000": [5000,5000], "Beyond": [10000,10000]}
+
+
+#physical form index: bonus, penalty, note and weakness text and its effects
+bonus1 = {
+    0: {"text": "Normal Humans get +1CS Resources; ", "effects": {"resources_bonus": 1}},
+    1: {"text": "Induced Mutants can raise any one Primary Ability +1CS; ", "effects": {"ability_bonus": 1}},
+    2: {"text": "Endurance is raised +1CS; ", "effects": {"endurance_bonus": 1}},
+    3: {"text": "Endurance is raised +1CS; ", "effects": {"endurance_bonus": 1}},
+    4: {"text": "Androids may raise any one Ability +1CS; ", "effects": {"ability_bonus": 1}},
+    5: {"text": "Can raise any one Ability +1CS; ", "effects": {"ability_bonus": 1}},
+    6: {"text": "Strength, Fighting, and Endurance are all increased +1CS; ", "effects": {"fighting_bonus": 1, "strength_bonus": 1, "endurance_bonus": 1}},
+    8: {"text": "Musculars gain +1CS Strength and Endurance; ", "effects": {"strength_bonus": 1, "endurance_bonus": 1}},
+    11: {"text": "Demihuman-Centaurs get +1 Strength; ", "effects": {"strength_bonus": 1}},
+    19: {"text": "Merhumans gain +1CS Popularity; ", "effects": {"popularity_bonus": 1}},
+    28: {"text": "+2CS Reason; ", "effects": {"reason_bonus": 2}},
+    29: {"text": "All Physical Abilities (FASE) are raised +1CS; ", "effects": {"fighting_bonus": 1, "agility_bonus": 1, "strength_bonus": 1, "endurance_bonus": 1}},
+    30: {"text": "All primary abilities (FASERIP) are raised +2CS; ", "effects": {"fighting_bonus": 2, "agility_bonus": 2, "strength_bonus": 2, "endurance_bonus": 2, "reason_bonus": 2, "intuition_bonus": 2, "psyche_bonus": 2}},
+    32: {"text": "Plants gain +2CS Endurance; ", "effects": {"endurance_bonus": 2}},
+    33: {"text": "Endurance is raised +1CS; ", "effects": {"endurance_bonus": 1}},
+    34: {"text": "Initial Health is doubled; ", "effects": {"health_multiplier": 1}},
+    38: {"text": "Physical attacks have a decreased effect on Ethereals (-9CS); ", "effects": {}},
+    39: {"text": "Strength and Endurance are increased by +1CS; ", "effects": {"strength_bonus": 1, "endurance_bonus": 1}},
+    42: {"text": "A Collective Mass gains +2CS Resistance to physical or directed energy attacks (lasers, for example); ", "effects": {}},
+}
+
+bonus2 = {
+    2: {"text": "Random Mutants gain +1 Power; ", "effects": {"power_bonus": 1}},
+    3: {"text": "Intuition is raised +1CS; ", "effects": {"intuition_bonus": 1}},
+    4: {"text": "Androids gain +1 Power; ", "effects": {"power_bonus": 1}},
+    28: {"text": "+1CS Resources; ", "effects": {"resources_bonus": 1}},
+    30: {"text": "+2 Powers; ", "effects": {"power_bonus": 2}},
+}
+
+penalty1 = {
+    2: {"text": "Random Mutants start with -1CS Resources; ", "effects": {"resources_bonus": -1}},
+    4: {"text": "Popularity is initially lowered -1CS; ", "effects": {"popularity_bonus": -1}},
+    5: {"text": "Starting Resources are set at Poor; ", "effects": {"pf_resources_rank": 2}},
+    6: {"text": "Starting Resources are set at Poor; ", "effects": {"pf_resources_rank": 2}},
+    7: {"text": "All Modified Humans gain -1 Power initially; ", "effects": {"power_bonus": -1}},
+    8: {"text": "All Modified Humans gain -1 Power initially; ", "effects": {"power_bonus": -1}},
+    9: {"text": "All Modified Humans gain -1 Power initially; ", "effects": {"power_bonus": -1}},
+    10: {"text": "All Modified Humans gain -1 Power initially; ", "effects": {"power_bonus": -1}},
+    11: {"text": "Centaurs have Feeble Climbing ability; ", "effects": {}},
+    13: {"text": "Popularity set to 0; gains Popularity more slowly than other Demihumans; ", "effects": {"pf_popularity_rank": 0}},
+    15: {"text": "-1CS Popularity; ", "effects": {"popularity_bonus": -1}},
+    17: {"text": "Initial Popularity is Feeble; ", "effects": {"pf_popularity_rank": 1}},
+    18: {"text": "Initial Popularity is 0; ", "effects": {"pf_popularity_rank": 0}},
+    21: {"text": "-1CS Intuition; ", "effects": {"intuition_bonus": -1}},
+    23: {"text": "-1CS Intuition and Psyche; ", "effects": {"intuition_bonus": -1, "psyche_bonus": -1}},
+    24: {"text": "Augmenteds receive -1 Power; ", "effects": {"power_bonus": -1}},
+    25: {"text": "Popularity set to 0; ", "effects": {"pf_popularity_rank": 0}},
+    28: {"text": "Fighting is decreased -1CS; ", "effects": {"fighting_bonus": -1}},
+    30: {"text": "0 Popularity with the hierarchy of the major established Earth religions; ", "effects": {}},
+    31: {"text": "Animals have -1 Power; ", "effects": {"power_bonus": -1}},
+    32: {"text": "Plants have -2CS Fighting; ", "effects": {"fighting_bonus": -2}},
+    34: {"text": "Movement rate is decreased -1CS; ", "effects": {}},
+    35: {"text": "Gas Bodies have 0 Resources and no initial Contacts; ", "effects": {"pf_resources_rank": 0, "initial_contacts": 0}},
+    38: {"text": "Fighting rank is zero in the Earth Dimension, unless the Ethereal is fighting another Ethereal; ", "effects": {}},
+    40: {"text": "-1CS Popularity; ", "effects": {"popularity_bonus": -1}},
+}
+
+notes1 = {
+    3: {"text": "Breed Mutants must have at least one Contact, usually their tribe; ", "effects": {"initial_contacts": 2, "contact": "Breed Mutant's tribe"}},
+    4: {"text": "Androids have at least one Contact, the lab tech or scientist who created them; ", "effects": {"initial_contacts": 2, "contact": "Android's creator"}},
+    5: {"text": "A Humanoid starts out with only one Contact, his race; ", "effects": {"initial_contacts": 1, "contact": "Humanoid's race"}},
+    6: {"text": "Composites heal twice as quickly as Normal Humans; ", "effects": {}},
+    7: {"text": "Organics heal twice as fast as Normal Humans; ", "effects": {}},
+    9: {"text": "Skeletals gain +1CS Resistance to Physical Attacks; ", "effects": {}},
+    11: {"text": "Can move quickly over horizontal ground (4 areas/turn), and can fight with their hooves; ", "effects": {}},
+    12: {"text": "Kicking does +1CS damage; ", "effects": {}},
+    13: {"text": "Feeble Mental Domination over females of any human(oid) race; ", "effects": {}},
+    14: {"text": "A felinoid can see in the dark with Excellent night vision; ", "effects": {}},
+    15: {"text": "A lupinoid possesses an Excellent sense of smell; ", "effects": {}},
+    17: {"text": "Chiropterans possess the Power of Active Sonar at Good rank; ", "effects": {}},
+    18: {"text": "Venomous (Excellent Intensity poison); ", "effects": {}},
+    19: {"text": "Merhumans possess both lungs and gills, but can only stay away from water a limited time because their bodies quickly dry out. Movement on dry land is limited to crawling or dependence on vehicles. Merhumans also possess Water Freedom; ", "effects": {}},
+    20: {"text": "A player can combine any animal with a human to create a new Demihuman, then work with the Judge to provide it with reasonable statistics; ", "effects": {}},
+    21: {"text": "At least one Contact must be either the lab or hospital that created him or a facility that provides maintenance services; ", "effects": {"initial_contacts": 2, "contact": "Lab or hospital responsible for creating or maintaining the cyborg"}},
+    23: {"text": "Monstrous Resistance to Disease and Poisons of all sorts; ", "effects": {}},
+    25: {"text": "The average Human Shape Robot weighs 500 to 2,000 pounds; ", "effects": {}},
+    27: {"text": "Generate separate Physical abilities for each form and assign Powers to either or multiple forms. Metamorphs have a minimum of two forms. -1CS to all Primary Abilities for each additional form; ", "effects": {}},
+    28: {"text": "Assume that all sentient computers have a minimum of one remotely controlled industrial robot. The owners think this robot is only used for self-maintenance and experimentation; Loss of all electrical power to the mainframe causes deactivation and loss of some of the computer's abilities and all of its Karma. Abilities and Powers are reduced -1CS across the board; ", "effects": {}},
+    29: {"text": "Angels and demons have no initial Contacts but will soon be sought out by groups who see them as symbols or tools; ", "effects": {"initial_contacts": 0}},
+    30: {"text": "Deities cannot really die in the Earth Dimension unless the slayer is another deity. Each deity has a home dimension; on that plane the deity loses his special protection from death; ", "effects": {}},
+    31: {"text": "Animals automatically have two Detection Powers at Good rank; ", "effects": {"animal_detection": 1}},
+    32: {"text": "Plants have 0 Resources; ", "effects": {"pf_resources_rank": 0}},
+    34: {"text": "Mineral Life is immune to all Poisons and Diseases that harm Normal Humans; ", "effects": {}},
+    35: {"text": "Gas Bodies possess a natural form of Phasing that permits them to penetrate solids; ", "effects": {}},
+    36: {"text": "If the liquid life possesses Endurance and Psyche ranks of Excellent or better, the Fluid Body can form an erect simulation of a human body; ", "effects": {}},
+    37: {"text": "Energy Beings have a Bonus Power of Energy Emission. Energy Control is an Optional Power; ", "effects": {"energy_form": 1}},
+    38: {"text": "The visibility of an Ethereal varies according to their whim; They can be invisible, transparent, translucent, or opaque; ", "effects": {}},
+    39: {"text": "Special means are required to maintain the reunion of mind and body. This can be anything from being frequently re-embalmed to utilizing any of the Vampiric Powers. If the Undead fails to follow his required - maintenance procedures, he begins to fall apart. In Undead terms, this is what Health points are used for. Health is the structural integrity of the Undead's own corpse.; ", "effects": {}},
+    40: {"text": "Click each Compound form to determine which Table to use to roll Abilities and which Bonuses, Penalties, etc. are part of the Compound Form; ", "effects": {}},
+    41: {"text": "Rolled Abilities are the base rank and score. Any Bonuses, Penalties, etc. only apply when the Changeling is in that form; Powers can be assigned to any or all Aspects. Each Aspect must have a unique Power not shared with other Aspects; ", "effects": {}},
+    42: {"text": "Because of its peculiar dual nature, a Collective Mass has two sets of primary abilities. The first set represents the average abilities possessed by the individual component entities; the second set is that of the Collective Mass. The majority of powers can only be manifested by the Collective Mass. Individual entities can at best exhibit Feeble-rank versions of the available powers; Ordinarily, the number of individuals composing the Collective Mass is less than the rank number of the Collective Mass's Reason, multiplied by 100; ", "effects": {}},
+}
+
+notes2 = {
+    6: {"text": "The Composite initially possesses one Contact - the hospital or person responsible for their creation; ", "effects": {"initial_contacts": 1, "contact": "hospital/person responsible for the character's creation"}},
+    7: {"text": "At least one Contact should be the organization responsible for the modification; ", "effects": {"initial_contacts": 2, "contact": "organization responsible for the modification of the character"}},
+    8: {"text": "At least one Contact should be the organization responsible for the modification; ", "effects": {"initial_contacts": 2, "contact": "organization responsible for the modification of the character"}},
+    9: {"text": "At least one Contact should be the organization responsible for the modification; ", "effects": {"initial_contacts": 2, "contact": "organization responsible for the modification of the character"}},
+    10: {"text": "At least one Contact should be the organization responsible for the modification; ", "effects": {"initial_contacts": 2, "contact": "organization responsible for the modification of the character"}},
+    14: {"text": "A felinoid possesses +1CS Climbing ability; ", "effects": {}},
+    18: {"text": "Lamians are difficult to bind (+1CS to escape); ", "effects": {}},
+    23: {"text": "Mech Bodies initially have only one Contact—the lab where they were created; ", "effects": {"initial_contacts": 1, "contact": "lab where character was created"}},
+    30: {"text": "Deities eventually attract any remaining living worshippers they still have. All of these people serve as Contacts; ", "effects": {}},
+    31: {"text": "Animals have to have a human Contact; ", "effects": {"initial_contacts": 2, "contact": "Human contact"}},
+    32: {"text": "Plants automatically possess Absorption Power of Good rank in the form of enhanced photosynthesis; ", "effects": {}},
+    35: {"text": "The Gas Body is a coherent cloud that retains its integrity even in the face of Amazing Intensity winds; ", "effects": {}},
+    36: {"text": "Fluid Bodies have a natural variation of Phasing that permits them to permeate any porous material; ", "effects": {}},
+    37: {"text": "Physical contact with an Energy Being does Feeble damage; The Energy Body possesses an Intensity rank of its own; Energy Bodies composed of visible energy types can create a ghost-like image of a human. If the Energy Body possesses Alter Ego, Energy Solidification, or Lifeform Creation, it can form a solid facsimile of a human; ", "effects": {}},
+    38: {"text": "While Ethereals are intangible on the Earth Dimension, they regain solidity in other Dimensions. In such realms Ethereals are vulnerable to all Powers except those that specifically affect Ethereals and other disembodied beings - these Powers are Spirit Summoning and Storage, Reincarnation, and Exorcism; ", "effects": {}}
+}
+
+notes3 = {
+    30: {"text": "Deities automatically possess at least one Travel Power; ", "effects": {"deity_travel_power": 1}},
+    31: {"text": "Resources are zero unless the animal has attached himself to a human. In this case, the Resource rank is assigned to that human; ", "effects": {}},
+    32: {"text": "Plants have no initial Contacts; the exception is if the Plant was created by scientific means, in which case its creator might be a Contact; ", "effects": {"initial_contacts": 0}},
+    35: {"text": "The only way to destroy a Gas Body is to alter its composition through Powers like Matter Conversion and Matter Control; ", "effects": {}},
+    36: {"text": "Fluid Bodies have no initial Contacts except their own race, if one exists; ", "effects": {"initial_contacts": 0}},
+    37: {"text": "The only way to destroy an Energy Body is to completely Negate or solidify its energy; ", "effects": {}}
+}
+
+weakness1 = {
+    6: {"text": "Resistance to Mental Domination is reduced -1CS; ", "effects": {}},
+    23: {"text": "Prone to things that never harm a flesh-bound character, like Magnetic attacks and rust; ", "effects": {}},
+    28: {"text": "Computers have a decreased Resistance to Electrical and Magnetic Attacks and also to Phasing; ", "effects": {}},
+    29: {"text": "Such beings possess a Psychological Weakness that Negates their Power; ", "effects": {}},
+    32: {"text": "Prolonged deprivation of light and water reduces the hero's Strength and Endurance -1CS per day after an initial three days; ", "effects": {}},
+    34: {"text": "Mineral Life is vulnerable to attacks with special effects on the body materials. For example, an iron golem is prone to rust; ", "effects": {}},
+    35: {"text": "Cannot freely move in a vacuum unless it possesses a Travel or Energy Power; ", "effects": {}},
+    36: {"text": "If the Fluid Body is frozen, the character is immobilized until they can melt. Vaporization is a fatal act for most Fluid Bodies; ", "effects": {}},
+    37: {"text": "Energy Bodies possess a special vulnerability to Plasma Control (-1CS Resistance); ", "effects": {}},
+    38: {"text": "Spirit Vampirism completely destroys Ethereals. Psi-Vampirism destroys the self-image and reduces the Ethereal to a mindless Poltergeist; ", "effects": {}},
+    39: {"text": "Undead possess a Psychological Weakness; their Power is negated within 10' of a religious symbol. If the symbol is that of a religion the Undead practiced while alive, they suffer Excellent damage; ", "effects": {}},
+    42: {"text": "A successful Grappling attack breaks the body into two masses. The body can automatically rejoin in 1-4 turns unless something prevents this; ", "effects": {}}
+}
+
+#physical form index: options the player must choose from
+form_options = {
+    10: ["Extra arms raise Fighting +1CS", "Duplicate organs doubles Health",
+         "Tails give the hero +1 attack", "Wings give the hero Flight",
+         "Extra legs give +1 area movement", "Antennae give a Detection Power",
+         "Horns give +1CS to Charging"],
+    16: ["Angelic", "Harpy"],
+    24: ["Resources are Good", "Resources are optionally rolled"],
+    27: ["2 forms", "3 forms", "4 forms", "5 forms"],
+    29: ["Angel", "Demon"],
+    31: ["Terrestrial Animal", "Extraterrestrial Animal"],
+}
+
+#the Compound form's instructions at the start of the notes, which the
+#character sheet leaves out
+exclude_compound_note = "Click each Compound form to determine which Table to use to roll Abilities and which Bonuses, Penalties, etc. are part of the Compound Form;"
+
+#optional powers that are really power classes; they are added to the Power
+#Classes list instead of the Powers list and do not use a power slot
+class_option_powers = {"Energy Control": "Energy Control",
+                       "Energy Emission": "Energy Emission",
+                       "Magical Power": "Magical"}
+
+contact_classes = {"Professional": powerlists.professional_contacts,
+                   "Scientific": powerlists.scientific_contacts,
+                   "Political": powerlists.political_contacts,
+                   "Mystic": powerlists.mystic_contact}
+
+biophysical_options = ["Healing", "Regeneration", "Revival",
+                       "Damage Transferral", "Decay", "Disruption", "Aging"]
+
+
+
+################### ROLLS ###################
+#the rolls on the rulebook tables; the tables themselves are compiled in tables.py
+def physical_form_roll(rng):
+    return tables.physical_form_table.roll(rng)
+
+
+
+def origin_roll(rng):
+    return tables.origin_table.roll(rng)
+
+
+
+#determine the number of compound/changeling forms
+def number_of_compoundforms(rng):
+    return tables.compound_forms_table.roll(rng)
+
+
+
+#roll one of the forms of a Compound/Changeling
+def compound_form_roll(rng):
+    return tables.compound_form_table.roll(rng)
+
+
+
+def ability_roll(table, roll):
+    return tables.ability_tables[table].lookup(roll)
+
+
+
+def roll_power_class(rng):
+    return tables.power_class_table.roll(rng)
+
+
+
+#roll a power in the power class
+def roll_power(power_class, rng):
+    return powerindex.roll_power(power_class, rng)
+
+
+
+#return the bonus and optional powers of a power in the power class
+def get_bonus_optional_powers(power_class, powername):
+    return powerindex.bonus_optional_powers(power_class, powername)
+
+
+
+#find the power class a power belongs to; "" if it is not in any power list
+def find_power_class(powername):
+    return powerindex.power_class_of(powername)
+
+
+
+def roll_talent_class(rng):
+    return tables.talent_class_table.roll(rng)
+
+
+
+#roll a talent in the talent class and return the talents to choose from
+def roll_talent(talent_class, rng):
+    return list(tables.talent_tables[talent_class].roll(rng))
+
+
+
+def biophysical_random_option(rng):
+    return tables.biophysical_table.roll(rng)
+
+
+
+def growth_type(rng):
+    return tables.growth_table.roll(rng)
+
+
+
+def shrink_type(rng):
+    return tables.shrink_table.roll(rng)
+
+
+
+def roll_number_range(type, rng):
+    min, max = tables.number_tables[type].roll(rng)
+    return {"min": min, "max": max}
+
+
+
+def weakness_roll(power_rank_above_remarkable, rng):
+    stimulus = tables.weakness_stimulus_table.roll(rng)
+    effect = tables.weakness_effect_table.roll(rng)
+    if effect == "Fatal" and not power_rank_above_remarkable:
+        effect = "Incapacitation"
+        tables.count_hit("Weakness Effect branches", "Fatal without a power rank above Remarkable")
+    duration = tables.weakness_duration_table.roll(rng)
+    return stimulus, effect, duration
+
+
+
+#number of slots a bonus/optional power or a talent uses; the ones marked
+#with a * use two
+def slot_cost(name):
+    return 2 if "*" in name else 1
+
+
+
+def rank_score(rank_index, std_rank_scores):
+    return rank_scores[ranks[rank_index]][std_rank_scores]
+
+
+
+################### DERIVED VALUES ###################
+#The values a character computes from its ranks (see derived.py): the
+#score of each ability, Health, Karma and what is left of Resources after
+#buying power, talent and contact slots. A rank of -1 has not been rolled
+#and scores 0.
+character_values = derived.Graph()
+character_values.input("std_rank_scores", 0)
+character_values.input("health_multiplier", 1)
+for ability in primary_abilities + ["popularity"]:
+    character_values.input(f"{ability}_rank", -1)
+character_values.input("original_resources_rank", -1)
+character_values.input("powers_bought", 0)
+character_values.input("talent_bought", 0)
+character_values.input("contact_bought", 0)
+#a power slot costs two Resource ranks, a talent or contact slot one
+character_values.derive("resources_rank",
+                        ["original_resources_rank", "powers_bought", "talent_bought", "contact_bought"],
+                        lambda original, powers, talents, contacts:
+                        original - 2 * powers - talents - contacts if original > -1 else -1)
+#[std_rank_scores][rank index + 1]: score
+scores_by_rank = [[0] + [rank_score(rank_index, std_rank_scores) for rank_index in range(len(ranks))]
+                  for std_rank_scores in (0, 1)]
+for ability in primary_abilities + secondary_abilities:
+    character_values.derive(f"{ability}_score", [f"{ability}_rank", "std_rank_scores"],
+                            lambda rank_index, std_rank_scores: scores_by_rank[std_rank_scores][rank_index + 1])
+character_values.derive("health", [f"{ability}_score" for ability in primary_abilities
+                                   if ability in health_abilities] + ["health_multiplier"],
+                        lambda *scores: sum(scores[:-1]) * scores[-1])
+character_values.derive("karma", [f"{ability}_score" for ability in primary_abilities
+                                  if ability in karma_abilities],
+                        lambda *scores: sum(scores))
+
+
+
+#a Character attribute held in its derived values
+def derived_attribute(name):
+    def set_value(self, value):
+        self.derived.set(name, value)
+    return property(lambda self: self.derived[name], set_value)
+
+
+
+################### CHARACTER ###################
+#A character being generated. Holds everything the GUI used to keep in its
+#widgets; each method is one step of the character generation process.
+#Every roll is made on the character's RNG, so a character created with
+#RNG.stream(seed, index) is the same every time it is generated.
+class Character:
+    std_rank_scores = derived_attribute("std_rank_scores")
+    health_multiplier = derived_attribute("health_multiplier")
+    popularity_rank = derived_attribute("popularity_rank")
+    original_resources_rank = derived_attribute("original_resources_rank")
+    powers_bought = derived_attribute("powers_bought")
+    talent_bought = derived_attribute("talent_bought")
+    contact_bought = derived_attribute("contact_bought")
+    resources_rank = property(lambda self: self.derived["resources_rank"])
+    health = property(lambda self: self.derived["health"])
+    karma = property(lambda self: self.derived["karma"])
+
+    def __init__(self, rng=None):
+        if rng is None:
+            rng = RNG()
+        self.rng = rng
+        self.derived = character_values.new()
+        self.clear_info()
+        self.physical_form = ""
+        self.form_index = -1
+        self.origin = ""
+        self.name = ""
+        self.identity = ""
+        self.identity_type = ""
+        self.sex = ""
+        self.age = ""
+        self.group = ""
+        self.base = ""
+
+
+    #clear attributes
+    def clear_info(self):
+        #the ranks, the Health multiplier, rank scores used and the Resources
+        #spent on slots, and the scores, Health, Karma and Resources from them
+        self.derived.reset()
+        self.fighting_bonus = 0
+        self.agility_bonus = 0
+        self.strength_bonus = 0
+        self.endurance_bonus = 0
+        self.reason_bonus = 0
+        self.intuition_bonus = 0
+        self.psyche_bonus = 0
+        self.resources_bonus = 0
+        self.popularity_bonus = 0
+        #pf_resources/popularity is used to determine ability set by physical form
+        self.pf_resources_rank = -1
+        self.pf_popularity_rank = -1
+        self.ability_bonus = 0
+        self.power_bonus = 0
+        self.initial_contacts = -1
+        self.contact = ""
+        self.compound_forms = 0
+        self.compound_table = 0
+        self.current_compound_form_index = 0
+        self.current_compound_form = ""
+        self.compound_form_list = ["","","","",""]
+        self.compound_form_options_list = ["","","","",""]
+        self.ability_bonus_button_was_clicked = 0
+        self.power_rank_above_remarkable = 0
+        self.number_of_powers = {"min": 0, "max": 0}
+        self.number_of_talents = {"min": 0, "max": 0}
+        self.number_of_contacts = {"min": 0, "max": 0}
+        self.purchased_powers = []
+        self.animal_detection = 0
+        self.energy_form = 0
+        self.deity_travel_power = 0
+        self.wings_travel_power = 0
+        self.detection_power = 0
+        #text shown in the Physical Form tab boxes
+        self.bonuses = ""
+        self.penalties = ""
+        self.weaknesses = ""
+        self.notes = ""
+        #physical form options and compound/changeling forms still to choose
+        self.form_options = []
+        self.form_option = -1
+        self.compound_choices = []
+        #ability: {"roll", "rank_roll", "bonus", "rank"}; the Resources rank is
+        #the one before any Resources are spent (see ability_rank)
+        self.abilities_rolled = False
+        self.ability_rolls = {}
+        self.power_classes = []
+        #{"name", "class", "rank", "cost", "prefix", "variant", "note", "locked"};
+        #cost is the number of power slots the power used when it was added
+        self.powers = []
+        self.weakness = ""
+        self.talent_classes = []
+        self.talents = []
+        self.contacts = []
+        #number of contacts at the top of the list given by the physical form
+        self.form_contacts = 0
+
+
+
+    def score(self, rank_index):
+        return rank_score(rank_index, self.std_rank_scores)
+
+
+
+    #the table used to roll abilities and power ranks
+    def ability_table(self):
+        name = self.physical_form
+        if name == "Compound":
+            return self.compound_table
+        table = physical_forms[name]
+        if name == "Demihuman-Avian":
+            if self.form_option == 0:
+                table = table["Angelic"]
+            else:
+                table = table["Harpy"]
+        if name == "Animal":
+            if self.form_option == 0:
+                table = table["Terrestrial"]
+            else:
+                table = table["Extraterrestrial"]
+        return table
+
+
+
+    #select a physical form; resets the character and rolls the origin
+    def select_physical_form(self, index):
+        self.clear_info()
+        self.physical_form = physical_form_names[index]
+        self.form_index = index
+        self.origin = origin_roll(self.rng)
+        self.physical_form_info(index, chance=100)
+
+
+
+    def physical_form_info(self, index, chance):
+        # Apply bonuses
+        if index in bonus1 and self.rng.randint(1, 100) <= chance:
+            bonus = bonus1[index]
+            self.bonuses += bonus["text"]
+            for attr, value in bonus["effects"].items():
+                setattr(self, attr, getattr(self, attr) + value)
+
+        if index in bonus2 and self.rng.randint(1, 100) <= chance:
+            bonus = bonus2[index]
+            self.bonuses += bonus["text"]
+            for attr, value in bonus["effects"].items():
+                setattr(self, attr, getattr(self, attr) + value)
+
+        # Apply penalties
+        if index in penalty1 and self.rng.randint(1, 100) <= chance:
+            penalty = penalty1[index]
+            self.penalties += penalty["text"]
+            for attr, value in penalty["effects"].items():
+                # Determine if physical form sets the value or modifies it
+                if attr.startswith("pf_") or attr == "initial_contacts":
+                    setattr(self, attr, value)
+                else:
+                    setattr(self, attr, getattr(self, attr) + value)
+
+        # Add notes
+        if index in notes1 and self.rng.randint(1, 100) <= chance:
+            note = notes1[index]
+            if index == 18:
+                venomous = self.rng.randint(0,1)
+                if venomous:
+                    self.notes += note["text"]
+            else:
+                self.notes += note["text"]
+            # Handle initial contacts - if any initial contacts values are present from physical form then add them to the contact list
+            if "initial_contacts" in note["effects"]:
+                self.initial_contacts = note["effects"]["initial_contacts"]
+            if self.initial_contacts > 0 and "contact" in note["effects"]:
+                self.add_form_contact(note["effects"]["contact"])
+            for attr, value in note["effects"].items():
+                setattr(self, attr, value)
+        if index in notes2 and self.rng.randint(1, 100) <= chance:
+            note = notes2[index]
+            self.notes += note["text"]
+            if "initial_contacts" in note["effects"]:
+                self.initial_contacts = note["effects"]["initial_contacts"]
+            if self.initial_contacts > 0 and "contact" in note["effects"]:
+                self.add_form_contact(note["effects"]["contact"])
+        if index in notes3 and self.rng.randint(1, 100) <= chance:
+            note = notes3[index]
+            self.notes += note["text"]
+            if index == 30:
+                self.deity_travel_power = 1
+            if "initial_contacts" in note["effects"]:#for Vegetables/Plants, Liquids
+                self.initial_contacts = note["effects"]["initial_contacts"]
+        if index in weakness1 and self.rng.randint(1, 100) <= chance:
+            self.weaknesses += weakness1[index]["text"]
+
+        #Bonuses Pt3
+        if self.rng.randint(1,100) <= chance:
+            if index == 30: # Deity
+                self.bonuses += "+2CS Popularity with the public; "
+
+        #Penalties Pt2
+        if self.rng.randint(1,100) <= chance:
+            if index == 6: # Surgical Composites
+                self.penalties += "Popularity is set to 0; "
+                self.pf_popularity_rank = 0
+
+        #Weaknesses Pt2
+        if self.rng.randint(1,100) <= chance:
+            if index == 37: # Energy
+                self.weaknesses += ("Energy Bodies can be contained"
+                                    " within special storage "
+                                    "batteries; this is the only "
+                                    "way to immobilize these beings; ")
+
+        #Physical Form Options
+        if index in form_options:
+            self.form_options = list(form_options[index])
+
+        #Changeling/Compound Form List
+        if index == 40 or index == 41: # Compound and Changeling
+            num = number_of_compoundforms(self.rng)
+            self.compound_forms = num
+            #Metamorphic Robots and Compound\Changelings can not be part of a
+            #Compound Form as it seriously complicates things, so they are
+            #left out of the table
+            for i in range(num):
+                formindex = compound_form_roll(self.rng)
+                self.compound_choices.append(physical_form_names[formindex])
+
+
+
+    #choose one of the Physical Form Options
+    def select_form_option(self, index):
+        selected_text = self.form_options[index]
+        row = self.form_index
+        effective_row = row
+        chance = 100
+
+        #If this is a Compound form get the form from the current compound form
+        #instead of the current physical form
+        if row in (40, 41):
+            #add the optional form to the compound_form_options_list at the same
+            #index as the compound_form_list index so that it can be added
+            #correctly to the file when saved
+            self.compound_form_options_list.insert(self.current_compound_form_index, selected_text)
+            self.current_compound_form_index += 1
+            option = physical_form_names.index(self.current_compound_form)
+            effective_row = option
+            chance = 100 / self.compound_forms
+            compound_num = len(self.compound_choices)
+            compound_option_chance = self.rng.randint(1,100)
+            if self.compound_table == 0:#if no compound form table has been chosen
+                #use the table if this is the last compound form, else use the chance
+                if compound_num == 0 or compound_option_chance <= chance:
+                    if option == 16 and index == 0:
+                        self.compound_table = physical_forms["Demihuman-Avian"]["Angelic"]
+                    elif option == 16 and index == 1:
+                        self.compound_table = physical_forms["Demihuman-Avian"]["Harpy"]
+                    elif option == 31 and index == 0:
+                        self.compound_table = physical_forms["Animal"]["Terrestrial"]
+                    elif option == 31 and index == 1:
+                        self.compound_table = physical_forms["Animal"]["Extraterrestrial"]
+
+        if effective_row == 10: #Modified Human-Extra Parts
+            if index == 0:
+                self.fighting_bonus += 1
+            if index == 1:
+                self.health_multiplier += 1
+            if index == 3:
+                self.wings_travel_power = 1
+            if index == 5:
+                self.detection_power = 1
+        elif effective_row == 16: #Demihuman-Avian
+            if index == 0:
+                if self.rng.randint(1,100) <= chance:
+                    self.bonuses += "Popularity +1CS; "
+                    self.popularity_bonus += 1
+            if index == 1:
+                if self.rng.randint(1,100) <= chance:
+                    self.bonuses += "+1CS Fighting; "
+                    self.fighting_bonus += 1
+                if self.rng.randint(1,100) <= chance:
+                    self.notes += ("Harpies possess arms that "
+                                   "are modified to also serve "
+                                   "as wings and feather-covered "
+                                   "legs that end in bird Claws; ")
+        elif effective_row == 24: #Cyborg-Mechanically Augmented
+            if index == 0:
+                self.pf_resources_rank = 4 #set resources to Good
+        elif effective_row == 27: #Robot-Metamorphic (roll Abilities for each form)
+            #apply penalty to abilities based on the number of forms above 2 (index 0)
+            for ability in primary_abilities:
+                setattr(self, f"{ability}_bonus", getattr(self, f"{ability}_bonus") - index)
+        elif effective_row == 29: #Angel/Demon
+            if index == 0:
+                if self.rng.randint(1,100) <= chance:
+                    self.bonuses += "Popularity +2CS; "
+                    self.popularity_bonus += 2
+                if self.rng.randint(1,100) <= chance:
+                    self.notes += ("Angels automatically possess a specific "
+                    "form of Artifact Creation that produces a magical sword that does Excellent damage.; ")
+            if index == 1:
+                if self.rng.randint(1,100) <= chance:
+                    self.penalties += "Popularity -2CS; "
+                    self.popularity_bonus -= 2
+                if self.rng.randint(1,100) <= chance:
+                    self.notes += ("Demons automatically possess "
+                    "Good Fire Generation and Specific Invulnerability to Heat and Fire; ")
+        elif effective_row == 31: #Animal
+            self.animal_detection = 1
+
+        #if the form is a Compound then clear the options in case another form
+        #has options; the options are stored in the compound_form_options_list
+        if row in (40, 41):
+            self.form_options = []
+        else:
+            self.form_option = index
+
+
+
+    #choose the next Compound/Changeling form
+    def select_compound_form(self, index):
+        selected_text = self.compound_choices[index]
+        self.current_compound_form = selected_text
+        physicalformindex = physical_form_names.index(selected_text)
+        #determine the chance the compound form takes of each bonus and penalty
+        chance = 100 / self.compound_forms
+        self.physical_form_info(physicalformindex, chance)
+
+        #calculate which table to use
+        #Demihuman Avian and Animal tables are determined by the optional list
+        if selected_text != "Demihuman-Avian" and selected_text != "Animal":
+            table_chance = self.rng.randint(1,100)
+            count = len(self.compound_choices)
+            if self.compound_table == 0:#if no table has been chosen
+                if count == 1:#if this is the last form use this table
+                    self.compound_table = physical_forms[selected_text]
+                elif table_chance <= chance:#if not the last form calculate the chance
+                    self.compound_table = physical_forms[selected_text]
+
+        self.compound_form_list.insert(self.current_compound_form_index, selected_text)
+        del self.compound_choices[index]
+
+        #increment the current_compound_form_index by one if no optional forms
+        #need to be selected and matched to the compound_form_list index
+        if not self.form_options:
+            self.current_compound_form_index += 1
+
+
+
+    #roll all of the abilities on the physical form's table
+    def roll_abilities(self):
+        self.abilities_rolled = True
+        #if physical form receives an ability bonus make sure to add one back if
+        #one was used before re-rolling abilities
+        if self.ability_bonus_button_was_clicked > 0:
+            self.ability_bonus += 1
+            self.ability_bonus_button_was_clicked = 0
+        table = self.ability_table()
+        self.fill_abilities(primary_abilities, table)
+        self.fill_abilities(secondary_abilities, table)
+
+
+
+    def fill_abilities(self, ability_names, table):
+        rolled = {}
+        for ability in ability_names:
+            #randomly roll for each ability on the given table
+            roll = self.ability_d100(ability, table)
+            rankindex = ability_roll(table, roll)
+            rank_roll = rankindex
+            #add the bonus to the rank
+            bonus = getattr(self, f"{ability}_bonus")
+            rankindex += bonus
+            if rankindex < 1:#If rolled rank is Feeble do not lower below Feeble
+                rankindex = 1
+
+            #check if Resources or Popularity was set by the Physical Form else
+            #apply the randomly rolled rank for each primary/secondary ability
+            if ability == "resources" and self.pf_resources_rank > -1:
+                rankindex = self.pf_resources_rank
+            if ability == "popularity" and self.pf_popularity_rank > -1:
+                rankindex = self.pf_popularity_rank
+
+            self.ability_rolls[ability] = {"roll": roll, "rank_roll": rank_roll,
+                                           "bonus": bonus, "rank": rankindex}
+            rolled[ability] = rankindex
+        self.set_ability_ranks(rolled)
+
+
+
+    #the d100 roll for an ability on the ability table
+    def ability_d100(self, ability, table):
+        return self.rng.randint(1,100)
+
+
+
+    #the primary ability complete_character spends an ability bonus on
+    def choose_bonus_ability(self):
+        return primary_abilities[self.rng.index(len(primary_abilities))]
+
+
+
+    #raise an ability +1CS using one of the physical form's ability bonuses
+    def raise_ability(self, ability):
+        if self.ability_bonus > 0:
+            self.set_ability_ranks({ability: self.ability_rank(ability) + 1})
+            self.ability_bonus -= 1 #reduce the number of ability bonuses by one
+            self.ability_bonus_button_was_clicked += 1
+
+
+
+    #switch between minimum (0) and standard (1) rank scores
+    def set_std_rank_scores(self, std_rank_scores):
+        self.std_rank_scores = std_rank_scores
+
+
+
+    #the rank index of a rolled ability; Resources less any spent on slots
+    def ability_rank(self, ability):
+        if ability == "resources":
+            return self.resources_rank
+        return self.ability_rolls[ability]["rank"]
+
+
+
+    #set the ranks of rolled abilities ({ability: rank index}); Resources are
+    #set by their rank before any slots are bought with them
+    def set_ability_ranks(self, ability_ranks):
+        changes = {}
+        for ability, rank_index in ability_ranks.items():
+            self.ability_rolls[ability]["rank"] = rank_index
+            if ability == "resources":
+                changes["original_resources_rank"] = rank_index
+            else:
+                changes[f"{ability}_rank"] = rank_index
+        self.derived.update(changes)
+
+
+
+    def ability_score(self, ability):
+        return self.derived[f"{ability}_score"]
+
+
+
+    def roll_number_powers(self, type):
+        setattr(self, f"number_of_{type}", self.roll_slots(type))
+        #apply any number of powers bonuses/penalties
+        if type == "powers":
+            if self.number_of_powers["min"] == 1 and self.power_bonus == -1:
+                self.number_of_powers["min"] = 1
+            else:
+                self.number_of_powers["min"] += self.power_bonus
+                self.number_of_powers["max"] += self.power_bonus
+        elif type == "contacts":
+            if self.initial_contacts == 0: #0 initial contants
+                self.number_of_contacts["min"] = 0
+            elif self.initial_contacts > 2:#at least one initial contant
+                if self.number_of_contacts["min"] == 0:
+                    self.number_of_contacts["min"] = 1
+            elif self.initial_contacts == 1:#only one initial contact
+                self.number_of_contacts["min"] = 1
+
+
+
+    #roll the number of power, talent or contact slots
+    def roll_slots(self, type):
+        return roll_number_range(type, self.rng)
+
+
+
+    def add_automatic_power(self, power, power_class, rank_index, prefix="", note=""):
+        self.powers.append({"name": power, "class": power_class, "rank": rank_index,
+                            "cost": 0, "prefix": prefix, "variant": "", "note": note,
+                            "locked": True})
+
+
+
+    #roll the number of power slots and the power classes that fill them
+    def roll_power_classes(self):
+        self.power_classes = []
+        self.powers = []
+        self.roll_automatic_powers()
+
+        self.power_rank_above_remarkable = 0
+        #roll number of powers
+        self.roll_number_powers("powers")
+        #add power class to the list for each minimum power number slot
+        self.power_classes += self.roll_minimum_power_classes(self.number_of_powers["min"])
+        #set the min to the automatic powers to start adding from there
+        self.number_of_powers["min"] = len(self.powers)
+        #if powers were purchased for Resources, reset back to original Resources
+        self.purchased_powers = []
+        self.powers_bought = 0
+
+
+
+    #add the powers (and power classes) the physical form gives
+    def roll_automatic_powers(self):
+        table = self.ability_table()
+
+        if self.animal_detection == 1:
+            #roll the two detection powers and apply power rank Good
+            detection_table = tables.power_tables["Detection"]
+            index = detection_table.roll_index(self.rng)
+            self.add_automatic_power(detection_table.outcomes[index], "Detection", 4)
+            # 2nd detection power, which can not be the same power
+            index2 = tables.roll_other_index(detection_table, index, self.rng)
+            self.add_automatic_power(detection_table.outcomes[index2], "Detection", 4)
+
+        if self.energy_form == 1:
+            power = roll_power("Energy Emission", self.rng)
+            rank_index = ability_roll(table, self.rng.randint(1,100))
+            epoint = self.energy_emission_body_part()
+            self.add_automatic_power(power, "Energy Emission", rank_index,
+                                     note=f"emitted from {epoint}")
+            #add Energy Control as an Optional Power to Power Classes list
+            self.power_classes.append("Energy Control")
+
+        if self.deity_travel_power == 1:
+            power = roll_power("Travel", self.rng)
+            rank_index = ability_roll(table, self.rng.randint(1,100))
+            self.add_automatic_power(power, "Travel", rank_index)
+
+        if self.wings_travel_power == 1:
+            rank_index = ability_roll(table, self.rng.randint(1,100))
+            self.add_automatic_power("Winged Flight", "Travel", rank_index)
+
+        if self.detection_power == 1:
+            power = roll_power("Detection", self.rng)
+            rank_index = ability_roll(table, self.rng.randint(1,100))
+            self.add_automatic_power(power, "Detection", rank_index, prefix="Antennae: ")
+
+
+
+    #roll the power classes for the minimum number of power slots
+    def roll_minimum_power_classes(self, count):
+        return [roll_power_class(self.rng) for i in range(count)]
+
+
+
+    #roll the power class a Magical Power Simulation simulates
+    def roll_simulated_class(self):
+        return roll_power_class(self.rng)
+
+
+
+    #roll a power in the power class and pick one of its bonus powers if it
+    #has any; returns (power, [bonus power])
+    def roll_class_power(self, power_class):
+        power = roll_power(power_class, self.rng)
+        bonus_powers, option_powers = get_bonus_optional_powers(power_class, power)
+        bonus_selected = []
+        if bonus_powers:
+            bonus_selected.append(bonus_powers[self.rng.index(len(bonus_powers))])
+        return power, bonus_selected
+
+
+
+    #buy another power slot for two Resource ranks; returns the reason it
+    #could not be bought or None
+    def buy_power(self):
+        new_resources = self.resources_rank - 2
+        if new_resources < 0:
+            return "resources"
+        elif len(self.power_classes) == self.number_of_powers["max"]:
+            return "slots"
+        #roll an additional power class and add it to the list
+        power_class = roll_power_class(self.rng)
+        self.power_classes.append(power_class)
+        self.purchased_powers.append(power_class)
+        self.powers_bought += 1
+
+
+
+    def remove_power_class(self, index):
+        power_class = self.power_classes.pop(index)
+        #if removed power is a purchased power return the Resources spent
+        if power_class in self.purchased_powers:
+            self.purchased_powers.remove(power_class)
+            self.powers_bought -= 1
+
+
+
+    #the number of power slots a power and its selected bonus/optional powers use
+    def power_cost(self, power_class, power, bonus_selected, option_selected):
+        #get the cost of the main power if there is one;
+        #user may be adding just a bonus or optional power
+        if power != '':
+            cost = powerindex.power_cost(power_class, power)
+        else:
+            cost = 0
+        for bonus_power in bonus_selected:
+            cost += slot_cost(bonus_power)
+        for option_power in option_selected:
+            cost += slot_cost(option_power)
+            #Power Classes are not added to the cost but are added to the Power Classes List
+            if option_power in class_option_powers:
+                cost -= 1
+        return cost
+
+
+
+    #Roll the rank of the power and add the power and any bonus and optional
+    #powers to the Powers list; biophysical_choice returns the type of a
+    #Biophysical Control power (or "Random"); returns "slots" if there are
+    #not enough power slots or None
+    def add_power(self, class_index, power, bonus_selected=(), option_selected=(),
+                  biophysical_choice=lambda: "Random"):
+        power_class = self.power_classes[class_index]
+        cost = self.power_cost(power_class, power, bonus_selected, option_selected)
+        cost += self.number_of_powers["min"] #add the current minimum slots used
+        if cost > self.number_of_powers["max"]:
+            return "slots"
+
+        #Magical Power Simulation randomly determines the simulated power class
+        #and replaces this power class with it
+        if power == "Power Simulation":
+            del self.power_classes[class_index]
+            self.power_classes.append(self.roll_simulated_class())
+            return None
+
+        table = self.ability_table()
+        rank_index = ability_roll(table, self.rng.randint(1,100))
+        #check if the Power Rank is above Remarkable and flag it for the
+        #possibility of a Fatal Weakness
+        if rank_index > 6:
+            self.power_rank_above_remarkable = 1
+
+        if power != '':
+            record = {"name": power, "class": power_class, "rank": rank_index,
+                      "cost": powerindex.power_cost(power_class, power),
+                      "prefix": "", "variant": "", "note": "", "locked": False}
+            if power_class == "Energy Emission":
+                record["note"] = f"emitted from {self.energy_emission_body_part()}"
+            elif power == "Biophysical Control*":
+                record["variant"] = self.biophysical_type(biophysical_choice)
+            elif power == "Growth":
+                record["note"] = f"growth type: {growth_type(self.rng)}"
+            elif power == "Shrinking":
+                record["note"] = f"shrink type: {shrink_type(self.rng)}"
+            if power != "Biophysical Control*" or record["variant"]:
+                self.powers.append(record)
+
+        #roll the power ranks for the bonus powers
+        for bonus_power in bonus_selected:
+            rank_index = ability_roll(table, self.rng.randint(1,100))
+            record = {"name": bonus_power, "class": find_power_class(bonus_power),
+                      "rank": rank_index, "cost": slot_cost(bonus_power), "prefix": "",
+                      "variant": "", "note": "", "locked": False}
+            #if energy emission power check for emission point
+            if ("Energy Emission", bonus_power) in powerindex.powers:
+                record["note"] = f"emitted from {self.energy_emission_body_part()}"
+            self.powers.append(record)
+
+        #remove the power class before any optional power classes are added
+        del self.power_classes[class_index]
+
+        #roll the power ranks for the optional powers
+        for option_power in option_selected:
+            rank_index = ability_roll(table, self.rng.randint(1,100))
+            #if the optional power is a power class add it to the Power Class list and not the Powers list
+            if option_power in class_option_powers:
+                self.power_classes.append(class_option_powers[option_power])
+                continue
+            record = {"name": option_power, "class": find_power_class(option_power),
+                      "rank": rank_index, "cost": slot_cost(option_power), "prefix": "",
+                      "variant": "", "note": "", "locked": False}
+            if ("Energy Emission", option_power) in powerindex.powers:
+                record["note"] = f"emitted from {self.energy_emission_body_part()}"
+            elif option_power == "Biophysical Control*":
+                record["variant"] = self.biophysical_type(biophysical_choice)
+                if not record["variant"]:
+                    continue
+            self.powers.append(record)
+
+        #calculate the new min power slots
+        self.number_of_powers["min"] = cost
+
+
+
+    def biophysical_type(self, biophysical_choice):
+        selected_option = biophysical_choice()
+        if selected_option == "Random":#if random was selected roll the option
+            selected_option = biophysical_random_option(self.rng)
+        return selected_option or ""
+
+
+
+    #remove an added power and refund its power slots
+    def remove_power(self, index):
+        power = self.powers[index]
+        if power["locked"]:
+            return
+        self.number_of_powers["min"] -= power["cost"]
+        del self.powers[index]
+
+
+
+    def power_text(self, power):
+        name = power["name"]
+        if power["variant"]:
+            name = f"{name} ({power['variant']})"
+        text = f"{power['prefix']}{name} - {ranks[power['rank']]} ({self.score(power['rank'])})"
+        if power["note"]:
+            text = f"{text}; {power['note']}"
+        return text
+
+
+
+    def energy_emission_body_part(self):
+        return self.emission_point(tables.energy_emission_table.roll(self.rng))
+
+
+
+    #the body part a rolled emission point is on for this character
+    def emission_point(self, epoint):
+        if self.form_option > -1:
+            option_text = self.form_options[self.form_option]
+        else:
+            option_text = ""
+        #check if the extra body part exists and use an existing one if not
+        if epoint == "Wings":
+            if not (self.wings_travel_power == 1 or self.form_index == 16):
+                epoint = "Hands"
+        elif epoint == "Antennae":
+            if option_text == "Horns give +1CS to Charging attacks":
+                epoint = "Horns"
+            elif option_text != "Antennae give a Detection Power":
+                epoint = "Eyes"
+        elif epoint == "Tail":
+            if option_text != "Tails give the hero +1 attack":
+                epoint = "Torso"
+        return epoint
+
+
+    def generate_weakness(self):
+        stimulus, effect, duration = weakness_roll(self.power_rank_above_remarkable, self.rng)
+        self.weakness = f"{stimulus} causes {effect} that is {duration}"
+        self.weaknesses += self.weakness
+
+
+
+    #roll the number of talent slots and the talent classes that fill them
+    def roll_talent_classes(self):
+        self.talent_classes = []
+        self.talents = []
+        self.roll_number_powers("talents")
+        for i in range(self.number_of_talents["min"]):
+            self.talent_classes.append(roll_talent_class(self.rng))
+        #set the min to 0 to start adding from 0 when talents are added to the list
+        self.number_of_talents["min"] = 0
+        #if talents were purchased for Resources, reset back to original Resources
+        self.talent_bought = 0
+
+
+
+    #buy another talent slot for one Resource rank; returns the reason it
+    #could not be bought or None
+    def buy_talent(self):
+        new_resources = self.resources_rank - 1
+        if new_resources < 0:
+            return "resources"
+        elif len(self.talent_classes) == self.number_of_talents["max"]:
+            return "slots"
+        self.talent_classes.append(roll_talent_class(self.rng))
+        self.talent_bought += 1
+
+
+
+    def remove_talent_class(self, index):
+        del self.talent_classes[index]
+
+
+
+    #add a talent rolled for a talent class; returns "slots" if there are
+    #not enough talent slots or None
+    def add_talent(self, class_index, talent):
+        cost = slot_cost(talent)
+        if cost + self.number_of_talents["min"] > self.number_of_talents["max"]:
+            return "slots"
+        self.talents.append({"name": talent, "class": self.talent_classes[class_index],
+                             "cost": cost})
+        del self.talent_classes[class_index]
+        self.number_of_talents["min"] += cost
+
+
+
+    def remove_talent(self, index):
+        self.number_of_talents["min"] -= self.talents.pop(index)["cost"]
+
+
+
+    #roll the number of contact slots
+    def roll_contact_classes(self):
+        #keep the contact given by the physical form
+        if self.initial_contacts > 0:
+            self.contacts = self.contacts[:1]
+        else:
+            self.contacts = []
+        self.form_contacts = len(self.contacts)
+        self.roll_number_powers("contacts")
+        #if contacts were purchased for Resources, reset back to original Resources
+        self.contact_bought = 0
+
+
+
+    #the contact given by the physical form, which uses no contact slot and
+    #cannot be removed
+    def add_form_contact(self, contact):
+        self.contacts.append({"name": contact, "class": "", "cost": 0, "locked": True})
+        self.form_contacts += 1
+
+
+
+    def add_contact(self, contact, contact_class=""):
+        self.contacts.append({"name": contact, "class": contact_class, "cost": 1,
+                              "locked": False})
+
+
+
+    #remove an added contact and refund its contact slot
+    def remove_contact(self, index):
+        contact = self.contacts[index]
+        if contact["locked"]:
+            return
+        self.number_of_contacts["min"] -= contact["cost"]
+        del self.contacts[index]
+
+
+
+    #buy another contact slot for one Resource rank; returns the reason it
+    #could not be bought or None
+    def buy_contact(self):
+        new_resources = self.resources_rank - 1
+        if new_resources < 0:
+            return "resources"
+        elif (len(self.contacts) == self.number_of_contacts["max"] or
+              self.number_of_contacts["min"] == self.number_of_contacts["max"]):
+            return "slots"
+        self.number_of_contacts["min"] += 1
+        self.contact_bought += 1
+
+
+
+    #the physical form with its optional or compound/changeling forms
+    def physical_form_text(self):
+        physical_form_name = self.physical_form
+        if physical_form_name == "Compound" or physical_form_name == "Changeling":
+            if physical_form_name == "Compound":
+                physical_form_name = "Compound Form: "
+            else:
+                physical_form_name = "Changeling Form: "
+            for index in reversed(range(self.compound_forms)):
+                form = self.compound_form_list[index]
+                compound_index = self.compound_form_list.index(form)
+                option_form = self.compound_form_options_list[compound_index]
+                if option_form != "":
+                    physical_form_name = physical_form_name + f"{form} "
+                    if index == 0:
+                        physical_form_name = physical_form_name + f"({option_form})"
+                    else:
+                        physical_form_name = physical_form_name + f"({option_form}), "
+                elif index == 0:
+                    physical_form_name = physical_form_name + f"{form}"
+                else:
+                    physical_form_name = physical_form_name + f"{form}, "
+        elif self.form_option > -1:
+            physical_form_name = f"{physical_form_name} ({self.form_options[self.form_option]})"
+        return physical_form_name
+
+
+
+    #the text of the saved character sheet
+    def character_sheet(self):
+        if self.identity_type == "Secret":
+            secret = "(Secret)"
+            public = " "
+        elif self.identity_type == "Public":
+            secret = " "
+            public = "(Public)"
+        else:
+            secret = " "
+            public = " "
+        #exclude the Compound Form notes if they exist
+        notes = self.notes
+        if notes.startswith(exclude_compound_note):
+            notes = notes[len(exclude_compound_note):].lstrip()
+
+        lines = [f"NAME: {self.name}\n",
+                 f"IDENTITY: {self.identity}   {secret}{public}\n",
+                 f"SEX: {self.sex}     AGE: {self.age}\n",
+                 f"GROUP AFFILIATION: {self.group}     BASE OF OPERATIONS: {self.base}\n\n",
+                 f"PHYSICAL FORM: {self.physical_form_text()}\nORIGIN OF POWER: {self.origin}\n",
+                 f"Bonuses: {self.bonuses}\n",
+                 f"Penalties: {self.penalties}\n",
+                 f"Weaknesses: {self.weaknesses}\n",
+                 f"Notes: {notes}\n\n\n",
+                 f"ATTRIBUTES:\n"]
+        for ability in primary_abilities:
+            lines.append(f"{ability.capitalize()}: {self.rank_text(ability)}\n")
+        lines.append(f"\nHealth: {self.health}     Karma: {self.karma}     ")
+        for ability in secondary_abilities:
+            lines.append(f"{ability.capitalize()}: {self.rank_text(ability)}     ")
+        lines.append(f"\n\n\nPOWERS:\n")
+        for power in self.powers:
+            lines.append(f"{self.power_text(power)}\n")
+        lines.append(f"\n\nTALENTS:\n")
+        for talent in self.talents:
+            lines.append(f"{talent['name']}\n")
+        lines.append(f"\n\nCONTACTS:\n")
+        for contact in self.contacts:
+            lines.append(f"{contact['name']}\n")
+        return "".join(lines)
+
+
+
+    #"Rank (score)" of an ability or blank if the abilities were not rolled
+    def rank_text(self, ability):
+        if ability not in self.ability_rolls:
+            return " ()"
+        rank_index = self.ability_rank(ability)
+        return f"{ranks[rank_index]} ({self.score(rank_index)})"
+
+
+
+    #a record of the finished character that can be written out as JSON
+    def to_dict(self):
+        record = {"physical_form": self.physical_form_text(),
+                  "origin": self.origin,
+                  "bonuses": self.bonuses, "penalties": self.penalties,
+                  "weaknesses": self.weaknesses, "notes": self.notes,
+                  "abilities": {}}
+        for ability in primary_abilities + secondary_abilities:
+            if ability in self.ability_rolls:
+                rank_index = self.ability_rank(ability)
+                record["abilities"][ability.capitalize()] = {"rank": ranks[rank_index],
+                                                             "score": self.score(rank_index)}
+        record["health"] = self.health
+        record["karma"] = self.karma
+        record["powers"] = [self.power_text(power) for power in self.powers]
+        record["weakness"] = self.weakness
+        record["talents"] = [talent["name"] for talent in self.talents]
+        record["contacts"] = [contact["name"] for contact in self.contacts]
+        return record
+
+
+
+################### AUTOMATIC GENERATION ###################
+#generate a complete character from physical form through contacts, making
+#the choices a player would make at random with the character's RNG
+def generate_character(physical_form=None, rng=None):
+    character = Character(rng)
+    if physical_form is None:
+        index = physical_form_roll(character.rng)
+    else:
+        index = physical_form_names.index(physical_form)
+    return complete_character(character, index)
+
+
+
+#generate the rest of a character with the physical form index; form_option
+#is the index of the form's option (random if None)
+def complete_character(character, index, form_option=None):
+    rng = character.rng
+    character.select_physical_form(index)
+
+    #choose the compound/changeling forms and any of their options
+    while character.compound_choices:
+        character.select_compound_form(0)
+        if character.form_options:
+            character.select_form_option(rng.index(len(character.form_options)))
+    if character.form_options:
+        if form_option is None:
+            form_option = rng.index(len(character.form_options))
+        character.select_form_option(form_option)
+
+    #roll the abilities and spend any ability bonuses on the primary abilities
+    character.roll_abilities()
+    while character.ability_bonus > 0:
+        character.raise_ability(character.choose_bonus_ability())
+
+    #roll a power for each power class, picking one of the bonus powers if
+    #the power has any; drop the class if there are not enough slots left
+    character.roll_power_classes()
+    while character.power_classes:
+        power, bonus_selected = character.roll_class_power(character.power_classes[0])
+        if character.add_power(0, power, bonus_selected) == "slots":
+            character.remove_power_class(0)
+    character.generate_weakness()
+
+    #roll a talent for each talent class
+    character.roll_talent_classes()
+    while character.talent_classes:
+        talents = roll_talent(character.talent_classes[0], rng)
+        if character.add_talent(0, talents[rng.index(len(talents))]) == "slots":
+            character.remove_talent_class(0)
+
+    #fill the minimum number of contacts
+    character.roll_contact_classes()
+    classes = list(contact_classes)
+    while len(character.contacts) < character.number_of_contacts["min"]:
+        contact_class = classes[rng.index(len(classes))]
+        contacts = contact_classes[contact_class]
+        character.add_contact(contacts[rng.index(len(contacts))], contact_class)
+    return character
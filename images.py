@@ -0,0 +1,70 @@
+import os
+import threading
+
+from PyQt6.QtGui import QImage, QPixmap
+
+
+################### IMAGE CACHE ###################
+#The guide character artwork (the Watcher, Captain America, Dr. Doom and the
+#rest) is decoded once instead of from disk every time a handler shows it.
+#preload starts a thread that decodes every image in the directory into a
+#QImage while the splash is up; QPixmaps can only be made on the GUI thread,
+#so pixmap() turns a decoded image into a QPixmap the first time it is asked
+#for and hands back the same QPixmap after that. An image asked for before
+#the thread has reached it is decoded there and then.
+
+extensions = (".jpg", ".png")
+#the images directory, set by preload
+directory = None
+#file name: QImage decoded by the thread and not yet made into a QPixmap
+decoded = {}
+#file name: QPixmap
+pixmaps = {}
+lock = threading.Lock()
+loader = None
+null = None
+
+
+
+#start decoding the images in path on a background thread (once)
+def preload(path):
+    global directory, loader
+    if loader is None:
+        directory = path
+        names = sorted(name for name in os.listdir(path) if name.lower().endswith(extensions))
+        loader = threading.Thread(target=decode_all, args=(names,), name="image preload", daemon=True)
+        loader.start()
+    return loader
+
+
+
+def decode_all(names):
+    for name in names:
+        if name in pixmaps:
+            continue
+        image = QImage(os.path.join(directory, name))
+        with lock:
+            if name not in pixmaps:
+                decoded.setdefault(name, image)
+
+
+
+#the shared QPixmap of an image file, e.g. pixmap("uatu.jpg")
+def pixmap(name):
+    result = pixmaps.get(name)
+    if result is None:
+        with lock:
+            image = decoded.pop(name, None)
+            if image is None:
+                image = QImage(os.path.join(directory, name))
+            result = pixmaps[name] = QPixmap.fromImage(image)
+    return result
+
+
+
+#the shared empty QPixmap used to clear a picture
+def null_pixmap():
+    global null
+    if null is None:
+        null = QPixmap()
+    return null
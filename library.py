@@ -0,0 +1,153 @@
+import json
+from hashlib import blake2b
+from collections import OrderedDict
+
+import engine
+import tables
+import powerlists
+from rng import RNG
+
+
+################### CHARACTER LIBRARY ###################
+#Stores characters as the seed they were generated from plus anything the
+#user typed in, and regenerates the full character when it is looked up.
+#A character only regenerates the same if the rules are the same, so every
+#entry records the hash of the rules it was generated with.
+
+#version of the way characters are rolled; raise it whenever a change makes
+#the same seed roll a different character (e.g. drawing a different number
+#of random numbers) without changing any table, so that stored seeds are no
+#longer taken to regenerate the same characters
+#  2: compound forms and the second animal Detection power are drawn
+#     without rerolling
+generator_version = 2
+
+#details the user can fill in or choose for a stored character
+override_fields = ["physical_form", "form_option", "name", "identity", "identity_type",
+                   "sex", "age", "group", "base", "notes"]
+
+#details that change the rolled character rather than being set on it
+rolled_fields = ("physical_form", "form_option")
+
+
+
+#hash of everything a generated character depends on: the generator
+#version, the roll tables, the power lists and the physical form rules
+def compute_rules_hash():
+    rules = blake2b(digest_size=8)
+    rules.update(repr(("generator", generator_version)).encode())
+    for table in tables.all_tables():
+        rules.update(repr((table.name, table.sides, table.thresholds, table.outcomes)).encode())
+    rules.update(repr(powerlists.all_power_lists).encode())
+    for contact_class, contacts in engine.contact_classes.items():
+        rules.update(repr((contact_class, contacts)).encode())
+    rules.update(repr((engine.physical_forms, engine.bonus1, engine.bonus2, engine.penalty1,
+                       engine.notes1, engine.notes2, engine.notes3, engine.weakness1,
+                       engine.form_options)).encode())
+    return rules.hexdigest()
+
+
+
+rules_hash = compute_rules_hash()
+
+
+
+#regenerate a character from its seed and apply the user's details; a
+#form_option is the index of the physical form's option the user chose
+def materialize(seed, index=0, overrides=None):
+    overrides = overrides or {}
+    if "form_option" in overrides:
+        character = engine.Character(RNG.stream(seed, index))
+        if overrides.get("physical_form") is None:
+            form_index = engine.physical_form_roll(character.rng)
+        else:
+            form_index = engine.physical_form_names.index(overrides["physical_form"])
+        character = engine.complete_character(character, form_index, overrides["form_option"])
+    else:
+        character = engine.generate_character(overrides.get("physical_form"), RNG.stream(seed, index))
+    for field, value in overrides.items():
+        if field not in rolled_fields:
+            setattr(character, field, value)
+    return character
+
+
+
+class CharacterLibrary:
+    def __init__(self, cache_size=1024):
+        #[{"rules", "seed", "index", "overrides"}]
+        self.entries = []
+        self.cache_size = cache_size
+        #entry id: Character, most recently used last
+        self.cache = OrderedDict()
+
+
+
+    def __len__(self):
+        return len(self.entries)
+
+
+
+    #add the character generated from (seed, index); returns its id
+    def add(self, seed, index=0, **overrides):
+        for field in overrides:
+            if field not in override_fields:
+                raise ValueError(f"Unknown character detail: {field}")
+        self.entries.append({"rules": rules_hash, "seed": seed, "index": index,
+                             "overrides": overrides})
+        return len(self.entries) - 1
+
+
+
+    #change the user's details of a stored character
+    def update(self, id, **overrides):
+        for field in overrides:
+            if field not in override_fields:
+                raise ValueError(f"Unknown character detail: {field}")
+        self.entries[id]["overrides"].update(overrides)
+        #a new physical form or form option is a different character
+        if any(field in overrides for field in rolled_fields):
+            self.cache.pop(id, None)
+        elif id in self.cache:
+            for field, value in overrides.items():
+                setattr(self.cache[id], field, value)
+
+
+
+    #the full character; regenerated if it is not in the cache
+    def get(self, id):
+        if id in self.cache:
+            self.cache.move_to_end(id)
+            return self.cache[id]
+        entry = self.entries[id]
+        if entry["rules"] != rules_hash:
+            raise ValueError(f"Character {id} was generated with different rules "
+                             f"({entry['rules']}) and can not be regenerated")
+        character = materialize(entry["seed"], entry["index"], entry["overrides"])
+        self.cache[id] = character
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return character
+
+
+
+    def character_sheet(self, id):
+        return self.get(id).character_sheet()
+
+
+
+    #one JSON line per character
+    def save(self, file_path):
+        with open(file_path, "w") as file:
+            for entry in self.entries:
+                file.write(json.dumps(entry, separators=(",", ":")) + "\n")
+
+
+
+    @classmethod
+    def load(cls, file_path, cache_size=1024):
+        library = cls(cache_size)
+        with open(file_path) as file:
+            for line in file:
+                if line.strip():
+                    library.entries.append(json.loads(line))
+        return library
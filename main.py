@@ -1,21 +1,27 @@
 import os
 import sys
+import time
+import argparse
 import platform
 
-from random import randint
 from functools import partial
-from bisect import bisect
 
 from PyQt6.QtWidgets import (QApplication, QListWidgetItem, QMainWindow, QWidget, 
                              QVBoxLayout, QHBoxLayout, QGridLayout, QLabel, 
                              QLineEdit, QTextEdit, QPushButton, QRadioButton, 
                              QTabWidget, QComboBox, QListWidget, QGroupBox, 
                              QAbstractItemView, QMessageBox, QFileDialog, 
-                             QDialog, QScrollArea)
-from PyQt6.QtGui import QIcon, QFont, QPixmap, QAction, QFontDatabase
-from PyQt6.QtCore import Qt, QTimer, QSize
+                             QDialog, QScrollArea, QListView)
+from PyQt6.QtGui import QIcon, QFont, QAction, QFontDatabase
+from PyQt6.QtCore import Qt, QTimer, QSize, QAbstractListModel, QModelIndex
 
-import powerlists
+import engine
+import images
+import tablehits
+
+#shortest time the splash screen stays up, in milliseconds; the main window
+#is built while it is shown and opens as soon as it is ready after that
+splash_time = 500
 
 
 ################### SETUP GUI ###################
@@ -23,6 +29,7 @@ import powerlists
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
+        images.preload(resource_path("images"))
 
         #Setup parameters of the main window
         self.setWindowTitle("Marvel Super Heroes Character Generator")
@@ -118,45 +125,13 @@ class MainWindow(QMainWindow):
         self.exit_button.clicked.connect(self.exit_button_clicked)
 
         #define variables
-        self.clear_info()
-
-        self.physicalforms = {"Normal Human": 2,"Mutant-Induced": 1,"Mutant-Random": 1, 
-                             "Mutant-Breed": 1,"Android": 4,"Humanoid Race": 5,
-                             "Surgical Composite": 2,"Modified Human-Organic": 1,
-                             "Modified Human-Muscular": 1,"Modified Human-Skeletal": 1,
-                             "Modified Human-Extra Parts": 1,"Demihuman-Centaur": 5,
-                             "Demihuman-Equiman": 3,"Demihuman-Faun": 2,
-                             "Demihuman-Felinoid": 1,"Demihuman-Lupinoid": 4,
-                             "Demihuman-Avian": {"Angelic": 3, "Harpy": 2},
-                             "Demihuman-Chiropteran": 2,"Demihuman-Lamian": 3,
-                             "Demihuman-Merhuman": 2,"Demihuman-Other": 3,
-                             "Cyborg-Artificial limbs/organs": 4,"Cyborg-Exoskeleton": 4,
-                             "Cyborg-Mechanical Body": 4,"Cyborg-Mechanically Augmented": 3,
-                             "Robot-Human Shape": 4,"Robot-Usuform": 4,"Robot-Metamorphic": 4,
-                             "Robot-Computer": 4,"Angel/Demon": 5,"Deity": 5,
-                             "Animal": {"Terrestrial": 1, "Extraterrestrial": 5},
-                             "Vegetable": 1,"Abnormal Chemistry": 2,"Mineral": 2,
-                             "Gaseous": 5,"Liquid": 5,"Energy": 5,"Ethereal": 1,
-                             "Undead": 1,"Compound": 0,"Changeling": 5,"Collective Mass": 1}
-        
-        self.abilities = ["Fighting","Agility","Strength","Endurance","Reason",
-                          "Intuition","Psyche","Resources","Popularity"]
-        
-        self.ranks = ["Shift 0","Feeble","Poor","Typical","Good", "Excellent", 
-                      "Remarkable", "Incredible", "Amazing", "Monstrous", 
-                      "Unearthly", "Shift X", "Shift Y", "Shift Z", "Class 1000",
-                      "Class 3000", "Class 5000", "Beyond"]
-        
-        self.rank_scores = {"Shift 0": [0,0], "Feeble": [1,2], "Poor": [3,4], 
-                            "Typical": [5,6], "Good": [8,10], "Excellent": [16,20],
-                            "Remarkable": [26,30], "Incredible": [36,40], 
-                            "Amazing": [46,50], "Monstrous": [63,75], 
-                            "Unearthly": [88,100], "Shift X": [126,150], 
-                            "Shift Y": [176,200], "Shift Z": [351,500], 
-                            "Class 1000": [1000,1000], "Class 3000": [3000,3000],
-                            "Class 5000": [5000,5000], "Beyond": [10000,10000]}
-        
-        
+        self.character = engine.Character()
+        self.physicalforms = engine.physical_forms
+        self.abilities = engine.abilities
+        self.ranks = engine.ranks
+        self.rank_scores = engine.rank_scores
+        #the contact class the Select Contact list was filled from
+        self.contact_class = ""
 
         self.initUI()
 
@@ -204,9 +179,13 @@ class MainWindow(QMainWindow):
         foundation.addWidget(self.tab_widget)
         self.setup_physical_form_tab()
         self.setup_abilities_tab()
-        self.setup_powers_tab()
-        self.setup_talents_tab()
-        self.setup_contacts_tab()
+        #the Powers, Talents and Contacts tabs are built when they are first
+        #enabled (see build_tab)
+        self.built_tabs = {0, 1}
+        #the RecordListModels of the built tabs
+        self.list_models = []
+        self.tab_setups = {2: self.setup_powers_tab, 3: self.setup_talents_tab,
+                           4: self.setup_contacts_tab}
 
         #add the save and exit buttons to the bottom
         foundation.addLayout(bottom_buttons_layout)
@@ -246,24 +225,24 @@ class MainWindow(QMainWindow):
             QRadioButton{
                 font-size: 10pt;
             }
-            QLineEdit, QTextEdit, QListWidget{
+            QLineEdit, QTextEdit, QListView{
                 font-size: 11pt;
                 border: 2px inset gray;
             }                          
-            QListWidget:focus {
+            QListView:focus {
                 border: 2px solid #0078d4;
                 background-color: #ffffff;
             }
-            QListWidget::item:selected {
+            QListView::item:selected {
                 background-color: #f5f763;
                 color: black;
                 border-radius: 6px;
             }
-            QListWidget::item:selected:active {
+            QListView::item:selected:active {
                 background-color: #f5f763;
                 color: black;
             }
-            QListWidget::item:selected:!active {
+            QListView::item:selected:!active {
                 background-color: #f5f763;
                 color: black;
             }
@@ -364,7 +343,7 @@ class MainWindow(QMainWindow):
 
         #add the bonuses, penalties and weaknesses boxes to the last column
         self.watcher_image = QLabel()
-        self.watcher_pixmap = QPixmap(resource_path('images/watcher.jpg'))
+        self.watcher_pixmap = images.pixmap('watcher.jpg')
         self.watcher_image.setPixmap(self.watcher_pixmap)
         self.watcher_image.setFixedSize(500,65)
         bonuses_label = QLabel("Bonuses:")
@@ -421,7 +400,6 @@ class MainWindow(QMainWindow):
     def setup_abilities_tab(self):
         abilities = ["fighting","agility","strength","endurance",
                      "reason","intuition","psyche",""]
-        self.abilities_button_rolled = False
         
         #create layouts of the tab
         abilities_tab_layout = QHBoxLayout()
@@ -432,7 +410,7 @@ class MainWindow(QMainWindow):
         #create the Table layout
         #create the image
         self.cap_image = QLabel()
-        self.cap_pixmap = QPixmap("")
+        self.cap_pixmap = images.null_pixmap()
         self.cap_image.setFixedSize(270,140)
 
         #create the Table label and text box
@@ -461,7 +439,7 @@ class MainWindow(QMainWindow):
         #create the Primary Abilities layout
         #create the image and button
         self.ironman_image = QLabel()
-        self.ironman_pixmap = QPixmap("")
+        self.ironman_pixmap = images.null_pixmap()
         self.ironman_image.setFixedSize(350,140)
         self.abilities_button = QPushButton("  Roll Abilities\n         v")
         self.abilities_button.setIcon(QIcon(resource_path("images/dice.png")))
@@ -564,11 +542,11 @@ class MainWindow(QMainWindow):
         #create the Secondary layout
         #create the images
         self.bubble_image = QLabel()
-        self.bubble_pixmap = QPixmap("")
+        self.bubble_pixmap = images.null_pixmap()
         self.bubble_image.setPixmap(self.bubble_pixmap)
         self.bubble_image.setFixedSize(155,205)
         self.blackpanther_image = QLabel()
-        self.blackpanther_pixmap = QPixmap("")
+        self.blackpanther_pixmap = images.null_pixmap()
         self.blackpanther_image.setPixmap(self.blackpanther_pixmap)
         self.blackpanther_image.setFixedSize(250,305)
 
@@ -622,7 +600,7 @@ class MainWindow(QMainWindow):
                 res_pop_spacer_label1 = QLabel(ability)
                 res_pop_spacer_label1.setFixedSize(30,55)
                 res_pop_roll_group_layout.addWidget(res_pop_spacer_label1, 6, 1)
-            if ability == " ":
+            elif ability == " ":
                 res_pop_spacer_label2 = QLabel(ability)
                 res_pop_spacer_label2.setFixedSize(30,30)
                 res_pop_roll_group_layout.addWidget(res_pop_spacer_label2, 10, 1)
@@ -733,10 +711,10 @@ class MainWindow(QMainWindow):
 
         #create images
         self.villain_bubble_image = QLabel()
-        self.villain_bubble_pixmap = QPixmap("")
+        self.villain_bubble_pixmap = images.null_pixmap()
         self.villain_bubble_image.setFixedSize(255,125)
         self.villain_image = QLabel()
-        self.villain_pixmap = QPixmap("")
+        self.villain_pixmap = images.null_pixmap()
         self.villain_image.setFixedSize(350,200)
         
         self.roll_power_button = QPushButton(" Roll Power\n      v")
@@ -764,10 +742,16 @@ class MainWindow(QMainWindow):
         self.add_power_button.setEnabled(False)
         self.add_power_button.clicked.connect(self.add_power)
         powers_label = QLabel("Powers:")
-        self.powers_listbox = QListWidget()
+        self.powers_model = RecordListModel(lambda: self.character.powers,
+                                            lambda power: self.character.power_text(power),
+                                            lambda row: self.character.powers[row]["locked"],
+                                            row_height=22, parent=self)
+        self.list_models.append(self.powers_model)
+        self.powers_listbox = QListView()
+        self.powers_listbox.setModel(self.powers_model)
         self.powers_listbox.setFixedSize(450,254)
-        self.powers_listbox.itemClicked.connect(self.powers_list_selected)
-        self.powers_listbox.itemActivated.connect(self.powers_list_selected)
+        self.powers_listbox.clicked.connect(self.powers_list_selected)
+        self.powers_listbox.activated.connect(self.powers_list_selected)
         self.num_powers_label = QLabel(" ")#leave blank until number of powers is rolled
         self.num_powers_label.setStyleSheet("font-size: 12px;")
         self.num_powers_label.setFixedSize(450,70)
@@ -865,27 +849,31 @@ class MainWindow(QMainWindow):
         
         #right column
         talents_label = QLabel("Talents:")
-        self.talents_listbox = QListWidget()
+        self.talents_model = RecordListModel(lambda: self.character.talents,
+                                             lambda talent: talent["name"], parent=self)
+        self.list_models.append(self.talents_model)
+        self.talents_listbox = QListView()
+        self.talents_listbox.setModel(self.talents_model)
         self.talents_listbox.setFixedSize(375,300)
         self.talents_listbox.setEnabled(False)
         self.num_talents_label = QLabel(" ")#leave blank until number of talents are rolled
         self.num_talents_label.setStyleSheet("font-size: 12px;")
         self.num_talents_label.setAlignment(Qt.AlignmentFlag.AlignTop)
         self.num_talents_label.setFixedSize(375,20)
-        self.talents_listbox.itemClicked.connect(self.talent_list_selected)
-        self.talents_listbox.itemActivated.connect(self.talent_list_selected)
+        self.talents_listbox.clicked.connect(self.talent_list_selected)
+        self.talents_listbox.activated.connect(self.talent_list_selected)
 
         #create the images
         self.talent_image = QLabel()
-        self.talent_pixmap = QPixmap("")
+        self.talent_pixmap = images.null_pixmap()
         self.talent_image.setPixmap(self.talent_pixmap)
         self.talent_image.setFixedSize(325,222)
         self.talent2_image = QLabel()
-        self.talent2_pixmap = QPixmap("")
+        self.talent2_pixmap = images.null_pixmap()
         self.talent2_image.setPixmap(self.talent2_pixmap)
         self.talent2_image.setFixedSize(325,330)
         self.talent3_image = QLabel()
-        self.talent3_pixmap = QPixmap("")
+        self.talent3_pixmap = images.null_pixmap()
         self.talent3_image.setPixmap(self.talent3_pixmap)
         self.talent3_image.setFixedSize(375,130)
 
@@ -949,20 +937,26 @@ class MainWindow(QMainWindow):
 
         #Right column
         contacts_label = QLabel("Contacts:")
-        self.contacts_listbox = QListWidget()
+        self.contacts_model = RecordListModel(lambda: self.character.contacts,
+                                              lambda contact: contact["name"],
+                                              lambda row: self.character.contacts[row]["locked"],
+                                              row_height=22, parent=self)
+        self.list_models.append(self.contacts_model)
+        self.contacts_listbox = QListView()
+        self.contacts_listbox.setModel(self.contacts_model)
         self.contacts_listbox.setEnabled(False)
         self.num_contacts_label = QLabel(" ")#leave blank until number of talents are rolled
         self.num_contacts_label.setStyleSheet("font-size: 12px;")
-        self.contacts_listbox.itemClicked.connect(self.contact_list_selected)
-        self.contacts_listbox.itemActivated.connect(self.contact_list_selected)
+        self.contacts_listbox.clicked.connect(self.contact_list_selected)
+        self.contacts_listbox.activated.connect(self.contact_list_selected)
 
         #create the images
         self.contact_image = QLabel()
-        self.contact_pixmap = QPixmap("")
+        self.contact_pixmap = images.null_pixmap()
         self.contact_image.setPixmap(self.contact_pixmap)
         self.contact_image.setFixedSize(325,285)
         self.contact2_image = QLabel()
-        self.contact2_pixmap = QPixmap("")
+        self.contact2_pixmap = images.null_pixmap()
         self.contact2_image.setPixmap(self.contact2_pixmap)
         self.contact2_image.setFixedSize(390,285)
 
@@ -987,6 +981,31 @@ class MainWindow(QMainWindow):
 
 
 
+    def tab_built(self, index):
+        return index in self.built_tabs
+
+
+
+    #build a tab's widgets the first time it is needed; until then the
+    #handlers only change self.character, so the new tab is filled in from it
+    def build_tab(self, index):
+        if self.tab_built(index):
+            return
+        self.built_tabs.add(index)
+        self.tab_setups[index]()
+        if index == 2:
+            self.show_powers()
+        elif index == 4:
+            self.show_contacts()
+
+
+
+    def enable_tab(self, index):
+        self.build_tab(index)
+        self.tab_widget.setTabEnabled(index, True)
+
+
+
     def setupTextBox(self, textbox, x, y, align):
         textbox.setReadOnly(True)
         textbox.setFixedSize(x, y)
@@ -998,30 +1017,13 @@ class MainWindow(QMainWindow):
 ################### USER INTERACTION FUNTIONS ###################
     #click the Physical Form Random button
     def physical_form_random(self):
-        formindex = self.physical_form_roll()
+        formindex = engine.physical_form_roll(self.character.rng)
         self.physical_form_list.setCurrentRow(formindex)
         #continue to physical_form_list_selected to fill in the other textboxes
         item = self.physical_form_list.currentItem()
         self.physical_form_list_selected(item)
 
 
-    def physical_form_roll(self):
-        roll = randint(1, 100)
-        #map roll ranged to indices in the physical form list
-        #roll_ranges = [(roll, index),...]
-        roll_ranges = [
-            (27, 0), (31, 1), (34, 2), (36, 3), (39, 4), (47, 5), (50, 7),
-            (52, 8), (54, 9), (58, 10), (59, 11), (60, 12), (61, 13), (63, 14),
-            (65, 15), (67, 16), (68, 17), (69, 18), (70, 19), (73, 21), (75, 22),
-            (77, 23), (80, 24), (83, 25), (85, 26), (86, 27), (87, 28), (88, 29),
-            (89, 30), (90, 31), (91, 32), (92, 33), (93, 34), (94, 35), (95, 36),
-            (96, 37), (97, 38), (98, 39), (99, 40), (100, 41), (101, 42)
-        ]
-        for threshold, index in roll_ranges:
-            if roll < threshold:
-                return index
-
-
 
     #click the Physical Form List or continue from using the Random button
     def physical_form_list_selected(self, item):
@@ -1034,11 +1036,7 @@ class MainWindow(QMainWindow):
         self.notes_textbox.clear()
         self.options_list.setEnabled(False)
         self.compound_list.setEnabled(False)
-        self.physicalforms["Compound"] = 0
-        self.abilities_button_rolled = False
         self.std_rank_scores_action.setDisabled(False)
-        #clear bonus attributes
-        self.clear_info()
         #clear attribute tab boxes; disable bonus buttons
         self.table_text_box.clear()
         for ability, inputs in self.ability_inputs.items():
@@ -1058,401 +1056,83 @@ class MainWindow(QMainWindow):
             inputs["bonus"].clear()
             inputs["rank"].clear()
             inputs["score"].clear()
-        self.roll_power_classes_button.setEnabled(False)
-        self.power_classes_listbox.clear()
-        self.power_classes_listbox.setEnabled(False)
-        self.buy_power_button.setEnabled(False)
-        self.remove_power_button.setEnabled(False)
-        self.num_powers_label.setText("")
-        self.roll_power_button.setEnabled(False)
-        self.power_textbox.clear()
-        self.add_power_button.setEnabled(False)
-        self.bonus_powers_listbox.clear()
-        self.optional_powers_listbox.clear()
-        self.powers_listbox.clear()
-        self.powers_listbox.setEnabled(False)
-        self.powers_weakness_textbox.clear()
-        self.generate_weakness_button.setEnabled(False)
-        self.roll_talent_classes_button.setEnabled(False)
-        self.talent_classes_listbox.clear()
-        self.buy_talent_button.setEnabled(False)
-        self.remove_talent_button.setEnabled(False)
-        self.talents_listbox.clear()
-        self.talents_listbox.setEnabled(False)
-        self.contacts_classes_listbox.clear()
-        self.contacts_classes_listbox.setEnabled(False)
-        self.roll_contact_classes_button.setEnabled(False)
-        self.select_contact_listbox.clear()
-        self.select_contact_listbox.setEnabled(False)
-        self.contacts_listbox.clear()
-        self.contacts_listbox.setEnabled(False)
-        self.buy_contact_button.setEnabled(False)
-        self.num_powers_label.setText("")
-        self.num_talents_label.setText("")
-        self.num_contacts_label.setText("")
+        #clear the Powers, Talents and Contacts tabs if they have been built
+        if self.tab_built(2):
+            self.roll_power_classes_button.setEnabled(False)
+            self.power_classes_listbox.clear()
+            self.power_classes_listbox.setEnabled(False)
+            self.buy_power_button.setEnabled(False)
+            self.remove_power_button.setEnabled(False)
+            self.num_powers_label.setText("")
+            self.roll_power_button.setEnabled(False)
+            self.power_textbox.clear()
+            self.add_power_button.setEnabled(False)
+            self.bonus_powers_listbox.clear()
+            self.optional_powers_listbox.clear()
+            self.powers_listbox.setEnabled(False)
+            self.powers_weakness_textbox.clear()
+            self.generate_weakness_button.setEnabled(False)
+        if self.tab_built(3):
+            self.roll_talent_classes_button.setEnabled(False)
+            self.talent_classes_listbox.clear()
+            self.buy_talent_button.setEnabled(False)
+            self.remove_talent_button.setEnabled(False)
+            self.talents_listbox.setEnabled(False)
+            self.num_talents_label.setText("")
+        if self.tab_built(4):
+            self.contacts_classes_listbox.clear()
+            self.contacts_classes_listbox.setEnabled(False)
+            self.roll_contact_classes_button.setEnabled(False)
+            self.select_contact_listbox.clear()
+            self.select_contact_listbox.setEnabled(False)
+            self.contacts_listbox.setEnabled(False)
+            self.buy_contact_button.setEnabled(False)
+            self.num_contacts_label.setText("")
         self.tab_widget.setTabEnabled(2, False)
         self.tab_widget.setTabEnabled(3, False)
         self.tab_widget.setTabEnabled(4, False)
 
+        #start a new character with the physical form; this also rolls the
+        #origin of power and the physical form's bonuses, penalties, etc.
+        index = self.physical_form_list.row(item)
+        self.character = engine.Character()
+        self.character.std_rank_scores = int(self.std_rank_scores_action.isChecked())
+        self.character.select_physical_form(index)
+        self.bind_character()
+        self.origin_textbox.setText(self.character.origin)
+        for model in self.list_models:
+            model.refresh()
 
-        #origin of power
-        originRoll = randint(1,100)
-        if originRoll < 11:
-            self.origin_textbox.setText("Natal")
-        elif originRoll < 21:
-            self.origin_textbox.setText("Maturity")
-        elif originRoll < 31:
-            self.origin_textbox.setText("Self-Achievement")
-        elif originRoll < 36:
-            self.origin_textbox.setText("Endowment")
-        elif originRoll < 51:
-            self.origin_textbox.setText("Technical Mishap")
-        elif originRoll < 61:
-            self.origin_textbox.setText("Technical Procedure")
-        elif originRoll < 66:
-            self.origin_textbox.setText("Creation")
-        elif originRoll < 77:
-            self.origin_textbox.setText("Biological Exposure")
-        elif originRoll < 88:
-            self.origin_textbox.setText("Chemical Exposure")
-        elif originRoll < 99:
-            self.origin_textbox.setText("Energy Exposure")
-        else:
-            self.origin_textbox.setText("Rebirth")
+        self.physical_form_info(index)
 
-        self.physical_form_info(item, chance=100)
-
-
-
-    def physical_form_info(self, item, chance):
-        # Get the parent QListWidget of the selected item
-        # to get the index of the selected item
-        index = item.listWidget().row(item)
-        print(f"Chance: {chance}")
-
-        bonus1 = {
-            0: {"text": "Normal Humans get +1CS Resources; ", "effects": {"resources_bonus": 1}},
-            1: {"text": "Induced Mutants can raise any one Primary Ability +1CS; ", "effects": {"ability_bonus": 1}},
-            2: {"text": "Endurance is raised +1CS; ", "effects": {"endurance_bonus": 1}},
-            3: {"text": "Endurance is raised +1CS; ", "effects": {"endurance_bonus": 1}},
-            4: {"text": "Androids may raise any one Ability +1CS; ", "effects": {"ability_bonus": 1}},
-            5: {"text": "Can raise any one Ability +1CS; ", "effects": {"ability_bonus": 1}},
-            6: {"text": "Strength, Fighting, and Endurance are all increased +1CS; ", "effects": {"fighting_bonus": 1, "strength_bonus": 1, "endurance_bonus": 1}},
-            8: {"text": "Musculars gain +1CS Strength and Endurance; ", "effects": {"strength_bonus": 1, "endurance_bonus": 1}},
-            11: {"text": "Demihuman-Centaurs get +1 Strength; ", "effects": {"strength_bonus": 1}},
-            19: {"text": "Merhumans gain +1CS Popularity; ", "effects": {"popularity_bonus": 1}},
-            28: {"text": "+2CS Reason; ", "effects": {"reason_bonus": 2}},
-            29: {"text": "All Physical Abilities (FASE) are raised +1CS; ", "effects": {"fighting_bonus": 1, "agility_bonus": 1, "strength_bonus": 1, "endurance_bonus": 1}},
-            30: {"text": "All primary abilities (FASERIP) are raised +2CS; ", "effects": {"fighting_bonus": 2, "agility_bonus": 2, "strength_bonus": 2, "endurance_bonus": 2, "reason_bonus": 2, "intuition_bonus": 2, "psyche_bonus": 2}},
-            32: {"text": "Plants gain +2CS Endurance; ", "effects": {"endurance_bonus": 2}},
-            33: {"text": "Endurance is raised +1CS; ", "effects": {"endurance_bonus": 1}},
-            34: {"text": "Initial Health is doubled; ", "effects": {"health_multiplier": 1}},
-            38: {"text": "Physical attacks have a decreased effect on Ethereals (-9CS); ", "effects": {}},
-            39: {"text": "Strength and Endurance are increased by +1CS; ", "effects": {"strength_bonus": 1, "endurance_bonus": 1}},
-            42: {"text": "A Collective Mass gains +2CS Resistance to physical or directed energy attacks (lasers, for example); ", "effects": {}},
-        }
-
-        bonus2 = {
-            2: {"text": "Random Mutants gain +1 Power; ", "effects": {"power_bonus": 1}},
-            3: {"text": "Intuition is raised +1CS; ", "effects": {"intuition_bonus": 1}},
-            4: {"text": "Androids gain +1 Power; ", "effects": {"power_bonus": 1}},
-            28: {"text": "+1CS Resources; ", "effects": {"resources_bonus": 1}},
-            30: {"text": "+2 Powers; ", "effects": {"power_bonus": 2}},
-        }
-
-        penalty1 = {
-            2: {"text": "Random Mutants start with -1CS Resources; ", "effects": {"resources_bonus": -1}},
-            4: {"text": "Popularity is initially lowered -1CS; ", "effects": {"popularity_bonus": -1}},
-            5: {"text": "Starting Resources are set at Poor; ", "effects": {"pf_resources_rank": 2}},
-            6: {"text": "Starting Resources are set at Poor; ", "effects": {"pf_resources_rank": 2}},
-            7: {"text": "All Modified Humans gain -1 Power initially; ", "effects": {"power_bonus": -1}},
-            8: {"text": "All Modified Humans gain -1 Power initially; ", "effects": {"power_bonus": -1}},
-            9: {"text": "All Modified Humans gain -1 Power initially; ", "effects": {"power_bonus": -1}},
-            10: {"text": "All Modified Humans gain -1 Power initially; ", "effects": {"power_bonus": -1}},
-            11: {"text": "Centaurs have Feeble Climbing ability; ", "effects": {}},
-            13: {"text": "Popularity set to 0; gains Popularity more slowly than other Demihumans; ", "effects": {"pf_popularity_rank": 0}},
-            15: {"text": "-1CS Popularity; ", "effects": {"popularity_bonus": -1}},
-            17: {"text": "Initial Popularity is Feeble; ", "effects": {"pf_popularity_rank": 1}},
-            18: {"text": "Initial Popularity is 0; ", "effects": {"pf_popularity_rank": 0}},
-            21: {"text": "-1CS Intuition; ", "effects": {"intuition_bonus": -1}},
-            23: {"text": "-1CS Intuition and Psyche; ", "effects": {"intuition_bonus": -1, "psyche_bonus": -1}},
-            24: {"text": "Augmenteds receive -1 Power; ", "effects": {"power_bonus": -1}},
-            25: {"text": "Popularity set to 0; ", "effects": {"pf_popularity_rank": 0}},
-            28: {"text": "Fighting is decreased -1CS; ", "effects": {"fighting_bonus": -1}},
-            30: {"text": "0 Popularity with the hierarchy of the major established Earth religions; ", "effects": {}},
-            31: {"text": "Animals have -1 Power; ", "effects": {"power_bonus": -1}},
-            32: {"text": "Plants have -2CS Fighting; ", "effects": {"fighting_bonus": -2}},
-            34: {"text": "Movement rate is decreased -1CS; ", "effects": {}},
-            35: {"text": "Gas Bodies have 0 Resources and no initial Contacts; ", "effects": {"pf_resources_rank": 0, "initial_contacts": 0}},
-            38: {"text": "Fighting rank is zero in the Earth Dimension, unless the Ethereal is fighting another Ethereal; ", "effects": {}},
-            40: {"text": "-1CS Popularity; ", "effects": {"popularity_bonus": -1}},
-        }
-
-        notes1 = {
-            3: {"text": "Breed Mutants must have at least one Contact, usually their tribe; ", "effects": {"initial_contacts": 2, "contact": "Breed Mutant's tribe"}},
-            4: {"text": "Androids have at least one Contact, the lab tech or scientist who created them; ", "effects": {"initial_contacts": 2, "contact": "Android's creator"}},
-            5: {"text": "A Humanoid starts out with only one Contact, his race; ", "effects": {"initial_contacts": 1, "contact": "Humanoid's race"}},
-            6: {"text": "Composites heal twice as quickly as Normal Humans; ", "effects": {}},
-            7: {"text": "Organics heal twice as fast as Normal Humans; ", "effects": {}},
-            9: {"text": "Skeletals gain +1CS Resistance to Physical Attacks; ", "effects": {}},
-            11: {"text": "Can move quickly over horizontal ground (4 areas/turn), and can fight with their hooves; ", "effects": {}},
-            12: {"text": "Kicking does +1CS damage; ", "effects": {}},
-            13: {"text": "Feeble Mental Domination over females of any human(oid) race; ", "effects": {}},
-            14: {"text": "A felinoid can see in the dark with Excellent night vision; ", "effects": {}},
-            15: {"text": "A lupinoid possesses an Excellent sense of smell; ", "effects": {}},
-            17: {"text": "Chiropterans possess the Power of Active Sonar at Good rank; ", "effects": {}},
-            18: {"text": "Venomous (Excellent Intensity poison); ", "effects": {}},
-            19: {"text": "Merhumans possess both lungs and gills, but can only stay away from water a limited time because their bodies quickly dry out. Movement on dry land is limited to crawling or dependence on vehicles. Merhumans also possess Water Freedom; ", "effects": {}},
-            20: {"text": "A player can combine any animal with a human to create a new Demihuman, then work with the Judge to provide it with reasonable statistics; ", "effects": {}},
-            21: {"text": "At least one Contact must be either the lab or hospital that created him or a facility that provides maintenance services; ", "effects": {"initial_contacts": 2, "contact": "Lab or hospital responsible for creating or maintaining the cyborg"}},
-            23: {"text": "Monstrous Resistance to Disease and Poisons of all sorts; ", "effects": {}},
-            25: {"text": "The average Human Shape Robot weighs 500 to 2,000 pounds; ", "effects": {}},
-            27: {"text": "Generate separate Physical abilities for each form and assign Powers to either or multiple forms. Metamorphs have a minimum of two forms. -1CS to all Primary Abilities for each additional form; ", "effects": {}},
-            28: {"text": "Assume that all sentient computers have a minimum of one remotely controlled industrial robot. The owners think this robot is only used for self-maintenance and experimentation; Loss of all electrical power to the mainframe causes deactivation and loss of some of the computer's abilities and all of its Karma. Abilities and Powers are reduced -1CS across the board; ", "effects": {}},
-            29: {"text": "Angels and demons have no initial Contacts but will soon be sought out by groups who see them as symbols or tools; ", "effects": {"initial_contacts": 0}},
-            30: {"text": "Deities cannot really die in the Earth Dimension unless the slayer is another deity. Each deity has a home dimension; on that plane the deity loses his special protection from death; ", "effects": {}},
-            31: {"text": "Animals automatically have two Detection Powers at Good rank; ", "effects": {"animal_detection": 1}},
-            32: {"text": "Plants have 0 Resources; ", "effects": {"pf_resources_rank": 0}},
-            34: {"text": "Mineral Life is immune to all Poisons and Diseases that harm Normal Humans; ", "effects": {}},
-            35: {"text": "Gas Bodies possess a natural form of Phasing that permits them to penetrate solids; ", "effects": {}},
-            36: {"text": "If the liquid life possesses Endurance and Psyche ranks of Excellent or better, the Fluid Body can form an erect simulation of a human body; ", "effects": {}},
-            37: {"text": "Energy Beings have a Bonus Power of Energy Emission. Energy Control is an Optional Power; ", "effects": {"energy_form": 1}},
-            38: {"text": "The visibility of an Ethereal varies according to their whim; They can be invisible, transparent, translucent, or opaque; ", "effects": {}},
-            39: {"text": "Special means are required to maintain the reunion of mind and body. This can be anything from being frequently re-embalmed to utilizing any of the Vampiric Powers. If the Undead fails to follow his required - maintenance procedures, he begins to fall apart. In Undead terms, this is what Health points are used for. Health is the structural integrity of the Undead's own corpse.; ", "effects": {}},
-            40: {"text": "Click each Compound form to determine which Table to use to roll Abilities and which Bonuses, Penalties, etc. are part of the Compound Form; ", "effects": {}},
-            41: {"text": "Rolled Abilities are the base rank and score. Any Bonuses, Penalties, etc. only apply when the Changeling is in that form; Powers can be assigned to any or all Aspects. Each Aspect must have a unique Power not shared with other Aspects; ", "effects": {}},
-            42: {"text": "Because of its peculiar dual nature, a Collective Mass has two sets of primary abilities. The first set represents the average abilities possessed by the individual component entities; the second set is that of the Collective Mass. The majority of powers can only be manifested by the Collective Mass. Individual entities can at best exhibit Feeble-rank versions of the available powers; Ordinarily, the number of individuals composing the Collective Mass is less than the rank number of the Collective Mass's Reason, multiplied by 100; ", "effects": {}},
-        }
-
-        notes2 = {
-            6: {"text": "The Composite initially possesses one Contact - the hospital or person responsible for their creation; ", "effects": {"initial_contacts": 1, "contact": "hospital/person responsible for the character's creation"}},
-            7: {"text": "At least one Contact should be the organization responsible for the modification; ", "effects": {"initial_contacts": 2, "contact": "organization responsible for the modification of the character"}},
-            8: {"text": "At least one Contact should be the organization responsible for the modification; ", "effects": {"initial_contacts": 2, "contact": "organization responsible for the modification of the character"}},
-            9: {"text": "At least one Contact should be the organization responsible for the modification; ", "effects": {"initial_contacts": 2, "contact": "organization responsible for the modification of the character"}},
-            10: {"text": "At least one Contact should be the organization responsible for the modification; ", "effects": {"initial_contacts": 2, "contact": "organization responsible for the modification of the character"}},
-            14: {"text": "A felinoid possesses +1CS Climbing ability; ", "effects": {}},
-            18: {"text": "Lamians are difficult to bind (+1CS to escape); ", "effects": {}},
-            23: {"text": "Mech Bodies initially have only one Contact—the lab where they were created; ", "effects": {"initial_contacts": 1, "contact": "lab where character was created"}},
-            30: {"text": "Deities eventually attract any remaining living worshippers they still have. All of these people serve as Contacts; ", "effects": {}},
-            31: {"text": "Animals have to have a human Contact; ", "effects": {"initial_contacts": 2, "contact": "Human contact"}},
-            32: {"text": "Plants automatically possess Absorption Power of Good rank in the form of enhanced photosynthesis; ", "effects": {}},
-            35: {"text": "The Gas Body is a coherent cloud that retains its integrity even in the face of Amazing Intensity winds; ", "effects": {}},
-            36: {"text": "Fluid Bodies have a natural variation of Phasing that permits them to permeate any porous material; ", "effects": {}},
-            37: {"text": "Physical contact with an Energy Being does Feeble damage; The Energy Body possesses an Intensity rank of its own; Energy Bodies composed of visible energy types can create a ghost-like image of a human. If the Energy Body possesses Alter Ego, Energy Solidification, or Lifeform Creation, it can form a solid facsimile of a human; ", "effects": {}},
-            38: {"text": "While Ethereals are intangible on the Earth Dimension, they regain solidity in other Dimensions. In such realms Ethereals are vulnerable to all Powers except those that specifically affect Ethereals and other disembodied beings - these Powers are Spirit Summoning and Storage, Reincarnation, and Exorcism; ", "effects": {}}
-        }
-
-        notes3 = {
-            30: {"text": "Deities automatically possess at least one Travel Power; ", "effects": {"deity_travel_power": 1}},
-            31: {"text": "Resources are zero unless the animal has attached himself to a human. In this case, the Resource rank is assigned to that human; ", "effects": {}},
-            32: {"text": "Plants have no initial Contacts; the exception is if the Plant was created by scientific means, in which case its creator might be a Contact; ", "effects": {"initial_contacts": 0}},
-            35: {"text": "The only way to destroy a Gas Body is to alter its composition through Powers like Matter Conversion and Matter Control; ", "effects": {}},
-            36: {"text": "Fluid Bodies have no initial Contacts except their own race, if one exists; ", "effects": {"initial_contacts": 0}},
-            37: {"text": "The only way to destroy an Energy Body is to completely Negate or solidify its energy; ", "effects": {}}
-        }
-
-        weakness1 = {
-            6: {"text": "Resistance to Mental Domination is reduced -1CS; ", "effects": {}},
-            23: {"text": "Prone to things that never harm a flesh-bound character, like Magnetic attacks and rust; ", "effects": {}},
-            28: {"text": "Computers have a decreased Resistance to Electrical and Magnetic Attacks and also to Phasing; ", "effects": {}},
-            29: {"text": "Such beings possess a Psychological Weakness that Negates their Power; ", "effects": {}},
-            32: {"text": "Prolonged deprivation of light and water reduces the hero's Strength and Endurance -1CS per day after an initial three days; ", "effects": {}},
-            34: {"text": "Mineral Life is vulnerable to attacks with special effects on the body materials. For example, an iron golem is prone to rust; ", "effects": {}},
-            35: {"text": "Cannot freely move in a vacuum unless it possesses a Travel or Energy Power; ", "effects": {}},
-            36: {"text": "If the Fluid Body is frozen, the character is immobilized until they can melt. Vaporization is a fatal act for most Fluid Bodies; ", "effects": {}},
-            37: {"text": "Energy Bodies possess a special vulnerability to Plasma Control (-1CS Resistance); ", "effects": {}},
-            38: {"text": "Spirit Vampirism completely destroys Ethereals. Psi-Vampirism destroys the self-image and reduces the Ethereal to a mindless Poltergeist; ", "effects": {}},
-            39: {"text": "Undead possess a Psychological Weakness; their Power is negated within 10' of a religious symbol. If the symbol is that of a religion the Undead practiced while alive, they suffer Excellent damage; ", "effects": {}},
-            42: {"text": "A successful Grappling attack breaks the body into two masses. The body can automatically rejoin in 1-4 turns unless something prevents this; ", "effects": {}}
-        }
-
-        # Apply bonuses
-        if index in bonus1 and randint(1, 100) <= chance:
-            bonus = bonus1[index]
-            self.bonuses_textbox.insertPlainText(bonus["text"])
-            for attr, value in bonus["effects"].items():
-                setattr(self, attr, getattr(self, attr) + value)
-
-        if index in bonus2 and randint(1, 100) <= chance:
-            bonus = bonus2[index]
-            self.bonuses_textbox.insertPlainText(bonus["text"])
-            for attr, value in bonus["effects"].items():
-                setattr(self, attr, getattr(self, attr) + value)
-
-        # Apply penalties
-        if index in penalty1 and randint(1, 100) <= chance:
-            penalty = penalty1[index]
-            self.penalties_textbox.insertPlainText(penalty["text"])
-            for attr, value in penalty["effects"].items():
-                # Determine if physical form sets the value or modifies it
-                if attr.startswith("pf_") or attr == "initial_contacts":
-                    setattr(self, attr, value)
-                else:
-                    setattr(self, attr, getattr(self, attr) + value)
-
-        # Add notes
-        if index in notes1 and randint(1, 100) <= chance:
-            print(f"notes1, index:{index}")
-            note = notes1[index]
-            print(f"notes1, note:{note}")
-            if index == 18:
-                venomous = randint(0,1)
-                if venomous:
-                    self.notes_textbox.insertPlainText(note["text"])
-            else:
-                self.notes_textbox.insertPlainText(note["text"])
-            # Handle initial contacts - if any initial contacts values are present from physical form then add them to the contact list
-            if "initial_contacts" in notes1[index]["effects"]:
-                self.initial_contacts = notes1[index]["effects"]["initial_contacts"]
-            if self.initial_contacts > 0:
-                note = notes1[index]
-                item = QListWidgetItem(note["effects"]["contact"])
-                item.setSizeHint(QSize(0, 22))
-                self.contacts_listbox.addItem(item)
-                contact_item = self.contacts_listbox.item(self.contacts_listbox.count() - 1)
-                contact_item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEnabled)
-            for attr, value in notes1[index]["effects"].items():
-                print(f"notes1 effects: {attr} = {value}")
-                setattr(self, attr, value)
-        if index in notes2 and randint(1, 100) <= chance:
-            note = notes2[index]
-            self.notes_textbox.insertPlainText(note["text"])
-            # Handle initial contacts - if any initial contacts values are present from physical form then add them to the contact list
-            if "initial_contacts" in notes2[index]["effects"]:
-                self.initial_contacts = notes2[index]["effects"]["initial_contacts"]
-            if self.initial_contacts > 0:
-                item = QListWidgetItem(note["effects"]["contact"])
-                item.setSizeHint(QSize(0, 22))
-                self.contacts_listbox.addItem(item)
-                contact_item = self.contacts_listbox.item(self.contacts_listbox.count() - 1)
-                contact_item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEnabled)
-        if index in notes3 and randint(1, 100) <= chance:
-            note = notes3[index]
-            self.notes_textbox.insertPlainText(note["text"])
-            if index == 30:
-                self.deity_travel_power = 1
-            if "initial_contacts" in notes3[index]["effects"]:#for Vegetables/Plants, Liquids
-                self.initial_contacts = notes3[index]["effects"]["initial_contacts"]
-        if index in weakness1 and randint(1, 100) <= chance:
-            weakness = weakness1[index]
-            self.weakness_textbox.insertPlainText(weakness["text"])
-
-
-        bonus3_chance = randint(1,100)
-        print(f"Physical Form Info bonus3= {bonus3_chance}")
-        if bonus3_chance <= chance:
-            #Bonuses Pt3
-            if index == 30: # Deity
-                self.bonuses_textbox.insertPlainText("+2CS Popularity with the public; ")
-
-
-        penalty2_chance = randint(1,100)
-        print(f"Physical Form Info penalty2= {penalty2_chance}")
-        if penalty2_chance <= chance:
-            #Penalties Pt2
-            if index == 6: # Surgical Composites
-                self.penalties_textbox.insertPlainText("Popularity is set to 0; ")
-                self.pf_popularity_rank = 0
-
-
-        weakness2_chance = randint(1,100)
-        print(f"Physical Form Info weakness2= {weakness2_chance}")
-        if weakness2_chance <= chance:
-            #Weaknesses Pt2
-            if index == 37: # Energy
-                self.weakness_textbox.insertPlainText("Energy Bodies can be contained"
-                                                    " within special storage "
-                                                    "batteries; this is the only "
-                                                    "way to immobilize these beings; ")
 
 
+    #display the bonuses, penalties, etc. of the physical form (or compound
+    #form) at index and the options/compound forms the user must choose from
+    def physical_form_info(self, index):
+        self.show_physical_form_text()
+        self.show_contacts()
 
         #Physical Form Options
-        if index == 10: # Modified Human-Extra Parts
-            item = QListWidgetItem("Extra arms raise Fighting +1CS")
-            item.setSizeHint(QSize(0, 21))
-            self.options_list.addItem(item)
-            item = QListWidgetItem("Duplicate organs doubles Health")
-            item.setSizeHint(QSize(0, 21))
-            self.options_list.addItem(item)
-            item = QListWidgetItem("Tails give the hero +1 attack")
-            item.setSizeHint(QSize(0, 21))
-            self.options_list.addItem(item)
-            item = QListWidgetItem("Wings give the hero Flight")
-            item.setSizeHint(QSize(0, 21))
-            self.options_list.addItem(item)
-            item = QListWidgetItem("Extra legs give +1 area movement")
-            item.setSizeHint(QSize(0, 21))
-            self.options_list.addItem(item)
-            item = QListWidgetItem("Antennae give a Detection Power")
-            item.setSizeHint(QSize(0, 21))
-            self.options_list.addItem(item)
-            item = QListWidgetItem("Horns give +1CS to Charging")
-            item.setSizeHint(QSize(0, 21))
-            self.options_list.addItem(item)
-            self.options_list.setEnabled(True)
-            self.watcher_image.setPixmap(self.watcher_pixmap)
-        elif index == 16: # Demihuman-Avian
-            self.options_list.addItem("Angelic")
-            self.options_list.addItem("Harpy")
-            self.options_list.setEnabled(True)
-            self.watcher_pixmap = QPixmap(resource_path('images/watcher_options.jpg'))
-            self.watcher_image.setPixmap(self.watcher_pixmap)
-        elif index == 24: # Cyborg-Mechanically Augmented
-            self.options_list.addItem("Resources are Good")
-            self.options_list.addItem("Resources are optionally rolled")
-            self.options_list.setEnabled(True)
-            self.watcher_pixmap = QPixmap(resource_path('images/watcher_options.jpg'))
-            self.watcher_image.setPixmap(self.watcher_pixmap)
-        elif index == 27: # Robot-Metamorphic
-            item = QListWidgetItem("2 forms")
-            item.setSizeHint(QSize(0, 22))
-            self.options_list.addItem(item)
-            item = QListWidgetItem("3 forms")
-            item.setSizeHint(QSize(0, 22))
-            self.options_list.addItem(item)
-            item = QListWidgetItem("4 forms")
-            item.setSizeHint(QSize(0, 22))
-            self.options_list.addItem(item)
-            item = QListWidgetItem("5 forms")
-            item.setSizeHint(QSize(0, 22))
-            self.options_list.addItem(item)
-            self.options_list.setEnabled(True)
-            self.watcher_pixmap = QPixmap(resource_path('images/watcher_options.jpg'))
-            self.watcher_image.setPixmap(self.watcher_pixmap)
-        elif index == 29: # Angel / Demon
-            self.options_list.addItem("Angel")
-            self.options_list.addItem("Demon")
-            self.options_list.setEnabled(True)
-            self.watcher_pixmap = QPixmap(resource_path('images/watcher_options.jpg'))
-            self.watcher_image.setPixmap(self.watcher_pixmap)
-        elif index == 31: # Animal
-            self.options_list.addItem("Terrestrial Animal")
-            self.options_list.addItem("Extraterrestrial Animal")
+        if index in engine.form_options:
+            for option in self.character.form_options:
+                item = QListWidgetItem(option)
+                item.setSizeHint(QSize(0, 22))
+                self.options_list.addItem(item)
             self.options_list.setEnabled(True)
-            self.watcher_pixmap = QPixmap(resource_path('images/watcher_options.jpg'))
+            self.watcher_pixmap = images.pixmap('watcher_options.jpg')
             self.watcher_image.setPixmap(self.watcher_pixmap)
 
         #Changeling/Compound Form List
         if index == 40 or index == 41: # Compound and Changeling
             self.compound_list.setEnabled(True)
-            self.watcher_pixmap = QPixmap(resource_path('images/watcher_compound.jpg'))
+            self.watcher_pixmap = images.pixmap('watcher_compound.jpg')
             self.watcher_image.setPixmap(self.watcher_pixmap)
-            num = self.number_of_compoundforms()
-            self.compound_forms = num
-            while num > 0:
-                formindex = self.physical_form_roll()
-                #do not allow Metamorphic Robots or Compound\Changelings to be 
-                #part of a Compound Form as it seriously complicates things
-                if formindex == 27 or formindex == 40 or formindex == 41:
-                    continue
-                item = self.physical_form_list.item(formindex)
-                form = item.text()
+            for form in self.character.compound_choices:
                 item = QListWidgetItem(form)
                 item.setSizeHint(QSize(0, 20))
                 self.compound_list.addItem(item)
-                num -= 1
-        
+
         #enable Abilities tab (Roll Abilities button is enabled when the tab is selected) if form does not require using the options
         #or compound lists; make sure button remains disabled until lists are used
         options = self.options_list.count()
@@ -1460,250 +1140,91 @@ class MainWindow(QMainWindow):
         if options == 0 and compound_forms == 0:
             self.tab_widget.setTabEnabled(1, True)
             self.abilities_button.setEnabled(True)
-            self.watcher_pixmap = QPixmap(resource_path('images/watcher_abilities.jpg'))
+            self.watcher_pixmap = images.pixmap('watcher_abilities.jpg')
             self.watcher_image.setPixmap(self.watcher_pixmap)
-            self.cap_pixmap = QPixmap(resource_path('images/capt_america.jpg'))
+            self.cap_pixmap = images.pixmap('capt_america.jpg')
             self.cap_image.setPixmap(self.cap_pixmap)
-            self.ironman_pixmap = QPixmap(resource_path('images/bubble_abilities.jpg'))
+            self.ironman_pixmap = images.pixmap('bubble_abilities.jpg')
             self.ironman_image.setPixmap(self.ironman_pixmap)
         else:
             self.tab_widget.setTabEnabled(1, False)
             self.abilities_button.setEnabled(False)
-            self.cap_pixmap = QPixmap("")
+            self.cap_pixmap = images.null_pixmap()
             self.cap_image.setPixmap(self.cap_pixmap)
-            self.ironman_pixmap = QPixmap("")
+            self.ironman_pixmap = images.null_pixmap()
             self.ironman_image.setPixmap(self.ironman_pixmap)
-        
-        self.bubble_pixmap = QPixmap("")
+
+        self.bubble_pixmap = images.null_pixmap()
         self.bubble_image.setPixmap(self.bubble_pixmap)
-        self.blackpanther_pixmap = QPixmap("")
+        self.blackpanther_pixmap = images.null_pixmap()
         self.blackpanther_image.setPixmap(self.blackpanther_pixmap)
-        self.villain_bubble_pixmap = QPixmap("")
-        self.villain_bubble_image.setPixmap(self.villain_bubble_pixmap)
-        self.villain_pixmap = QPixmap("")
-        self.villain_image.setPixmap(self.villain_pixmap)
-        self.talent_pixmap = QPixmap("")
-        self.talent_image.setPixmap(self.talent_pixmap)
-        self.talent2_pixmap = QPixmap("")
-        self.talent2_image.setPixmap(self.talent2_pixmap)
-        self.contact_pixmap = QPixmap("")
-        self.contact_image.setPixmap(self.contact_pixmap)
-        self.contact2_pixmap = QPixmap("")
-        self.contact2_image.setPixmap(self.contact2_pixmap)
-        
+        if self.tab_built(2):
+            self.villain_bubble_pixmap = images.null_pixmap()
+            self.villain_bubble_image.setPixmap(self.villain_bubble_pixmap)
+            self.villain_pixmap = images.null_pixmap()
+            self.villain_image.setPixmap(self.villain_pixmap)
+        if self.tab_built(3):
+            self.talent_pixmap = images.null_pixmap()
+            self.talent_image.setPixmap(self.talent_pixmap)
+            self.talent2_pixmap = images.null_pixmap()
+            self.talent2_image.setPixmap(self.talent2_pixmap)
+        if self.tab_built(4):
+            self.contact_pixmap = images.null_pixmap()
+            self.contact_image.setPixmap(self.contact_pixmap)
+            self.contact2_pixmap = images.null_pixmap()
+            self.contact2_image.setPixmap(self.contact2_pixmap)
+
+
+
+    #show the character's bonuses, penalties, weaknesses and notes
+    def show_physical_form_text(self):
+        self.bonuses_textbox.setPlainText(self.character.bonuses)
+        self.penalties_textbox.setPlainText(self.character.penalties)
+        self.weakness_textbox.setPlainText(self.character.weaknesses)
+        self.notes_textbox.setPlainText(self.character.notes)
 
 
-    #determine the number of compound/changeling forms
-    def number_of_compoundforms(self):
-        roll = randint(1,100)
-        if roll < 51:
-            return 2
-        elif roll < 76:
-            return 3
-        elif roll < 96:
-            return 4
-        else:
-            return 5
-        
 
     #Clicking or hitting Enter on an item in the Optional Forms List
     def options_list_selected(self, item):
-        #convert the selected item to the selected string in the list box
-        selected_text = item.text()
         # Get the parent QListWidget of the selected item
         list_widget = item.listWidget()
         # to get the index of the selected item in the Options list
         index = list_widget.row(item)
         # to get the index of the selected item in the Physical Form list
         row = self.physical_form_list.currentRow()
-        effective_row = row
-        print("Physical Form Option List Clicked!")
-        print(f"options_list_selected item= {item}")
-        print(f"options_list_selected text= {selected_text}")
-        print(f"options_list_selected index= {index}")
-        print(f"options_list_selected physical form row= {row}")
 
-        chance = 100
-
-        #If this is a Compound form get the form from the current compound form
-        #instead of the current physical form
-        if row in (40, 41):
-            #add the optional form to the compound_form_options_list at the same
-            #index as the compound_form_list index so that it can be added 
-            #correctly to the file when saved
-            print(f"current_compound_form_index= {self.current_compound_form_index}")
-            self.compound_form_options_list.insert(self.current_compound_form_index, selected_text)
-            print(f"compound_form_options_list= {self.compound_form_options_list}")
-            self.current_compound_form_index += 1
-            #find the compound form's index in the Physical Form list
-            current_compound = self.current_compound_form
-            matched_physical_forms = self.physical_form_list.findItems(current_compound, Qt.MatchFlag.MatchExactly)
-            if matched_physical_forms:  # Ensure the item exists
-                #find the row of the item in the Physical Form List
-                option = self.physical_form_list.row(matched_physical_forms[0])
-                effective_row = option
-                num = self.compound_forms
-                print(f"options_list_selected num= {num}")
-                chance = 100 / num
-                print(f"options_list_selected chance= {chance}")
-                
-                compound_table = self.physicalforms["Compound"]
-                print(f"compound_table = {compound_table}")
-                compound_num = self.compound_list.count()
-                compound_option_chance = randint(1,100)
-                print(f"options_list_selected compound_option_chance= {compound_option_chance}")
-                if compound_table == 0:#if no compound form table has been chosen
-                    if option == 16 and index == 0:
-                        if compound_num == 0:#and this is the last compound form
-                            table = self.physicalforms["Demihuman-Avian"]["Angelic"]
-                            self.physicalforms["Compound"] = table
-                        elif compound_option_chance <= chance:#else use the chance
-                            table = self.physicalforms["Demihuman-Avian"]["Angelic"]
-                            self.physicalforms["Compound"] = table
-                    elif option == 16 and index == 1:
-                        if compound_num == 0:
-                            table = self.physicalforms["Demihuman-Avian"]["Harpy"]
-                            self.physicalforms["Compound"] = table
-                        elif compound_option_chance <= chance:
-                            table = self.physicalforms["Demihuman-Avian"]["Harpy"]
-                            self.physicalforms["Compound"] = table
-                    elif option == 31 and index == 0:
-                        if compound_num == 0:
-                            table = self.physicalforms["Animal"]["Terrestrial"]
-                            self.physicalforms["Compound"] = table
-                            print(f"Terrestrial Animals roll on Table 1")
-                        elif compound_option_chance <= chance:
-                            table = self.physicalforms["Animal"]["Terrestrial"]
-                            self.physicalforms["Compound"] = table
-                            print(f"Terrestrial Animals roll on Table 1")
-                    elif option == 31 and index == 1:
-                        if compound_num == 0:
-                            table = self.physicalforms["Animal"]["Extraterrestrial"]
-                            self.physicalforms["Compound"] = table
-                            print(f"Extraterrestrial Animals roll on Table 5")
-                        elif compound_option_chance <= chance:
-                            table = self.physicalforms["Animal"]["Extraterrestrial"]
-                            self.physicalforms["Compound"] = table
-                            print(f"Extraterrestrial Animals roll on Table 5")
-
-            new_compound_table = self.physicalforms["Compound"]
-            print(f"new_compound_table = {new_compound_table}")
-             
-
-        print(f"options_list_selected chance= {chance}")
-        if effective_row == 10: #Modified Human-Extra Parts
-            if index == 0:
-                self.fighting_bonus += 1
-                print(f"+1CS to Fighting")
-            if index == 1:
-                self.health_multiplier += 1
-                print(f"Health x2")
-            if index == 2:
-                print(f"+1 attack")
-            if index == 3:
-                print(f"gain Flight")
-                self.wings_travel_power = 1
-            if index == 4:
-                print(f"+1 area movement")
-            if index == 5:
-                print(f"gain detection power")
-                self.detection_power = 1
-            if index == 6:
-                print(f"+1CS to Charging attacks")
-        elif effective_row == 16: #Demihuman-Avian
-            if index == 0:
-                compound_option_chance1 = randint(1,100)
-                print(f"options_list_selected compound_option_chance1= {compound_option_chance1}")
-                if compound_option_chance1 <= chance:
-                    self.bonuses_textbox.insertPlainText("Popularity +1CS; ")
-                    self.popularity_bonus += 1
-            if index == 1:
-                compound_option_chance2 = randint(1,100)
-                print(f"options_list_selected compound_option_chance2= {compound_option_chance2}")
-                if compound_option_chance2 <= chance:
-                    self.bonuses_textbox.insertPlainText("+1CS Fighting; ")
-                    self.fighting_bonus += 1
-                compound_option_chance3 = randint(1,100)
-                print(f"options_list_selected compound_option_chance3= {compound_option_chance3}")
-                if compound_option_chance3 <= chance:
-                    self.notes_textbox.insertPlainText("Harpies possess arms that "
-                                                    "are modified to also serve "
-                                                    "as wings and feather-covered "
-                                                    "legs that end in bird Claws; ")
-        elif effective_row == 24: #Cyborg-Mechanically Augmented
-            if index == 0:
-                self.pf_resources_rank = 4 #set resources to Good
-            if index == 1:
-                pass#Resources are optionally rolled
-        elif effective_row == 27: #Robot-Metamorphic (roll Abilities for each form)
-            #apply penalty to abilities based on the number of forms above 2 (index 0)
-            self.fighting_bonus -= index
-            self.agility_bonus -= index
-            self.strength_bonus -= index
-            self.endurance_bonus -= index
-            self.reason_bonus -= index
-            self.intuition_bonus -= index
-            self.psyche_bonus -= index
-        elif effective_row == 29: #Angel/Demon
-            if index == 0:
-                compound_option_chance4 = randint(1,100)
-                print(f"options_list_selected compound_option_chance4= {compound_option_chance4}")
-                if compound_option_chance4 <= chance:
-                    self.bonuses_textbox.insertPlainText("Popularity +2CS; ")
-                    self.popularity_bonus += 2
-                compound_option_chance4b = randint(1,100)
-                print(f"options_list_selected compound_option_chance4b= {compound_option_chance4b}")
-                if compound_option_chance4b <= chance:
-                    self.notes_textbox.insertPlainText("Angels automatically possess a specific "
-                    "form of Artifact Creation that produces a magical sword that does Excellent damage.; ")
-            if index == 1:
-                compound_option_chance5 = randint(1,100)
-                print(f"options_list_selected compound_option_chance5= {compound_option_chance5}")
-                if compound_option_chance5 <= chance:
-                    self.penalties_textbox.insertPlainText("Popularity -2CS; ")
-                    self.popularity_bonus -= 2
-                compound_option_chance5b = randint(1,100)
-                print(f"options_list_selected compound_option_chance5= {compound_option_chance5b}")
-                if compound_option_chance5b <= chance:
-                    self.notes_textbox.insertPlainText("Demons automatically possess "
-                    "Good Fire Generation and Specific Invulnerability to Heat and Fire; ")
-        elif effective_row == 31: #Animal
-            self.animal_detection = 1
-            if index == 0 :
-                print(f"Terrestrial Animals roll on Table 1")
-                table = self.physicalforms['Animal']["Terrestrial"]
-            if index == 1:
-                print(f"Extraterrestrial Animals roll on Table 5")
-                table = self.physicalforms['Animal']["Extraterrestrial"]
+        self.character.select_form_option(index)
+        self.show_physical_form_text()
 
         #if the form is a Compound then clear the list in case another form has options
         #the options are stored in the compound_form_options_list
-        print(f"row={row}")
         if row in (40, 41):
             #clear the list
             self.options_list.clear()
 
         self.options_list.setEnabled(False)
 
-        #enable Roll Abilities button unless this is a Compound form where 
+        #enable Roll Abilities button unless this is a Compound form where
         #all forms have not been selected
         compound_forms = self.compound_list.count()
         if compound_forms == 0:
             self.tab_widget.setTabEnabled(1, True)
             self.abilities_button.setEnabled(True)
             self.compound_list.setEnabled(False)
-            self.watcher_pixmap = QPixmap(resource_path('images/watcher_abilities.jpg'))
+            self.watcher_pixmap = images.pixmap('watcher_abilities.jpg')
             self.watcher_image.setPixmap(self.watcher_pixmap)
-            self.cap_pixmap = QPixmap(resource_path('images/capt_america.jpg'))
+            self.cap_pixmap = images.pixmap('capt_america.jpg')
             self.cap_image.setPixmap(self.cap_pixmap)
-            self.ironman_pixmap = QPixmap(resource_path('images/bubble_abilities.jpg'))
+            self.ironman_pixmap = images.pixmap('bubble_abilities.jpg')
             self.ironman_image.setPixmap(self.ironman_pixmap)
         else:
             self.compound_list.setEnabled(True)
-            self.watcher_pixmap = QPixmap(resource_path('images/watcher_compound.jpg'))
+            self.watcher_pixmap = images.pixmap('watcher_compound.jpg')
             self.watcher_image.setPixmap(self.watcher_pixmap)
 
 
+
     #Clicking or hitting Enter on an item in the Compound Forms list
     def compound_list_selected(self, item):
         #convert the selected item to the selected string in the list box
@@ -1712,65 +1233,16 @@ class MainWindow(QMainWindow):
         list_widget = item.listWidget()
         # to get the index of the selected item
         index = list_widget.row(item)
-        print("Compound Form List Clicked!")
-        print(f"compound list item= {item}")
-        print(f"compound list text= {selected_text}")
-        print(f"compound list index= {index}")
-
-        self.current_compound_form = selected_text
-
-        #Find the index of the form in the Physical Form list to use based on the
-        #text of the item clicked in the Compound List and use it when filling in 
-        #the bonuses and penalties boxes
-        #First, create a list of items found matching the form clicked in 
-        #Compound List with the form in the Physical Form List (should be just one item)
-        matched_physical_forms = self.physical_form_list.findItems(selected_text, Qt.MatchFlag.MatchExactly)
-        if matched_physical_forms:  # Ensure the item exists
-            #find the row of the item in the Physical Form List
-            physicalformindex = self.physical_form_list.row(matched_physical_forms[0])
-            item = matched_physical_forms[0]
-
-        print(f"Compound Physical Form List index= {physicalformindex}")
-        print(f"Compound Physical Form List item= {item}")
-        #determine the chance the compound form takes of each bonus and penalty
-        num = self.compound_forms
-        chance = 100 / num
-        print(f"number of forms = {num}")
-        print(f"chance={chance}")
-        #populate the info boxes by calculating the chance of each bonus and penalty
-        self.physical_form_info(item, chance)
-
-
-        #calculate which table to use
-        #Demihuman Avian and Animal tables are determined by the optional list
-        if selected_text != "Demihuman-Avian" and selected_text != "Animal":
-            table_chance = randint(1,100)
-            count = self.compound_list.count()
-            compound_table = self.physicalforms["Compound"]
-            table = self.physicalforms[selected_text]
-            print(f"table chance = {table_chance}")
-            print(f"count={count}")
-            print(f"compound_table={compound_table}")
-            print(f"table={table}")
-            if compound_table == 0:#if no table has been chosen
-                if count == 1:#if this is the last form use this table
-                    self.physicalforms["Compound"] = table
-                elif table_chance <= chance:#if not the last form calculate the chance
-                    self.physicalforms["Compound"] = table
-            
-            new_compound_table = self.physicalforms["Compound"]
-            print(f"new_compound_table = {new_compound_table}")
-
-        #add the optional form to the compound_form_options_list at the same
-        #index as the compound_form_list index so that it can be added 
-        #correctly to the file when saved
-        self.compound_form_list.insert(self.current_compound_form_index, selected_text)
-        print(f"compound_form_list={self.compound_form_list}")
+
+        #populate the info boxes by calculating the chance of each bonus and
+        #penalty and choose the table to roll abilities on
+        self.character.select_compound_form(index)
+        self.physical_form_info(engine.physical_form_names.index(selected_text))
 
         #remove the item from the compound form list
         self.compound_list.takeItem(index)
 
-        #enable Roll Abilities button unless this is a Compound form where 
+        #enable Roll Abilities button unless this is a Compound form where
         #all forms have not been selected
         options = self.options_list.count()
         options_selected = self.options_list.selectedItems()
@@ -1779,20 +1251,20 @@ class MainWindow(QMainWindow):
             if options > 0 and options_selected:#if options were available and selected
                 self.tab_widget.setTabEnabled(1, True)
                 self.abilities_button.setEnabled(True)
-                self.watcher_pixmap = QPixmap(resource_path('images/watcher_abilities.jpg'))
+                self.watcher_pixmap = images.pixmap('watcher_abilities.jpg')
                 self.watcher_image.setPixmap(self.watcher_pixmap)
-                self.cap_pixmap = QPixmap(resource_path('images/capt_america.jpg'))
+                self.cap_pixmap = images.pixmap('capt_america.jpg')
                 self.cap_image.setPixmap(self.cap_pixmap)
-                self.ironman_pixmap = QPixmap(resource_path('images/bubble_abilities.jpg'))
+                self.ironman_pixmap = images.pixmap('bubble_abilities.jpg')
                 self.ironman_image.setPixmap(self.ironman_pixmap)
             elif options == 0:#if no options are needed to be selected
                 self.tab_widget.setTabEnabled(1, True)
                 self.abilities_button.setEnabled(True)
-                self.watcher_pixmap = QPixmap(resource_path('images/watcher_abilities.jpg'))
+                self.watcher_pixmap = images.pixmap('watcher_abilities.jpg')
                 self.watcher_image.setPixmap(self.watcher_pixmap)
-                self.cap_pixmap = QPixmap(resource_path('images/capt_america.jpg'))
+                self.cap_pixmap = images.pixmap('capt_america.jpg')
                 self.cap_image.setPixmap(self.cap_pixmap)
-                self.ironman_pixmap = QPixmap(resource_path('images/bubble_abilities.jpg'))
+                self.ironman_pixmap = images.pixmap('bubble_abilities.jpg')
                 self.ironman_image.setPixmap(self.ironman_pixmap)
             elif options > 0:
                 self.options_list.setEnabled(True)
@@ -1800,20 +1272,17 @@ class MainWindow(QMainWindow):
                 self.options_list.setEnabled(False)
             self.compound_list.setEnabled(False)
 
-        #if options need to be selected disable the compound list to force the 
+        #if options need to be selected disable the compound list to force the
         #user to select an option before continuing choosing Compound forms
         #it will get re-enabled in the options_list_selection if there are still
         #forms to choose
-        #increment the current_compound_form_index by one if no optional forms 
-        #need to be selected and matched to the compound_form_list index
         if options and compound_forms:
             self.compound_list.setEnabled(False)
-        if not options:
-            self.current_compound_form_index += 1
 
 
 
     def tab_changed(self, index):
+        self.build_tab(index)
         print(f"Tab changed to index: {index}")
         if index == 1:  # Abilities tab
             self.abilities_button.setFocus()
@@ -1828,152 +1297,77 @@ class MainWindow(QMainWindow):
 
     #Click the Roll Abilities button
     def roll_abilities(self):
-        print("Roll Abilities Button Clicked!")
-        #reset health and karma
-        self.health = 0
-        self.karma = 0
-        self.abilities_button_rolled = True
-        #if physical form receives an ability bonus make sure to add one back if
-        #one was used before re-rolling abilities
-        if self.ability_bonus_button_was_clicked > 0:
-            self.ability_bonus += 1
-            self.ability_bonus_button_was_clicked = 0
-        #Find the table to roll on
-        item = self.physical_form_list.currentItem()
-        selected_text = item.text()
-        table = self.physicalforms[selected_text]
-        print(f"roll abilities item={item}")
-        print(f"roll abilities selected_text={selected_text}")
-        print(f"roll abilities table={table}")
-        if selected_text == "Demihuman-Avian":
-            current_row = self.options_list.currentRow()
-            print(current_row)
-            if current_row == 0:
-                table = self.physicalforms[selected_text]["Angelic"]
-            else:
-                table = self.physicalforms[selected_text]["Harpy"]
-        if selected_text == "Animal":
-            current_row = self.options_list.currentRow()
-            print(current_row)
-            if current_row == 0:
-                table = self.physicalforms[selected_text]["Terrestrial"]
-            else:
-                table = self.physicalforms[selected_text]["Extraterrestrial"]
-        
-        print(f"roll abilities table={table}")
-        
-        #roll randomly for each ability then display the roll, rank and bonus
-        #for each ability in the Table column
-        self.fill_roll_textboxes(self.ability_inputs.items(), table)
+        self.character.roll_abilities()
+        self.table_text_box.setText(f"Table {self.character.ability_table()}")
+        #display the roll, rank and bonus for each ability in the Table column
+        #and each secondary ability in the Secondary column
+        self.show_abilities()
         #enable the Bonus Buttons if the Physical Form requires it
         for ability, inputs in self.ability_inputs.items():
-            if self.ability_bonus > 0:
+            if self.character.ability_bonus > 0:
                 inputs["bonus_button"].setEnabled(True)
 
-        #display Health and Karma after applying health multiplier
-        self.health = self.health * self.health_multiplier
-        self.health_textbox.setText(str(self.health))
-        self.karma_textbox.setText(str(self.karma))
-
-        #roll randomly for each secondary ability then display the roll, rank
-        # and bonus for each ability in the Secondary column
-        self.fill_roll_textboxes(self.secondary_ability_inputs.items(), table)
-
-        if self.ability_bonus == 0:
-            self.tab_widget.setTabEnabled(2, True)
+        if self.character.ability_bonus == 0:
+            self.enable_tab(2)
             self.roll_power_classes_button.setEnabled(True)
-            self.bubble_pixmap = QPixmap(resource_path('images/bubble_blackpanther.jpg'))
+            self.bubble_pixmap = images.pixmap('bubble_blackpanther.jpg')
             self.bubble_image.setPixmap(self.bubble_pixmap)
-            self.blackpanther_pixmap = QPixmap(resource_path('images/black_panther.jpg'))
+            self.blackpanther_pixmap = images.pixmap('black_panther.jpg')
             self.blackpanther_image.setPixmap(self.blackpanther_pixmap)
-            self.villain_bubble_pixmap = QPixmap(resource_path('images/drdoom_bubble.jpg'))
+            self.villain_bubble_pixmap = images.pixmap('drdoom_bubble.jpg')
             self.villain_bubble_image.setPixmap(self.villain_bubble_pixmap)
-            self.villain_pixmap = QPixmap(resource_path('images/drdoom.jpg'))
+            self.villain_pixmap = images.pixmap('drdoom.jpg')
             self.villain_image.setPixmap(self.villain_pixmap)
-            self.cap_pixmap = QPixmap("")
+            self.cap_pixmap = images.null_pixmap()
             self.cap_image.setPixmap(self.cap_pixmap)
-            self.ironman_pixmap = QPixmap("")
+            self.ironman_pixmap = images.null_pixmap()
             self.ironman_image.setPixmap(self.ironman_pixmap)
         else:
-            self.cap_pixmap = QPixmap("")
+            self.cap_pixmap = images.null_pixmap()
             self.cap_image.setPixmap(self.cap_pixmap)
-            self.ironman_pixmap = QPixmap(resource_path('images/iron_man.jpg'))
+            self.ironman_pixmap = images.pixmap('iron_man.jpg')
             self.ironman_image.setPixmap(self.ironman_pixmap)
-            self.bubble_pixmap = QPixmap("")
+            self.bubble_pixmap = images.null_pixmap()
             self.bubble_image.setPixmap(self.bubble_pixmap)
-            self.blackpanther_pixmap = QPixmap("")
+            self.blackpanther_pixmap = images.null_pixmap()
             self.blackpanther_image.setPixmap(self.blackpanther_pixmap)
             self.tab_widget.setTabEnabled(2, False)
-        
-        self.watcher_pixmap = QPixmap("")
+
+        self.watcher_pixmap = images.null_pixmap()
         self.watcher_image.setPixmap(self.watcher_pixmap)
 
 
 
     #Click one of the bonus ability rank buttons
     def bonus_ability_clicked(self, ability):
-        print(f"Bonus button clicked for {ability}")
         #if the ability_bonus is still above 0
-        if self.ability_bonus > 0:
-            # Access the corresponding input fields using self.ability_inputs[ability]
-            rank_textbox = self.ability_inputs[ability]["rank"]
-            score_textbox = self.ability_inputs[ability]["score"]
-            #get the current rank name for the ability
-            current_rank_name = rank_textbox.text()
-            current_rank_score = int(score_textbox.text())
-            print(f"current_rank_name={current_rank_name}")
-            print(f"current_rank_score={current_rank_score}")
-            #get the index number from the ranks list
-            index = self.ranks.index(current_rank_name)
-            #add one to the ranks index
-            index += 1
-            #set the ability rank textbox to the new rank
-            new_rank = self.ranks[index]
-            print(f"new_rank={new_rank}")
-            rank_textbox.setText(f"{new_rank}")
-
-            #adjust rank score
-            new_rank_score = self.min_std_rank_score(new_rank)
-            score_textbox.setText(f"{new_rank_score}")
-
-            #adjust Health/Karma
-            diff = new_rank_score - current_rank_score
-            if ability in {"fighting", "agility", "strength", "endurance"}:
-                diff = diff * self.health_multiplier#apply health multiplier to the difference
-                self.health += diff
-                self.health_textbox.setText(f"{self.health}")
-            elif ability in {"reason", "intuition", "psyche"}:
-                self.karma += diff
-                self.karma_textbox.setText(f"{self.karma}")
-
-            self.ability_bonus -= 1 #reduce the number of ability bonuses by one
+        if self.character.ability_bonus > 0:
+            self.character.raise_ability(ability)
+
             #disable the buttons once all ability bonuses have been used
-            if self.ability_bonus == 0:
+            if self.character.ability_bonus == 0:
                 for ability in self.ability_inputs:
                     bonus_button = self.ability_inputs[ability]["bonus_button"]
                     bonus_button.setEnabled(False)
-                self.tab_widget.setTabEnabled(2, True)
+                self.enable_tab(2)
                 self.roll_power_classes_button.setEnabled(True)
-                self.ironman_pixmap = QPixmap("")
+                self.ironman_pixmap = images.null_pixmap()
                 self.ironman_image.setPixmap(self.ironman_pixmap)
 
-                #display image to move user to the Powers tab    
-                self.bubble_pixmap = QPixmap(resource_path('images/bubble_blackpanther.jpg'))
+                #display image to move user to the Powers tab
+                self.bubble_pixmap = images.pixmap('bubble_blackpanther.jpg')
                 self.bubble_image.setPixmap(self.bubble_pixmap)
-                self.blackpanther_pixmap = QPixmap(resource_path('images/black_panther.jpg'))
+                self.blackpanther_pixmap = images.pixmap('black_panther.jpg')
                 self.blackpanther_image.setPixmap(self.blackpanther_pixmap)
-                self.villain_bubble_pixmap = QPixmap(resource_path('images/drdoom_bubble.jpg'))
+                self.villain_bubble_pixmap = images.pixmap('drdoom_bubble.jpg')
                 self.villain_bubble_image.setPixmap(self.villain_bubble_pixmap)
-                self.villain_pixmap = QPixmap(resource_path('images/drdoom.jpg'))
+                self.villain_pixmap = images.pixmap('drdoom.jpg')
                 self.villain_image.setPixmap(self.villain_pixmap)
 
-            self.ability_bonus_button_was_clicked += 1
 
 
     #Click the Roll Power Classes button
     def roll_power_classes(self):
-        print("Rolling Power Classes...")
-        print(f"resource_rank={self.resources_rank}")
         #disable the Abilities tab and reset the Powers tab
         self.abilities_button.setEnabled(False)
         self.power_classes_listbox.clear()
@@ -1983,243 +1377,62 @@ class MainWindow(QMainWindow):
         self.add_power_button.setEnabled(False)
         self.bonus_powers_listbox.clear()
         self.optional_powers_listbox.clear()
-        self.powers_listbox.clear()
         self.powers_listbox.setEnabled(False)
         self.generate_weakness_button.setEnabled(False)
 
-        self.villain_bubble_pixmap = QPixmap(resource_path('images/mystique_bubble.jpg'))
+        self.villain_bubble_pixmap = images.pixmap('mystique_bubble.jpg')
         self.villain_bubble_image.setPixmap(self.villain_bubble_pixmap)
-        self.villain_pixmap = QPixmap(resource_path('images/mystique.jpg'))
+        self.villain_pixmap = images.pixmap('mystique.jpg')
         self.villain_image.setPixmap(self.villain_pixmap)
-        self.bubble_pixmap = QPixmap("")
+        self.bubble_pixmap = images.null_pixmap()
         self.bubble_image.setPixmap(self.bubble_pixmap)
-        self.blackpanther_pixmap = QPixmap("")
+        self.blackpanther_pixmap = images.null_pixmap()
         self.blackpanther_image.setPixmap(self.blackpanther_pixmap)
 
-        if self.animal_detection == 1:
-            #roll the two detection powers and apply power rank Good
-            roll = randint(1,100)
-            powers = list(powerlists.detection_powers_list.keys())
-            roll_thresholds = [3, 5, 11, 15, 21, 29, 35, 41, 43, 45, 51, 55, 57,
-                                59, 60, 63, 70, 80, 91, 95, 99, 101]
-            index = bisect(roll_thresholds, roll)
-            power = powers[index]
-            rank = self.ranks[4]
-            score = self.min_std_rank_score(rank)
-            item = QListWidgetItem(f"{power} - {rank} ({score})")
-            item.setSizeHint(QSize(0, 22))
-            self.powers_listbox.addItem(item)
-            item = self.powers_listbox.item(0)
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEnabled)
-            # 2nd detection power
-            roll = randint(1,100)
-            index2 = bisect(roll_thresholds, roll)
-            while index2 == index:#if the same power is rolled, roll again
-                roll = randint(1,100)
-                index2 = bisect(roll_thresholds, roll)
-            power = powers[index2]
-            score = self.min_std_rank_score(rank)
-            item = QListWidgetItem(f"{power} - {rank} ({score})")
-            item.setSizeHint(QSize(0, 22))
-            self.powers_listbox.addItem(item)
-            item = self.powers_listbox.item(1)
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEnabled)
-        
-        item = self.physical_form_list.currentItem()
-        selected_text = item.text()
-        if self.energy_form == 1:
-            roll = randint(1,100)
-            powers = list(powerlists.energy_emission_powers_list.keys())
-            roll_thresholds = [11, 21, 23, 35, 38, 43, 53, 63, 73, 76, 79, 84, 
-                            94, 101]
-            index = bisect(roll_thresholds, roll)
-            power = powers[index]
-            table = self.physicalforms[selected_text]
-            roll = randint(1,100)
-            rank_index = self.ability_roll(table, roll)
-            rank = self.ranks[rank_index]
-            score = self.min_std_rank_score(rank)
-            epoint = self.energy_emission_body_part()
-            item = QListWidgetItem(f"{power} - {rank} ({score}); emitted from {epoint}")
-            item.setSizeHint(QSize(0, 22))
-            self.powers_listbox.addItem(item)
-            item = self.powers_listbox.item(0)
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEnabled)
-            #add Energy Control as an Optional Power to Power Classes Listbox
-            item = QListWidgetItem("Energy Control")
-            item.setSizeHint(QSize(0, 22))
-            self.power_classes_listbox.addItem(item)
-
-        if self.deity_travel_power == 1:
-            roll = randint(1,100)
-            powers = list(powerlists.travel_powers_list.keys())
-            roll_thresholds = [3, 7, 11, 13, 15, 20, 27, 29, 35, 43, 47, 52, 57,
-                            59, 65, 73, 77, 79, 81, 83, 94, 98, 99, 101]
-            index = bisect(roll_thresholds, roll)
-            power = powers[index]
-            table = self.physicalforms[selected_text]
-            roll = randint(1,100)
-            rank_index = self.ability_roll(table, roll)
-            rank = self.ranks[rank_index]
-            score = self.min_std_rank_score(rank)
-            item = QListWidgetItem(f"{power} - {rank} ({score})")
-            item.setSizeHint(QSize(0, 22))
-            self.powers_listbox.addItem(item)
-            item = self.powers_listbox.item(0)
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEnabled)
-        
-        if self.wings_travel_power == 1:
-            table = self.physicalforms[selected_text]
-            roll = randint(1,100)
-            rank_index = self.ability_roll(table, roll)
-            rank = self.ranks[rank_index]
-            score = self.min_std_rank_score(rank)
-            item = QListWidgetItem(f"Winged Flight - {rank} ({score})")
-            item.setSizeHint(QSize(0, 22))
-            self.powers_listbox.addItem(item)
-            item = self.powers_listbox.item(0)
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEnabled)
-
-        if self.detection_power == 1:
-            roll = randint(1,100)
-            powers = list(powerlists.detection_powers_list.keys())
-            roll_thresholds = [3, 5, 11, 15, 21, 29, 35, 41, 43, 45, 51, 55, 57,
-                                59, 60, 63, 70, 80, 91, 95, 99, 101]
-            index = bisect(roll_thresholds, roll)
-            power = powers[index]
-            table = self.physicalforms[selected_text]
-            roll = randint(1,100)
-            rank_index = self.ability_roll(table, roll)
-            rank = self.ranks[rank_index]
-            score = self.min_std_rank_score(rank)
-            item = QListWidgetItem(f"Antennae: {power} - {rank} ({score})")
-            item.setSizeHint(QSize(0, 22))
-            self.powers_listbox.addItem(item)
-            item = self.powers_listbox.item(0)
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEnabled)
-
-        self.power_rank_above_remarkable = 0
-        #roll number of powers
-        print("Rolling Number of Powers and Power Classes!")
-        self.roll_number_powers("powers")
-        min = self.number_of_powers["min"]
-        max = self.number_of_powers["max"]
-        print(f"Number of powers - min={min} / max={max}")
-        #add power class to the list for each minimum power number slot
-        while min > 0:
-            print(f"min={min}")
-            power_class = self.roll_power_class()
-            item = QListWidgetItem(power_class)
-            item.setSizeHint(QSize(0, 22))
-            self.power_classes_listbox.addItem(item)
-            min -= 1
-            print(f"min={min}")
-        #set the min to 0 to start adding from 0 when powers are added to the list
-        min = self.powers_listbox.count()
-        self.number_of_powers["min"] = min
-        self.num_powers_label.setText(f"Min: {min} / Max: {max}")
+        #roll the physical form's automatic powers, the number of powers and
+        #the power class for each minimum power number slot
+        self.character.roll_power_classes()
+        self.show_power_classes()
+        self.show_powers()
         #enable buy and remove buttons
         self.buy_power_button.setEnabled(True)
         self.remove_power_button.setEnabled(True)
-        #if powers were purchased for Resources, reset back to original Resources
-        if len(self.purchased_powers) > 0:
-            print("Resources were spent on Powers, resetting...")
-            self.purchased_powers = []
-            resources_text = self.secondary_ability_inputs["resources"]["rank"]
-            resources_score_text = self.secondary_ability_inputs["resources"]["score"]
-            new_rank = self.ranks[self.original_resources_rank]
-            resources_text.setText(new_rank)
-            self.resources_rank = self.original_resources_rank
-            print(f"resource_rank={self.resources_rank}")
-            if self.std_rank_scores == 0:
-                #minimum rank scores
-                resources_score_text.setText(str(self.rank_scores[new_rank][0]))
-            else:
-                #standard rank scores
-                resources_score_text.setText(str(self.rank_scores[new_rank][1]))
 
 
 
     #Click the Buy Powers button
     def buy_power(self):
-        #first check if there are enough resources and reduce resources by two 
-        #ranks or if buying a power will exceed the maximum number of powers 
+        #first check if there are enough resources and reduce resources by two
+        #ranks or if buying a power will exceed the maximum number of powers
         #and display the new rank and score on the Abilities tab
-        print("Buying Power!")
-        print(f"resource_rank={self.resources_rank}")
-        current_resources = self.resources_rank
-        new_resources = current_resources - 2
-        num_powers = self.power_classes_listbox.count()
-        max_powers = self.number_of_powers["max"]
-        print(f"current_resources={current_resources}, new_resources={new_resources}")
-        if new_resources < 0:
-            print("Not enough resources!")
-            self.display_message(resource_path('images/oops.jpg'), "Not Enough Resources!", "You do not have enough Resources to purchase another power!", "warning", buttons=0)
-        elif num_powers == max_powers:
-            print("Not enough power slots!")
-            self.display_message(resource_path('images/oops.jpg'), "Not Enough Power Slots!", "You do not have enough Power slots to purchase another power!", "warning", buttons=0)
+        result = self.character.buy_power()
+        if result == "resources":
+            self.display_message('oops.jpg', "Not Enough Resources!", "You do not have enough Resources to purchase another power!", "warning", buttons=0)
+        elif result == "slots":
+            self.display_message('oops.jpg', "Not Enough Power Slots!", "You do not have enough Power slots to purchase another power!", "warning", buttons=0)
         else:
-            new_rank = self.ranks[new_resources]
-            resources_text = self.secondary_ability_inputs["resources"]["rank"]
-            resources_score_text = self.secondary_ability_inputs["resources"]["score"]
-            resources_text.setText(new_rank)
-            if self.std_rank_scores == 0:
-                #minimum rank scores
-                resources_score_text.setText(str(self.rank_scores[new_rank][0]))
-            else:
-                #standard rank scores
-                resources_score_text.setText(str(self.rank_scores[new_rank][1]))
-            
-            #roll an additional power class and add it to the list
-            print("Adding Power!")
-            power_class = self.roll_power_class()
+            #add the additional power class to the list
             self.power_classes_listbox.setEnabled(True)
-            item = QListWidgetItem(power_class)
+            item = QListWidgetItem(self.character.power_classes[-1])
             item.setSizeHint(QSize(0, 22))
             self.power_classes_listbox.addItem(item)
-            self.purchased_powers.append(power_class)
-            self.resources_rank -= 2
-            print(f"resources_rank={self.resources_rank}")
 
 
 
     #Click the Remove Powers button
     def remove_power(self):
-        print("Removing Power...")
-        print(f"resource_rank={self.resources_rank}")
         #Add a check if a power class was selected first
         selected_items = self.power_classes_listbox.selectedItems()
         if not selected_items:
-            self.display_message(resource_path('images/oops.jpg'), "No Power Class Selected!", "You need to select a Power Class to remove!", "warning", buttons=0)
+            self.display_message('oops.jpg', "No Power Class Selected!", "You need to select a Power Class to remove!", "warning", buttons=0)
         else:
-            result = self.display_message(resource_path('images/question.jpg'), "Confirm Removing Power", "Are you sure you want to remove this power class?", "question", buttons=1)
+            result = self.display_message('question.jpg', "Confirm Removing Power", "Are you sure you want to remove this power class?", "question", buttons=1)
             if result == QMessageBox.StandardButton.Ok:
-                print("User clicked OK")
                 power = self.power_classes_listbox.currentRow()
-                power_item = self.power_classes_listbox.item(power)
-                power_text = power_item.text()
-                print(f"Removing power{power}, power_item={power_item}, power_text={power_text}")
-
-                #if removed power is a purchased power return the Resources spent
-                if power_text in self.purchased_powers:
-                    self.purchased_powers.remove(power_text)
-                    current_resources = self.resources_rank
-                    new_resources = current_resources + 2
-                    resources_text = self.secondary_ability_inputs["resources"]["rank"]
-                    resources_score_text = self.secondary_ability_inputs["resources"]["score"]
-                    new_rank = self.ranks[new_resources]
-                    resources_text.setText(new_rank)
-                    self.resources_rank = new_resources
-                    print(f"resource_rank={self.resources_rank}")
-                    if self.std_rank_scores == 0:
-                        #minimum rank scores
-                        resources_score_text.setText(str(self.rank_scores[new_rank][0]))
-                    else:
-                        #standard rank scores
-                        resources_score_text.setText(str(self.rank_scores[new_rank][1]))
-
+                #if removed power is a purchased power the Resources spent are returned
+                self.character.remove_power_class(power)
                 self.power_classes_listbox.takeItem(power)
-                #if the last power class was removed disable the roll and add power 
+                #if the last power class was removed disable the roll and add power
                 #buttons and enable the generate weakness button
                 if self.power_classes_listbox.count() == 0:
                         self.generate_weakness_button.setEnabled(True)
@@ -2229,8 +1442,6 @@ class MainWindow(QMainWindow):
                         self.bonus_powers_listbox.clear()
                         self.optional_powers_listbox.clear()
                         self.power_textbox.clear()
-            elif result == QMessageBox.StandardButton.Cancel:
-                print("User clicked Cancel")
 
 
 
@@ -2247,393 +1458,92 @@ class MainWindow(QMainWindow):
 
     #Click the Roll Powers button
     def roll_power(self):
-        print("Rolling Power...")
-        print(f"resource_rank={self.resources_rank}")
         #reset the bonus and optional power list boxes
         self.bonus_powers_listbox.clear()
         self.optional_powers_listbox.clear()
         self.bonus_powers_listbox.setEnabled(False)
         self.optional_powers_listbox.setEnabled(False)
 
-        self.villain_bubble_pixmap = QPixmap(resource_path('images/thanos_bubble.jpg'))
+        self.villain_bubble_pixmap = images.pixmap('thanos_bubble.jpg')
         self.villain_bubble_image.setPixmap(self.villain_bubble_pixmap)
-        self.villain_pixmap = QPixmap(resource_path('images/thanos.jpg'))
+        self.villain_pixmap = images.pixmap('thanos.jpg')
         self.villain_image.setPixmap(self.villain_pixmap)
 
         #roll and determine power from power class
-        print("Rolling Power!")
-        roll = randint(1,100)
         item = self.power_classes_listbox.currentItem()
         power_class = item.text()
-        print(f"power_class={power_class}, roll={roll}")
-        if power_class == "Defensive":
-            powers = list(powerlists.defensive_powers_list.keys())
-            roll_thresholds = [16, 21, 24, 31, 36, 41, 49, 51, 54, 66, 71, 78, 
-                               83, 88, 95, 98, 101]
-            #match the index of the roll threshold with the index of the power 
-            #in the power class to get the name of the power
-            powername = self.get_power(roll, roll_thresholds, powers)
-            print(f"powername={powername}")
-            #get the bonus and optional powers and fill in the appropriate listboxes 
-            #repeat for each power class below...
-            self.get_bonus_optional_powers(powerlists.defensive_powers_list, powername)
-        elif power_class == "Detection":
-            powers = list(powerlists.detection_powers_list.keys())
-            roll_thresholds = [3, 5, 11, 15, 21, 29, 35, 41, 43, 45, 51, 55, 57,
-                                59, 60, 63, 70, 80, 91, 95, 99, 101]
-            powername = self.get_power(roll, roll_thresholds, powers)
-            print(f"powername={powername}")
-            self.get_bonus_optional_powers(powerlists.detection_powers_list, powername)
-        elif power_class == "Energy Control":
-            powers = list(powerlists.energy_control_powers_list.keys())
-            roll_thresholds = [8, 11, 16, 19, 26, 29, 32, 37, 39, 46, 50, 54, 60,
-                               67, 74, 78, 81, 85, 91, 98, 101]
-            powername = self.get_power(roll, roll_thresholds, powers)
-            print(f"powername={powername}")
-            self.get_bonus_optional_powers(powerlists.energy_control_powers_list, powername)
-        elif power_class == "Energy Emission":
-            powers = list(powerlists.energy_emission_powers_list.keys())
-            roll_thresholds = [11, 21, 23, 35, 38, 43, 53, 63, 73, 76, 79, 84, 
-                               94, 101]
-            powername = self.get_power(roll, roll_thresholds, powers)
-            print(f"powername={powername}")
-            self.get_bonus_optional_powers(powerlists.energy_emission_powers_list, powername)
-        elif power_class == "Fighting":
-            powers = list(powerlists.fighting_powers_list.keys())
-            print("Available Powers:", powers)
-            roll_thresholds = [21, 61, 76, 81, 99, 101]
-            powername = self.get_power(roll, roll_thresholds, powers)
-            print(f"powername={powername}")
-            self.get_bonus_optional_powers(powerlists.fighting_powers_list, powername)
-        elif power_class == "Illusory":
-            powers = list(powerlists.illusory_powers_list.keys())
-            roll_thresholds = [16, 71, 86, 101]
-            powername = self.get_power(roll, roll_thresholds, powers)
-            print(f"powername={powername}")
-            self.get_bonus_optional_powers(powerlists.illusory_powers_list, powername)
-        elif power_class == "Lifeform Control":
-            powers = list(powerlists.lifeform_control_powers_list.keys())
-            roll_thresholds = [15, 16, 19, 27, 33, 35, 36, 40, 52, 61, 63, 66, 67,
-                                70, 72, 81, 84, 90, 91, 96, 101]
-            powername = self.get_power(roll, roll_thresholds, powers)
-            print(f"powername={powername}")
-            self.get_bonus_optional_powers(powerlists.lifeform_control_powers_list, powername)
-        elif power_class == "Magical":
-            powers = list(powerlists.magic_powers_list.keys())
-            roll_thresholds = [9, 16, 18, 26, 29, 34, 40, 42, 72, 78, 80, 96, 99, 101]
-            powername = self.get_power(roll, roll_thresholds, powers)
-            print(f"powername={powername}")
-            self.get_bonus_optional_powers(powerlists.magic_powers_list, powername)
-        elif power_class == "Matter Control":
-            powers = list(powerlists.matter_control_powers_list.keys())
-            roll_thresholds = [6, 18, 23, 30, 40, 47, 52, 62, 69, 74, 84, 94, 101]
-            powername = self.get_power(roll, roll_thresholds, powers)
-            print(f"powername={powername}")
-            self.get_bonus_optional_powers(powerlists.matter_control_powers_list, powername)
-        elif power_class == "Matter Conversion":
-            powers = list(powerlists.matter_conversion_powers_list.keys())
-            roll_thresholds = [11, 26, 46, 71, 81, 101]
-            powername = self.get_power(roll, roll_thresholds, powers)
-            print(f"powername={powername}")
-            self.get_bonus_optional_powers(powerlists.matter_conversion_powers_list, powername)
-        elif power_class == "Matter Creation":
-            powers = list(powerlists.matter_creation_powers_list.keys())
-            roll_thresholds = [11, 25, 30, 36, 60, 70, 89, 101]
-            powername = self.get_power(roll, roll_thresholds, powers)
-            print(f"powername={powername}")
-            self.get_bonus_optional_powers(powerlists.matter_creation_powers_list, powername)
-        elif power_class == "Mental Enhancement":
-            powers = list(powerlists.mental_enhancement_powers_list.keys())
-            roll_thresholds = [5, 9, 12, 13, 14, 16, 17, 23, 24, 27, 28, 32, 41,
-                                48, 49, 59, 66, 67, 68, 70, 73, 74, 75, 76, 77, 
-                                79, 80, 81, 82, 86, 87, 97, 99, 101]
-            powername = self.get_power(roll, roll_thresholds, powers)
-            print(f"powername={powername}")
-            self.get_bonus_optional_powers(powerlists.mental_enhancement_powers_list, powername)
-        elif power_class == "Physical Enhancement":
-            powers = list(powerlists.physical_enhancement_powers_list.keys())
-            roll_thresholds = [15, 29, 31, 34, 41, 43, 46, 48, 61, 63, 68, 72, 77,
-                                79, 83, 91, 95, 97, 99, 101]
-            powername = self.get_power(roll, roll_thresholds, powers)
-            print(f"powername={powername}")
-            self.get_bonus_optional_powers(powerlists.physical_enhancement_powers_list, powername)
-        elif power_class == "Power Control":
-            powers = list(powerlists.power_control_powers_list.keys())
-            roll_thresholds = [9, 13, 19, 24, 38, 40, 50, 56, 61, 65, 74, 84, 97,
-                                101]
-            powername = self.get_power(roll, roll_thresholds, powers)
-            print(f"powername={powername}")
-            self.get_bonus_optional_powers(powerlists.power_control_powers_list, powername)
-        elif power_class == "Self-Alteration":
-            powers = list(powerlists.self_alteration_powers_list.keys())
-            roll_thresholds = [3, 10, 11, 14, 20, 21, 28, 31, 34, 38, 39, 43, 45,
-                                50, 56, 58, 59, 61, 62, 63, 64, 68, 71, 72, 75,
-                                79, 82, 85, 91, 95, 100, 101]
-            powername = self.get_power(roll, roll_thresholds, powers)
-            print(f"powername={powername}")
-            self.get_bonus_optional_powers(powerlists.self_alteration_powers_list, powername)
-        elif power_class == "Travel":
-            powers = list(powerlists.travel_powers_list.keys())
-            roll_thresholds = [3, 7, 11, 13, 15, 20, 27, 29, 35, 43, 47, 52, 57,
-                                59, 65, 73, 77, 79, 81, 83, 94, 98, 99, 101]
-            powername = self.get_power(roll, roll_thresholds, powers)
-            print(f"powername={powername}")
-            self.get_bonus_optional_powers(powerlists.travel_powers_list, powername)
+        powername = engine.roll_power(power_class, self.character.rng)
+        self.power_textbox.setText(powername)
+        #get the bonus and optional powers and fill in the appropriate listboxes
+        self.get_bonus_optional_powers(power_class, powername)
 
         self.add_power_button.setEnabled(True)
 
 
 
-    #determine the power from the roll and insert the name in the Power textbox
-    def get_power(self, roll, roll_thresholds, powers):
-        print("Getting power....")
-        #The bisect function uses efficient lookup and finds the correct index 
-        #in roll_thresholds, which directly maps to the correct power
-        print(f"powers={powers}")
-        index = bisect(roll_thresholds, roll)
-        power = powers[index]
-        print(f"power={power}")
-        self.power_textbox.setText(power)
-        return power
-    
-
-
-
-    #lookup the power in the dictionary and check if it has bonus/optional 
+    #lookup the power in the dictionary and check if it has bonus/optional
     #powers and display them in the appropriate boxes
-    def get_bonus_optional_powers(self, powerslist, powername):
-        for power, data in powerslist.items():
-            if power == powername and len(data) > 1:  # Check if there's a dictionary with extra properties
-                bonus_powers = data[1].get("bonus", [])
-                option_powers = data[1].get("option", [])
-                
-                has_bonus = bool(bonus_powers)  # True if list is not empty
-                has_option = bool(option_powers)  # True if list is not empty
-                
-                if has_bonus:
-                    self.bonus_powers_listbox.setEnabled(True)
-                    for bonus_power in bonus_powers:
-                        item = QListWidgetItem(bonus_power)
-                        item.setSizeHint(QSize(0, 22))
-                        self.bonus_powers_listbox.addItem(item)
-                if has_option:
-                    self.optional_powers_listbox.setEnabled(True)
-                    for option_power in option_powers:
-                        item = QListWidgetItem(option_power)
-                        item.setSizeHint(QSize(0, 22))
-                        self.optional_powers_listbox.addItem(item)
+    def get_bonus_optional_powers(self, power_class, powername):
+        bonus_powers, option_powers = engine.get_bonus_optional_powers(power_class, powername)
+
+        if bonus_powers:
+            self.bonus_powers_listbox.setEnabled(True)
+            for bonus_power in bonus_powers:
+                item = QListWidgetItem(bonus_power)
+                item.setSizeHint(QSize(0, 22))
+                self.bonus_powers_listbox.addItem(item)
+        if option_powers:
+            self.optional_powers_listbox.setEnabled(True)
+            for option_power in option_powers:
+                item = QListWidgetItem(option_power)
+                item.setSizeHint(QSize(0, 22))
+                self.optional_powers_listbox.addItem(item)
 
 
 
     #Click the Add Power button
-    #Roll the rank of the power and add the power and any bonus and optional 
+    #Roll the rank of the power and add the power and any bonus and optional
     #powers to the Powers list and update the min/max label
     def add_power(self):
         #get the power name and power class
         power = self.power_textbox.text()
-        power_class_item = self.power_classes_listbox.currentItem()
-        power_class = power_class_item.text()
-        print(f"****** Adding {power} ********")
-        print(f"resource_rank={self.resources_rank}")
+        power_class = self.power_classes_listbox.currentRow()
         #if there are items in the bonus list box and none are selected
         bonus_powers = self.bonus_powers_listbox.count()
         if not self.bonus_powers_listbox.selectedItems() and bonus_powers:
-            print("Bonus Power not selected!")
-            self.display_message(resource_path('images/oops.jpg'), "Bonus Power Not Selected!", "You need to select a Bonus Power!", "warning", buttons=0)
+            self.display_message('oops.jpg', "Bonus Power Not Selected!", "You need to select a Bonus Power!", "warning", buttons=0)
 
         else:
-            #check if the powers selected exceeds the number of available power slots
-            min = self.number_of_powers["min"]
-            max = self.number_of_powers["max"]
-            print(f"getting cost of currently selected powers...")
-            print(f"powerclass={power_class}, powername={power}")
-            #get the power class dictionary to look up the power cost
-            powerlist = powerlists.all_power_lists[power_class]
-            #get the cost of the main power if there is one; 
-            #user may be adding just a bonus or optional power
-            if power != '':
-                cost = powerlist[power][0]
-                print(f"powercost={cost}")
+            bonus_powers_selected = [item.text() for item in self.bonus_powers_listbox.selectedItems()]
+            option_powers_selected = [item.text() for item in self.optional_powers_listbox.selectedItems()]
+            #check if the powers selected exceeds the number of available power
+            #slots, else roll the power ranks and add them to the Powers List
+            result = self.character.add_power(power_class, power, bonus_powers_selected,
+                                              option_powers_selected,
+                                              biophysical_choice=self.biophysical_choice)
+            if result == "slots": #cost exceeds the maximum number of powers display a warning message
+                self.display_message('oops.jpg', "Not Enough Power Slots!", "You do not have enough Power slots to add this power!", "warning", buttons=0)
+
+            elif power == "Power Simulation":
+                #Magical Power Simulation replaced the power class with the simulated power class
+                self.power_textbox.clear()
+                self.show_power_classes()
+
             else:
-                cost = 0
-            #find the cost of any bonus and/or optional powers selected
-            bonus_powers_selected = self.bonus_powers_listbox.selectedItems()
-            option_powers_selected = self.optional_powers_listbox.selectedItems()
-            if bonus_powers_selected:
-                for bonus_power in bonus_powers_selected:
-                    bonus_power_text = bonus_power.text()
-                    if "*" in bonus_power_text:
-                        cost += 2
-                    else:
-                        cost += 1
-            if option_powers_selected:
-                for option_power in option_powers_selected:
-                    option_power_text = option_power.text()
-                    if "*" in option_power_text:
-                        cost += 2
-                    else:
-                        cost += 1
-                    #Power Classes are not added to the cost but are added to the Power Classes List
-                    if option_power_text == "Energy Control" or option_power_text == "Energy Emission" or option_power_text == "Magical Power":
-                        cost -= 1
-            print(f"powercost={cost}, min={min}/max={max}")
-            cost += min #add the cost of the power(s) and the current minimum slots used
-            print(f"powercost+min={cost}, min={min}/max={max}")
-            if cost > max: #cost exceeds the maximum number of powers display a warning message
-                print("Not enough power slots available!")
-                self.display_message(resource_path('images/oops.jpg'), "Not Enough Power Slots!", "You do not have enough Power slots to add this power!", "warning", buttons=0)
-
-            else:#roll the power ranks and add them to the Powers List and update the min/max
-                #first check if the power is Magical Power Simulation and if so randomly determine the simulated power class and add it to the Power Class list
-                if power == "Power Simulation":
-                    power_class = self.roll_power_class()
-                    item = QListWidgetItem(power_class)
-                    item.setSizeHint(QSize(0, 22))
-                    self.power_classes_listbox.addItem(item)
-                    self.power_textbox.clear()
-                    self.power_classes_listbox.takeItem(self.power_classes_listbox.row(power_class_item))
-                    return
-                #roll the rank for the main power and display it in the Powers list
                 self.powers_listbox.setEnabled(True)
-                roll = randint(1,100)
-                item = self.physical_form_list.currentItem()
-                selected_text = item.text()
-                table = self.physicalforms[selected_text]
-                #if one of the two physical forms with a table that depends on 
-                #the optional form, get the table for the optional form
-                if selected_text == "Demihuman-Avian":
-                    current_row = self.options_list.currentRow()
-                    print(current_row)
-                    if current_row == 0:
-                        table = self.physicalforms[selected_text]["Angelic"]
-                    else:
-                        table = self.physicalforms[selected_text]["Harpy"]
-                if selected_text == "Animal":
-                    current_row = self.options_list.currentRow()
-                    print(current_row)
-                    if current_row == 0:
-                        table = self.physicalforms[selected_text]["Terrestrial"]
-                    else:
-                        table = self.physicalforms[selected_text]["Extraterrestrial"]
-
-                rank_index = self.ability_roll(table, roll)
-                #check if the Power Rank is above Remarkable and flag it for the
-                #possibility of a Fatal Weakness
-                if rank_index > 6:
-                    self.power_rank_above_remarkable = 1
-
-                rank = self.ranks[rank_index]
-                score = self.min_std_rank_score(rank)
-                print(f"roll={roll}, rank={rank}\\{rank_index}, score={score}")
-                if power != '':
-                    if power_class == "Energy Emission":
-                        epoint = self.energy_emission_body_part()
-                        item = QListWidgetItem(f"{power} - {rank} ({score}); emitted from {epoint}")
-                    elif power == "Biophysical Control*":#show the option window
-                        dialog = BiophysicalOptionDialog(self)
-                        if dialog.exec():#get the user's selected option
-                            selected_option = dialog.get_selected_option()
-                            if selected_option == "Random":#if random was selected roll the option
-                                selected_option = self.biophysical_random_option()
-                            if selected_option:
-                                item = QListWidgetItem(f"{power} ({selected_option}) - {rank} ({score})")
-                    elif power == "Growth":
-                        roll = randint(1,100)
-                        if roll <=25:
-                            growth_type = "Atomic Dispersal"
-                        elif roll <= 75:
-                            growth_type = "Atomic Gain"
-                        else:
-                            growth_type = "Atomic Growth"
-                        item = QListWidgetItem(f"{power} - {rank} ({score}); growth type: {growth_type}")
-                    elif power == "Shrinking":
-                        roll = randint(1,100)
-                        if roll <=20:
-                            shrink_type = "Atomic Collapse"
-                        elif roll <= 40:
-                            shrink_type = "Atomic Reduction"
-                        else:
-                            shrink_type = "Atomic Shrinkage"
-                        item = QListWidgetItem(f"{power} - {rank} ({score}); shrink type: {shrink_type}")
-                    else:
-                        item = QListWidgetItem(f"{power} - {rank} ({score})")
-
-                    item.setSizeHint(QSize(0, 22))
-                    self.powers_listbox.addItem(item)
-
-                #roll the power ranks for the bonus powers
-                for bonus_power in bonus_powers_selected:
-                    roll = randint(1,100)
-                    rank_index = self.ability_roll(table, roll)
-                    rank = self.ranks[rank_index]
-                    score = self.min_std_rank_score(rank)
-                    bonus_power_name = bonus_power.text()
-                    print(f"roll={roll}, rank={rank}\\{rank_index}, score={score}")
-                    #if energy emission power check for emission point
-                    if bonus_power_name in powerlists.energy_emission_powers_list.keys():
-                        epoint = self.energy_emission_body_part()
-                        item = QListWidgetItem(f"{bonus_power_name} - {rank} ({score}); emitted from {epoint}")
-                        item.setSizeHint(QSize(0, 22))
-                        self.powers_listbox.addItem(item)
-                    else:
-                        item = QListWidgetItem(f"{bonus_power_name} - {rank} ({score})")
-                        item.setSizeHint(QSize(0, 22))
-                        self.powers_listbox.addItem(item)
+                self.show_powers()
                 self.bonus_powers_listbox.clear()
-                #roll the power ranks for the optional powers
-                for option_power in option_powers_selected:
-                    roll = randint(1,100)
-                    rank_index = self.ability_roll(table, roll)
-                    rank = self.ranks[rank_index]
-                    score = self.min_std_rank_score(rank)
-                    option_power_name = option_power.text()
-                    print(f"roll={roll}, rank={rank}\\{rank_index}, score={score}")
-                    #if the optional power is a power class add it to the Power Class list and not the Powers list
-                    if option_power_name != "Energy Emission" and option_power_name != "Energy Control" and option_power_name != "Magical Power":
-                        #if energy emission power check for emission point
-                        if option_power_name in powerlists.energy_emission_powers_list.keys():
-                            epoint = self.energy_emission_body_part()
-                            item = QListWidgetItem(f"{option_power_name} - {rank} ({score}); emitted from {epoint}")
-                            item.setSizeHint(QSize(0, 22))
-                            self.powers_listbox.addItem(item)
-                        elif option_power_name == "Biophysical Control*":#show the option window
-                            dialog = BiophysicalOptionDialog(self)
-                            if dialog.exec():#get the user's selected option
-                                selected_option = dialog.get_selected_option()
-                                if selected_option == "Random":#if random was selected roll the option
-                                    selected_option = self.biophysical_random_option()
-                                if selected_option:
-                                    item = QListWidgetItem(f"{power} ({selected_option}) - {rank} ({score})")
-                                    item.setSizeHint(QSize(0, 22))
-                                    self.powers_listbox.addItem(item)
-                        else:
-                            item = QListWidgetItem(f"{option_power_name} - {rank} ({score})")
-                            item.setSizeHint(QSize(0, 22))
-                            self.powers_listbox.addItem(item)
-                    elif option_power_name == "Magical Power":#convert Magical Power to Magical when adding it to the Power Classes list
-                        item = QListWidgetItem("Magical")
-                        item.setSizeHint(QSize(0, 22))
-                        self.power_classes_listbox.addItem(item)
-                    else:
-                        item = QListWidgetItem(option_power_name)
-                        item.setSizeHint(QSize(0, 22))
-                        self.power_classes_listbox.addItem(item)
-
                 self.optional_powers_listbox.clear()
 
                 self.bonus_powers_listbox.setEnabled(False)
                 self.optional_powers_listbox.setEnabled(False)
-                    
-                #calculate the new min power slots and update the label
-                self.number_of_powers["min"] = cost
-                self.num_powers_label.setText(f"Min: {cost} / Max: {max}")
 
-                #remove the selected powers and remove the power class; 
+                #remove the selected powers and remove the power class;
                 #If the Power Classes list is empty enable the generate weakness button,
-                #disable the roll and add power buttons (they will be re-enabled if the 
+                #disable the roll and add power buttons (they will be re-enabled if the
                 #user uses the Power Classes button) and empty the bonus and optional power lists
                 self.power_textbox.clear()
-                self.power_classes_listbox.takeItem(self.power_classes_listbox.row(power_class_item))
+                self.show_power_classes()
                 self.add_power_button.setEnabled(False)
                 if self.power_classes_listbox.count() == 0:#Power Class list is empty
                     self.generate_weakness_button.setEnabled(True)
@@ -2643,93 +1553,52 @@ class MainWindow(QMainWindow):
                     self.bonus_powers_listbox.clear()
                     self.optional_powers_listbox.clear()
                     self.generate_weakness_button.setFocus()
-                    self.villain_bubble_pixmap = QPixmap(resource_path('images/superskrull_bubble.jpg'))
+                    self.villain_bubble_pixmap = images.pixmap('superskrull_bubble.jpg')
                     self.villain_bubble_image.setPixmap(self.villain_bubble_pixmap)
-                    self.villain_pixmap = QPixmap(resource_path('images/superskrull.jpg'))
+                    self.villain_pixmap = images.pixmap('superskrull.jpg')
                     self.villain_image.setPixmap(self.villain_pixmap)
-                elif cost == max:#maximum number of Power slots has been used
-                    self.villain_bubble_pixmap = QPixmap(resource_path('images/kang_bubble.jpg'))
+                elif self.character.number_of_powers["min"] == self.character.number_of_powers["max"]:#maximum number of Power slots has been used
+                    self.villain_bubble_pixmap = images.pixmap('kang_bubble.jpg')
                     self.villain_bubble_image.setPixmap(self.villain_bubble_pixmap)
-                    self.villain_pixmap = QPixmap(resource_path('images/kang.jpg'))
+                    self.villain_pixmap = images.pixmap('kang.jpg')
                     self.villain_image.setPixmap(self.villain_pixmap)
                 else:#continue selecting a class until the Power Class list is empty
                     self.power_classes_listbox.setFocus()
-                    self.villain_bubble_pixmap = QPixmap(resource_path('images/ultron_bubble.jpg'))
+                    self.villain_bubble_pixmap = images.pixmap('ultron_bubble.jpg')
                     self.villain_bubble_image.setPixmap(self.villain_bubble_pixmap)
-                    self.villain_pixmap = QPixmap(resource_path('images/ultron.jpg'))
+                    self.villain_pixmap = images.pixmap('ultron.jpg')
                     self.villain_image.setPixmap(self.villain_pixmap)
-                
+
+
+
+    #show the Biophysical Control option window and return the user's
+    #selected option ("Random" or "" if the window was cancelled)
+    def biophysical_choice(self):
+        dialog = BiophysicalOptionDialog(self)
+        if dialog.exec():#get the user's selected option
+            return dialog.get_selected_option()
+        return ""
+
 
 
     #Click the Powers list; prompts user to remove the selected power
-    def powers_list_selected(self, power_item):
-        if power_item.flags() & Qt.ItemFlag.ItemIsEnabled:
-            result = self.display_message(resource_path('images/question.jpg'), "Confirm Removing Power", "Are you sure you want to remove this power?", "question", buttons=1)
+    def powers_list_selected(self, power_index):
+        if self.powers_model.flags(power_index) & Qt.ItemFlag.ItemIsEnabled:
+            result = self.display_message('question.jpg', "Confirm Removing Power", "Are you sure you want to remove this power?", "question", buttons=1)
             if result == QMessageBox.StandardButton.Ok:
-                print("User clicked OK")
-                #refund a power slot depending on how much the power cost (if it has a *)
-                min = self.number_of_powers["min"]
-                max = self.number_of_powers["max"]
-                print(f"Number of powers - min={min} / max={max}")
-                power_text = power_item.text()
-                print(f"power_item={power_item} / power_text={power_text}")
-                if "*" in power_text:
-                    min -= 2
-                else:
-                    min -= 1
-                self.number_of_powers["min"] = min
-                self.num_powers_label.setText(f"Min: {min} / Max: {max}")
-                power = self.powers_listbox.currentRow()
-                self.powers_listbox.takeItem(power)
-            elif result == QMessageBox.StandardButton.Cancel:
-                print("User clicked Cancel")
+                #refund the power slots the power used
+                self.character.remove_power(power_index.row())
+                self.show_powers()
 
 
 
     #Click the Generate Weakness button
     def generate_weakness(self):
-        #Roll Stimulus
-        s_roll = randint(1, 100)
-        if s_roll < 14:
-            stimulus = "Elemental Allergy"
-        elif s_roll < 19:
-            stimulus = "Molecular Allergy"
-        elif s_roll < 44:
-            stimulus = "Energy Allergy"
-        elif s_roll < 69:
-            stimulus = "Energy Depletion"
-        elif s_roll < 82:
-            stimulus = "Energy Dampening"
-        elif s_roll < 95:
-            stimulus = "Finite Limit"
-        else:
-            stimulus = "Psychological"
-        
-        #Roll Effect
-        e_roll = randint(1, 100)
-        if e_roll < 51:
-            effect = "Power Negation"
-        elif e_roll < 91:
-            effect = "Incapacitation"
-        elif self.power_rank_above_remarkable:
-            effect = "Fatal"
-        else:
-            effect = "Incapacitation"
-
-        #Roll Duration
-        d_roll = randint(1, 100)
-        if d_roll < 41:
-            duration = "Continuous with Contact"
-        elif d_roll < 61:
-            duration = "Limited Duration with Contact"
-        elif d_roll < 61:
-            duration = "Limited Duration after Contact"
-        else:
-            duration = "Permanent"
+        self.character.generate_weakness()
 
         #add to the Weakness textboxes on the Powers tab and Physical Forms tab
-        self.powers_weakness_textbox.insertPlainText(f"{stimulus} causes {effect} that is {duration}")
-        self.weakness_textbox.insertPlainText(f"{stimulus} causes {effect} that is {duration}")
+        self.powers_weakness_textbox.insertPlainText(self.character.weakness)
+        self.weakness_textbox.insertPlainText(self.character.weakness)
 
         #disable the rest of the buttons on the Powers tab and enable the Talents tab
         self.generate_weakness_button.setEnabled(False)
@@ -2737,155 +1606,91 @@ class MainWindow(QMainWindow):
         self.buy_power_button.setEnabled(False)
         self.remove_power_button.setEnabled(False)
         self.powers_listbox.setEnabled(False)
-        self.tab_widget.setTabEnabled(3, True)
+        self.enable_tab(3)
         self.roll_talent_classes_button.setEnabled(True)
 
-        self.villain_bubble_pixmap = QPixmap(resource_path('images/juggernaut_bubble.jpg'))
+        self.villain_bubble_pixmap = images.pixmap('juggernaut_bubble.jpg')
         self.villain_bubble_image.setPixmap(self.villain_bubble_pixmap)
-        self.villain_pixmap = QPixmap(resource_path('images/juggernaut.jpg'))
+        self.villain_pixmap = images.pixmap('juggernaut.jpg')
         self.villain_image.setPixmap(self.villain_pixmap)
-        self.talent_pixmap = QPixmap(resource_path('images/punisher.jpg'))
+        self.talent_pixmap = images.pixmap('punisher.jpg')
         self.talent_image.setPixmap(self.talent_pixmap)
 
 
 
     #Click the Roll Talent Classes button
     def roll_talent_classes(self):
-        print("Rolling Talent Classes...")
-        print(f"resource_rank={self.resources_rank}")
         self.talent_classes_listbox.clear()
         self.talent_classes_listbox.setEnabled(True)
         self.roll_talent_button.setEnabled(False)
         self.select_talent_listbox.clear()
-        self.talents_listbox.clear()
         self.talents_listbox.setEnabled(False)
-        self.roll_number_powers("talents")
-        min = self.number_of_talents["min"]
-        max = self.number_of_talents["max"]
-        print(f"Number of talents - min={min} / max={max}")
-        self.villain_bubble_pixmap = QPixmap(resource_path(''))
+        #roll the number of talents and a talent class for each minimum
+        #talent number slot
+        self.character.roll_talent_classes()
+        self.villain_bubble_pixmap = images.null_pixmap()
         self.villain_bubble_image.setPixmap(self.villain_bubble_pixmap)
-        self.villain_pixmap = QPixmap(resource_path(''))
+        self.villain_pixmap = images.null_pixmap()
         self.villain_image.setPixmap(self.villain_pixmap)
-        if min == 0:
+        if not self.character.talent_classes:
+            self.enable_tab(4)
             self.roll_contact_classes_button.setEnabled(True)
             self.talent_classes_listbox.setEnabled(False)
-            self.tab_widget.setTabEnabled(4, True)
-            self.talent2_pixmap = QPixmap(resource_path('images/capt_marvel.jpg'))
+            self.talent2_pixmap = images.pixmap('capt_marvel.jpg')
             self.talent2_image.setPixmap(self.talent2_pixmap)
-            self.contact_pixmap = QPixmap(resource_path('images/wolverine.jpg'))
+            self.contact_pixmap = images.pixmap('wolverine.jpg')
             self.contact_image.setPixmap(self.contact_pixmap)
         else:
             self.tab_widget.setTabEnabled(4, False)
-            self.roll_contact_classes_button.setEnabled(False)
-            self.talent2_pixmap = QPixmap(resource_path('images/spidey.jpg'))
+            if self.tab_built(4):
+                self.roll_contact_classes_button.setEnabled(False)
+            self.talent2_pixmap = images.pixmap('spidey.jpg')
             self.talent2_image.setPixmap(self.talent2_pixmap)
-        #add talent class to the list for each minimum talent number slot
-        while min > 0:
-            print(f"min={min}")
-            self.roll_talent_class()
-            min -= 1
-            print(f"min={min}")
-        #set the min to 0 to start adding from 0 when talents are added to the list
-        self.number_of_talents["min"] = min
-        self.num_talents_label.setText(f"Min: {min} / Max: {max}")
+        self.show_talent_classes()
+        self.show_talents()
         #enable buy and remove buttons
         self.buy_talent_button.setEnabled(True)
         self.remove_talent_button.setEnabled(True)
-        self.talent_pixmap = QPixmap("")
+        self.talent_pixmap = images.null_pixmap()
         self.talent_image.setPixmap(self.talent_pixmap)
-        #if talents were purchased for Resources, reset back to original Resources
-        if self.talent_bought:
-            print("Resources were spent on Talents, resetting...")
-            #get the current index of the current Resource rank
-            resources_item = self.secondary_ability_inputs["resources"]["rank"]
-            resources_score_text = self.secondary_ability_inputs["resources"]["score"]
-            resources_text = resources_item.text()
-            index = self.ranks.index(resources_text)
-            #return the spent resources and update the textboxes
-            new_rank_index = index + self.talent_bought
-            self.resources_rank = new_rank_index
-            print(f"resource_rank={self.resources_rank}")
-            new_rank_name = self.ranks[new_rank_index]
-            print(f"resources_item{resources_item} / resources_score_text={resources_score_text}")
-            print(f"resources_text={resources_text} / index={index}")
-            print(f"new_rank_index={new_rank_index} / new_rank_name={new_rank_name}")
-            resources_item.setText(new_rank_name)
-            if self.std_rank_scores == 0:
-                #minimum rank scores
-                resources_score_text.setText(str(self.rank_scores[new_rank_name][0]))
-            else:
-                #standard rank scores
-                resources_score_text.setText(str(self.rank_scores[new_rank_name][1]))
-            self.talent_bought = 0
-        print(f"self.talent_bought={self.talent_bought}")
 
 
 
     #Click the Buy Talents button
     def buy_talent(self):
-        #first check if there are enough resources and reduce resources by one 
+        #first check if there are enough resources and reduce resources by one
         #rank or if buying a talent will exceed the maximum number of talents
         #and display the new rank and score on the Abilities tab
-        print("Buying Talent!")
-        print(f"resource_rank={self.resources_rank}")
-        current_resources = self.resources_rank
-        new_resources = current_resources - 1
-        num_talents = self.talent_classes_listbox.count()
-        max_talents = self.number_of_talents["max"]
-        print(f"current_resources={current_resources}, new_resources={new_resources}")
-        if new_resources < 0:
-            print("Not enough resources!")
-            self.display_message(resource_path('images/oops.jpg'), "Not Enough Resources!", "You do not have enough Resources to purchase another talent!", "warning", buttons=0)
-        elif num_talents == max_talents:
-            print("Not enough talent slots!")
-            self.display_message(resource_path('images/oops.jpg'), "Not Enough Talent Slots!", "You do not have enough Talent slots to purchase another talent!", "warning", buttons=0)
+        result = self.character.buy_talent()
+        if result == "resources":
+            self.display_message('oops.jpg', "Not Enough Resources!", "You do not have enough Resources to purchase another talent!", "warning", buttons=0)
+        elif result == "slots":
+            self.display_message('oops.jpg', "Not Enough Talent Slots!", "You do not have enough Talent slots to purchase another talent!", "warning", buttons=0)
         else:
-            new_rank = self.ranks[new_resources]
-            resources_text = self.secondary_ability_inputs["resources"]["rank"]
-            resources_score_text = self.secondary_ability_inputs["resources"]["score"]
-            resources_text.setText(new_rank)
-            if self.std_rank_scores == 0:
-                #minimum rank scores
-                resources_score_text.setText(str(self.rank_scores[new_rank][0]))
-            else:
-                #standard rank scores
-                resources_score_text.setText(str(self.rank_scores[new_rank][1]))
-            
-            #roll an additional talent class and add it to the list
-            print("Adding Talent!")
-            self.roll_talent_class()
-            self.talent_bought += 1
-            self.resources_rank -= 1
+            #add the additional talent class to the list
+            self.show_talent_classes()
             self.talent_classes_listbox.setEnabled(True)
-            print(f"resources_rank={self.resources_rank}")
-            print(f"self.talent_bought={self.talent_bought}")
-            self.talent2_pixmap = QPixmap(resource_path('images/spidey.jpg'))
+            self.talent2_pixmap = images.pixmap('spidey.jpg')
             self.talent2_image.setPixmap(self.talent2_pixmap)
 
 
 
     #Click the Remove Talnets button
     def remove_talent(self):
-        print("Removing Talent...")
-        print(f"resource_rank={self.resources_rank}")
         #Add a check if a power class was selected first
         selected_items = self.talent_classes_listbox.selectedItems()
         if not selected_items:
-            self.display_message(resource_path('images/oops.jpg'), "No Talent Class Selected!", "You need to select a Talent Class to remove!", "warning", buttons=0)
+            self.display_message('oops.jpg', "No Talent Class Selected!", "You need to select a Talent Class to remove!", "warning", buttons=0)
         else:
-            result = self.display_message(resource_path('images/question.jpg'), "Confirm Removing Talent", "Are you sure you want to remove this talent class?", "question", buttons=1)
+            result = self.display_message('question.jpg', "Confirm Removing Talent", "Are you sure you want to remove this talent class?", "question", buttons=1)
             if result == QMessageBox.StandardButton.Ok:
-                print("User clicked OK")
                 power = self.talent_classes_listbox.currentRow()
+                self.character.remove_talent_class(power)
                 self.talent_classes_listbox.takeItem(power)
-                #if the last power class was removed disable the roll and add power 
+                #if the last power class was removed disable the roll and add power
                 #buttons and enable the generate weakness button
                 if self.talent_classes_listbox.count() == 0:
-                    print("The last Talent Class was removed from the list")
                     self.talent_classes_listbox.setEnabled(False)
-            elif result == QMessageBox.StandardButton.Cancel:
-                print("User clicked Cancel")
 
 
 
@@ -2899,157 +1704,38 @@ class MainWindow(QMainWindow):
     #Click the Roll Talent button
     def roll_talent(self):
         #roll and determine talent from talent class
-        print("Rolling Talent!")
-        print(f"resource_rank={self.resources_rank}")
-        roll = randint(1,10)
         item = self.talent_classes_listbox.currentItem()
         talent_class = item.text()
         self.select_talent_listbox.clear()
         self.select_talent_listbox.setFocus()
         self.select_talent_listbox.setEnabled(True)
-        self.talent2_pixmap = QPixmap(resource_path('images/scarlet_witch.jpg'))
+        self.talent2_pixmap = images.pixmap('scarlet_witch.jpg')
         self.talent2_image.setPixmap(self.talent2_pixmap)
-        print(f"talent_class={talent_class}, roll={roll}")
-        if talent_class == "Weapon Skills":
-            if roll < 3:
-                self.select_talent_listbox.addItem("Guns")
-            elif roll < 6:
-                self.select_talent_listbox.addItem("Thrown Weapons")
-            elif roll < 7:
-                self.select_talent_listbox.addItem("Bows")
-            elif roll < 9:
-                self.select_talent_listbox.addItem("Blunt Weapons")
-            elif roll < 10:
-                self.select_talent_listbox.addItem("Sharp Weapons")
-            else:
-                self.select_talent_listbox.addItem("Oriental Weapons")
-                self.select_talent_listbox.addItem("Marksman*")
-                self.select_talent_listbox.addItem("Weapons Master*")
-                self.select_talent_listbox.addItem("Weapon Specialist*")
-        if talent_class == "Fighting Skills":
-            if roll == 1:
-                self.select_talent_listbox.addItem("Martial Arts A")
-            elif roll == 2:
-                self.select_talent_listbox.addItem("Martial Arts B")
-            elif roll == 3:
-                self.select_talent_listbox.addItem("Martial Arts C")
-            elif roll == 4:
-                self.select_talent_listbox.addItem("Martial Arts D")
-            elif roll == 5:
-                self.select_talent_listbox.addItem("Martial Arts E")
-            elif roll == 6:
-                self.select_talent_listbox.addItem("Wrestling")
-            elif roll == 7:
-                self.select_talent_listbox.addItem("Thrown Objects")
-            elif roll == 8:
-                self.select_talent_listbox.addItem("Tumbling")
-            else:
-                self.select_talent_listbox.addItem("Acrobatics")
-        if talent_class == "Professional Skills":
-            if roll == 1:
-                self.select_talent_listbox.addItem("Medicine*")
-            elif roll == 2:
-                self.select_talent_listbox.addItem("Law")
-                self.select_talent_listbox.addItem("Law Enforcement")
-            elif roll == 3:
-                self.select_talent_listbox.addItem("Pilot")
-            elif roll == 4:
-                self.select_talent_listbox.addItem("Military")
-            elif roll == 5:
-                self.select_talent_listbox.addItem("Business/Finance")
-            elif roll == 6:
-                self.select_talent_listbox.addItem("Journalism")
-            elif roll == 7:
-                self.select_talent_listbox.addItem("Engineering")
-            elif roll == 8:
-                self.select_talent_listbox.addItem("Crime")
-            elif roll == 9:
-                self.select_talent_listbox.addItem("Psychiatry")
-            else:
-                self.select_talent_listbox.addItem("Detective/Espionage")
-        if talent_class == "Scientific Skills":
-            if roll < 3:
-                self.select_talent_listbox.addItem("Chemistry")
-            elif roll < 5:
-                self.select_talent_listbox.addItem("Biology")
-            elif roll < 7:
-                self.select_talent_listbox.addItem("Geology")
-            elif roll == 7:
-                self.select_talent_listbox.addItem("Genetics")
-            elif roll == 8:
-                self.select_talent_listbox.addItem("Archeology")
-            elif roll == 9:
-                self.select_talent_listbox.addItem("Physics")
-                self.select_talent_listbox.addItem("Computers")
-            else:
-                self.select_talent_listbox.addItem("Electronics")
-        if talent_class == "Mystical and Mental Skills":
-            if roll < 3:
-                self.select_talent_listbox.addItem("Trance")
-            elif roll < 6:
-                self.select_talent_listbox.addItem("Mesmerism and Hypnosis")
-            elif roll < 8:
-                self.select_talent_listbox.addItem("Sleight of Hand")
-            elif roll < 10:
-                self.select_talent_listbox.addItem("Resist Domination")
-                self.select_talent_listbox.addItem("Mystic Origin*")
-            else:
-                self.select_talent_listbox.addItem("Occult Lore")
-        if talent_class == "Other Skills":
-            if roll < 3:
-                self.select_talent_listbox.addItem("Artist")
-            elif roll < 5:
-                self.select_talent_listbox.addItem("Languages")
-            elif roll < 7:
-                self.select_talent_listbox.addItem("First Aid")
-            elif roll < 9:
-                self.select_talent_listbox.addItem("Repair/Tinkering")
-            else:
-                self.select_talent_listbox.addItem("Trivia")
-                self.select_talent_listbox.addItem("Performer")
-                self.select_talent_listbox.addItem("Animal Training*")
-                self.select_talent_listbox.addItem("Heir to Fortune*")
-                self.select_talent_listbox.addItem("Student*")
-                self.select_talent_listbox.addItem("Leadership*")
+        for talent in engine.roll_talent(talent_class, self.character.rng):
+            self.select_talent_listbox.addItem(talent)
+
 
-    
 
     #Click or hit Enter on an item in the Select Talent listbox
     def select_talent_selected(self, selected_talent):
         #confirm the user wants to add the Talent
-        result = self.display_message(resource_path('images/question.jpg'), "Confirm Adding Talent", "Are you sure you want to add this Talent to the character?", "question", buttons=1)
+        result = self.display_message('question.jpg', "Confirm Adding Talent", "Are you sure you want to add this Talent to the character?", "question", buttons=1)
         if result == QMessageBox.StandardButton.Ok:
-            print("User clicked OK")
             #check if the talent selected exceeds the number of available talent slots
-            min = self.number_of_talents["min"]
-            max = self.number_of_talents["max"]
-            print(f"getting cost of currently selected talent...")
-            cost = 0
-            selected_talent_text = selected_talent.text()
-            if "*" in selected_talent_text:
-                cost += 2
-            else:
-                cost += 1
-            print(f"talentcost={cost}, min={min}/max={max}")
-            cost += min #add the cost of the talent and the current minimum slots used
-            print(f"talentcost+min={cost}, min={min}/max={max}")
-            if cost > max: #cost exceeds the maximum number of powers display a warning message
-                print("Not enough talent slots available!")
-                self.display_message(resource_path('images/oops.jpg'), "Not Enough Talent Slots!", "You do not have enough Talent slots to add this Talent!", "warning", buttons=0)
+            talent_class = self.talent_classes_listbox.currentRow()
+            result = self.character.add_talent(talent_class, selected_talent.text())
+            if result == "slots": #cost exceeds the maximum number of powers display a warning message
+                self.display_message('oops.jpg', "Not Enough Talent Slots!", "You do not have enough Talent slots to add this Talent!", "warning", buttons=0)
             else:
-                talent_class = self.talent_classes_listbox.currentRow()
                 self.talent_classes_listbox.takeItem(talent_class)
                 self.select_talent_listbox.clear()
                 self.select_talent_listbox.setEnabled(False)
                 self.talents_listbox.setEnabled(True)
-                self.talents_listbox.addItem(selected_talent_text)
-                #calculate the new min talent slots and update the label
-                self.number_of_talents["min"] = cost
-                self.num_talents_label.setText(f"Min: {cost} / Max: {max}")
+                self.show_talents()
                 #if the last Talent class was removed disable the talent classes
-                #and roll talent buttons and enable the Contacts tab 
+                #and roll talent buttons and enable the Contacts tab
                 if self.talent_classes_listbox.count() == 0:
-                    if cost == max:
+                    if self.character.number_of_talents["min"] == self.character.number_of_talents["max"]:
                         self.roll_talent_classes_button.setEnabled(False)
                         self.talent_classes_listbox.setEnabled(False)
                         self.select_talent_listbox.setEnabled(False)
@@ -3059,51 +1745,32 @@ class MainWindow(QMainWindow):
                         self.talent_classes_listbox.setEnabled(False)
                     self.roll_talent_button.setEnabled(False)
                     self.talents_listbox.setFocus()
-                    self.tab_widget.setTabEnabled(4, True)
+                    self.enable_tab(4)
                     self.roll_contact_classes_button.setEnabled(True)
-                    self.talent2_pixmap = QPixmap(resource_path('images/beast.jpg'))
+                    self.talent2_pixmap = images.pixmap('beast.jpg')
                     self.talent2_image.setPixmap(self.talent2_pixmap)
-                    self.contact_pixmap = QPixmap(resource_path('images/wolverine.jpg'))
+                    self.contact_pixmap = images.pixmap('wolverine.jpg')
                     self.contact_image.setPixmap(self.contact_pixmap)
                 else:
                     self.talent_classes_listbox.setFocus()
-                    self.talent2_pixmap = QPixmap(resource_path('images/falcon.jpg'))
+                    self.talent2_pixmap = images.pixmap('falcon.jpg')
                     self.talent2_image.setPixmap(self.talent2_pixmap)
-        elif result == QMessageBox.StandardButton.Cancel:
-            print("User clicked Cancel")
 
 
 
     #Clicking or hitting Enter on Talent List
-    def talent_list_selected(self, talent_item):
+    def talent_list_selected(self, talent_index):
         #confirm removal of selected Talent
-        result = self.display_message(resource_path('images/question.jpg'), "Confirm Removing Talent", "Are you sure you want to remove this talent?", "question", buttons=1)
+        result = self.display_message('question.jpg', "Confirm Removing Talent", "Are you sure you want to remove this talent?", "question", buttons=1)
         if result == QMessageBox.StandardButton.Ok:
-            print("User clicked OK")
-            #refund a power slot depending on how much the power cost (if it has a *)
-            min = self.number_of_talents["min"]
-            max = self.number_of_talents["max"]
-            print(f"Number of talents - min={min} / max={max}")
-            talent_text = talent_item.text()
-            print(f"power_item={talent_item} / power_text={talent_text}")
-            if "*" in talent_text:
-                min -= 2
-            else:
-                min -= 1
-            self.number_of_talents["min"] = min
-            self.num_talents_label.setText(f"Min: {min} / Max: {max}")
-            talent = self.talents_listbox.currentRow()
-            self.talents_listbox.takeItem(talent)
-        elif result == QMessageBox.StandardButton.Cancel:
-            print("User clicked Cancel")
+            #refund the talent slots the talent used
+            self.character.remove_talent(talent_index.row())
+            self.show_talents()
+
 
-        
 
     #Click the Roll Contacts Button
     def roll_contact_classes(self):
-        print("Rolling Contact Classes...")
-        print(f"resource_rank={self.resources_rank}")
-        print(f"initial contacts: {self.initial_contacts}")
         self.contacts_classes_listbox.clear()
         self.contacts_classes_listbox.setEnabled(True)
         self.select_contact_listbox.clear()
@@ -3112,89 +1779,49 @@ class MainWindow(QMainWindow):
         self.buy_talent_button.setEnabled(False)
         self.remove_talent_button.setEnabled(False)
         self.talents_listbox.setEnabled(False)
-        self.talent2_pixmap = QPixmap("")
+        self.talent2_pixmap = images.null_pixmap()
         self.talent2_image.setPixmap(self.talent2_pixmap)
-        self.contact2_pixmap = QPixmap("")
+        self.contact2_pixmap = images.null_pixmap()
         self.contact2_image.setPixmap(self.contact2_pixmap)
-        
-        if self.initial_contacts > 0:
-            index = 0
-            item = self.contacts_listbox.item(index)
-            text = item.text()
-            self.contacts_listbox.clear()
-            item = QListWidgetItem(text)
-            item.setSizeHint(QSize(0, 22))
-            self.contacts_listbox.addItem(item)
-        else:
-            self.contacts_listbox.clear()
 
-        self.roll_number_powers("contacts")
-        min = self.number_of_contacts["min"]
-        max = self.number_of_contacts["max"]
+        #roll the number of contacts, keeping the physical form's contact;
+        #if contacts were purchased for Resources they are reset back to
+        #original Resources
+        self.character.roll_contact_classes()
+        self.show_contacts()
+        min = self.character.number_of_contacts["min"]
+        initial_contacts = self.character.initial_contacts
         #if minimum contacts is 0 user has to buy contacts up to the max
         #check for initial contacts from the physical form
         if min == 0:#if initial contacts are 0 from physical form
             self.contacts_classes_listbox.setEnabled(False)
-            self.contact2_pixmap = QPixmap(resource_path('images/uatu.jpg'))
+            self.contact2_pixmap = images.pixmap('uatu.jpg')
             self.contact2_image.setPixmap(self.contact2_pixmap)
-            self.contact_pixmap = QPixmap("")
+            self.contact_pixmap = images.null_pixmap()
             self.contact_image.setPixmap(self.contact_pixmap)
-        elif self.initial_contacts == 1: #if initial contacts is 1 from physical form
-            min = 1
-            self.contact2_pixmap = QPixmap(resource_path('images/uatu.jpg'))
+        elif initial_contacts == 1: #if initial contacts is 1 from physical form
+            self.contacts_classes_listbox.setEnabled(False)
+            self.contact2_pixmap = images.pixmap('uatu.jpg')
             self.contact2_image.setPixmap(self.contact2_pixmap)
-            self.contact_pixmap = QPixmap("")
+            self.contact_pixmap = images.null_pixmap()
             self.contact_image.setPixmap(self.contact_pixmap)
-        elif min == 1 and self.initial_contacts == 2:
+        elif min == 1 and initial_contacts == 2:
             # if initial contacts is at least one from physical form and one was rolled as min
             self.contacts_classes_listbox.setEnabled(False)
-            self.contact2_pixmap = QPixmap(resource_path('images/uatu.jpg'))
+            self.contact2_pixmap = images.pixmap('uatu.jpg')
             self.contact2_image.setPixmap(self.contact2_pixmap)
-            self.contact_pixmap = QPixmap("")
+            self.contact_pixmap = images.null_pixmap()
             self.contact_image.setPixmap(self.contact_pixmap)
         else:
             self.contacts_classes_listbox.setEnabled(True)
-            self.contact_pixmap = QPixmap(resource_path('images/daredevil.jpg'))
+            self.contact_pixmap = images.pixmap('daredevil.jpg')
             self.contact_image.setPixmap(self.contact_pixmap)
         #enable buy button
         self.buy_contact_button.setEnabled(True)
 
         #add contact classes to the list
-        self.contacts_classes_listbox.addItem("Professional")
-        self.contacts_classes_listbox.addItem("Scientific")
-        self.contacts_classes_listbox.addItem("Political")
-        self.contacts_classes_listbox.addItem("Mystic")
-
-        #if contacts were purchased for Resources, reset back to original Resources
-        if self.contact_bought:
-            print("Resources were spent on Contacts, resetting...")
-            #get the current index of the current Resource rank
-            resources_item = self.secondary_ability_inputs["resources"]["rank"]
-            resources_score_text = self.secondary_ability_inputs["resources"]["score"]
-            resources_text = resources_item.text()
-            index = self.ranks.index(resources_text)
-            #return the spent resources and update the textboxes
-            new_rank_index = index + self.contact_bought
-            self.resources_rank = new_rank_index
-            print(f"resource_rank={self.resources_rank}")
-            new_rank_name = self.ranks[new_rank_index]
-            print(f"resources_item{resources_item} / resources_score_text={resources_score_text}")
-            print(f"resources_text={resources_text} / index={index}")
-            print(f"new_rank_index={new_rank_index} / new_rank_name={new_rank_name}")
-            resources_item.setText(new_rank_name)
-            if self.std_rank_scores == 0:
-                #minimum rank scores
-                resources_score_text.setText(str(self.rank_scores[new_rank_name][0]))
-            else:
-                #standard rank scores
-                resources_score_text.setText(str(self.rank_scores[new_rank_name][1]))
-            self.contact_bought = 0
-        print(f"self.contact_bought={self.contact_bought}")
-        if self.initial_contacts > 0:
-            item = self.contacts_listbox.item(0)
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEnabled)
-        print(f"Number of contacts - min={min} / max={max}")
-        self.num_contacts_label.setText(f"Min: {min} / Max: {max}")
+        for contact_class in engine.contact_classes:
+            self.contacts_classes_listbox.addItem(contact_class)
 
 
 
@@ -3203,234 +1830,102 @@ class MainWindow(QMainWindow):
         self.select_contact_listbox.setEnabled(True)
         self.select_contact_listbox.setFocus()
         contact_class = item.text()
-        if contact_class == "Professional":
-            for contact in powerlists.professional_contacts:
-                self.select_contact_listbox.addItem(contact)
-        elif contact_class == "Scientific":
-            for contact in powerlists.scientific_contacts:
-                self.select_contact_listbox.addItem(contact)
-        elif contact_class == "Political":
-            for contact in powerlists.political_contacts:
-                self.select_contact_listbox.addItem(contact)
-        elif contact_class == "Mystic":
-            for contact in powerlists.mystic_contact:
-                self.select_contact_listbox.addItem(contact)
+        self.contact_class = contact_class
+        for contact in engine.contact_classes[contact_class]:
+            self.select_contact_listbox.addItem(contact)
 
 
 
     def select_contact_list_selected(self, selected_contact):
         #confirm the user wants to add the Contact
-        result = self.display_message(resource_path('images/question.jpg'), "Confirm Adding Contact", "Are you sure you want to add this Contact to the character?", "question", buttons=1)
+        result = self.display_message('question.jpg', "Confirm Adding Contact", "Are you sure you want to add this Contact to the character?", "question", buttons=1)
         if result == QMessageBox.StandardButton.Ok:
-            print("User clicked OK")
-            #check if the talent selected exceeds the number of available talent slots
-            min = self.number_of_contacts["min"]
-            max = self.number_of_contacts["max"]
-            print(f"contact min={min}/max={max}")
-            selected_contact_text = selected_contact.text()
-            item = QListWidgetItem(selected_contact_text)
-            item.setSizeHint(QSize(0, 22))
-            self.contacts_listbox.addItem(item)
-            current_num_contacts = self.contacts_listbox.count()
-            print(f"initial contacts: {self.initial_contacts}")
+            min = self.character.number_of_contacts["min"]
+            max = self.character.number_of_contacts["max"]
+            self.character.add_contact(selected_contact.text(), self.contact_class)
+            self.show_contacts()
+            current_num_contacts = len(self.character.contacts)
             #if min contacts have been reached, user must buy more contacts up to the max
             if current_num_contacts == max:
                 self.contacts_classes_listbox.setEnabled(False)
                 self.roll_contact_classes_button.setEnabled(False)
                 self.buy_contact_button.setEnabled(False)
                 self.save_button.setFocus()
-                self.contact2_pixmap = QPixmap(resource_path('images/uatu.jpg'))
+                self.contact2_pixmap = images.pixmap('uatu.jpg')
                 self.contact2_image.setPixmap(self.contact2_pixmap)
-                self.contact_pixmap = QPixmap("")
+                self.contact_pixmap = images.null_pixmap()
                 self.contact_image.setPixmap(self.contact_pixmap)
             elif current_num_contacts == min:
-                if self.initial_contacts >= 0 and self.initial_contacts < 2:
+                if self.character.initial_contacts >= 0 and self.character.initial_contacts < 2:
                     self.contacts_classes_listbox.setEnabled(False)
                     self.roll_contact_classes_button.setEnabled(False)
                     self.buy_contact_button.setEnabled(False)
-                    self.contacts_listbox
                     self.save_button.setFocus()
                 else:
                     self.contacts_classes_listbox.setEnabled(False)
                     self.save_button.setFocus()
-                self.contact2_pixmap = QPixmap(resource_path('images/uatu.jpg'))
+                self.contact2_pixmap = images.pixmap('uatu.jpg')
                 self.contact2_image.setPixmap(self.contact2_pixmap)
-                self.contact_pixmap = QPixmap("")
+                self.contact_pixmap = images.null_pixmap()
                 self.contact_image.setPixmap(self.contact_pixmap)
             else:
                 self.contacts_classes_listbox.setFocus()
-                self.contact_pixmap = QPixmap(resource_path('images/dr_strange.jpg'))
+                self.contact_pixmap = images.pixmap('dr_strange.jpg')
                 self.contact_image.setPixmap(self.contact_pixmap)
             self.select_contact_listbox.clear()
             self.select_contact_listbox.setEnabled(False)
 
-        elif result == QMessageBox.StandardButton.Cancel:
-            print("User clicked Cancel")
 
 
-
-    def contact_list_selected(self, selected_contact):
+    def contact_list_selected(self, contact_index):
         #confirm removal of selected Talent
-        if selected_contact.flags() & Qt.ItemFlag.ItemIsEnabled:
-            result = self.display_message(resource_path('images/question.jpg'), "Confirm Removing Contact", "Are you sure you want to remove this contact", "question", buttons=1)
+        if self.contacts_model.flags(contact_index) & Qt.ItemFlag.ItemIsEnabled:
+            result = self.display_message('question.jpg', "Confirm Removing Contact", "Are you sure you want to remove this contact", "question", buttons=1)
             if result == QMessageBox.StandardButton.Ok:
-                print("User clicked OK")
                 #refund a contact slot
-                min = self.number_of_contacts["min"]
-                max = self.number_of_contacts["max"]
-                print(f"Number of contacts - min={min} / max={max}")
-                contact_text = selected_contact.text()
-                print(f"contact_item={selected_contact} / contact_text={contact_text}")
-                min -= 1
-                self.number_of_contacts["min"] = min
-                self.num_contacts_label.setText(f"Min: {min} / Max: {max}")
-                contact = self.contacts_listbox.currentRow()
-                self.contacts_listbox.takeItem(contact)
-            elif result == QMessageBox.StandardButton.Cancel:
-                print("User clicked Cancel")
+                self.character.remove_contact(contact_index.row())
+                self.show_contacts()
+
 
 
-    
     def buy_contact(self):
-        #first check if there are enough resources and reduce resources by one 
+        #first check if there are enough resources and reduce resources by one
         #rank or if buying a contact will exceed the maximum number of contacts
         #and display the new rank and score on the Abilities tab
-        print("Buying Contact!")
-        print(f"resource_rank={self.resources_rank}")
-        current_resources = self.resources_rank
-        new_resources = current_resources - 1
-        num_contacts = self.contacts_listbox.count()
-        min = self.number_of_contacts["min"]
-        max = self.number_of_contacts["max"]
-        print(f"contact min={min}/max={max}")
-        print(f"current_resources={current_resources}, new_resources={new_resources}")
-        if new_resources < 0:
-            print("Not enough resources!")
-            self.display_message(resource_path('images/oops.jpg'), "Not Enough Resources!", "You do not have enough Resources to purchase another contact!", "warning", buttons=0)
-        elif num_contacts == max or min == max:
-            print("Not enough contact slots!")
-            self.display_message(resource_path('images/oops.jpg'), "Not Enough Contact Slots!", "You do not have enough Contact slots to purchase another contact!", "warning", buttons=0)
+        result = self.character.buy_contact()
+        if result == "resources":
+            self.display_message('oops.jpg', "Not Enough Resources!", "You do not have enough Resources to purchase another contact!", "warning", buttons=0)
+        elif result == "slots":
+            self.display_message('oops.jpg', "Not Enough Contact Slots!", "You do not have enough Contact slots to purchase another contact!", "warning", buttons=0)
         else:
-            new_rank = self.ranks[new_resources]
-            resources_text = self.secondary_ability_inputs["resources"]["rank"]
-            resources_score_text = self.secondary_ability_inputs["resources"]["score"]
-            resources_text.setText(new_rank)
-            if self.std_rank_scores == 0:
-                #minimum rank scores
-                resources_score_text.setText(str(self.rank_scores[new_rank][0]))
-            else:
-                #standard rank scores
-                resources_score_text.setText(str(self.rank_scores[new_rank][1]))
-            
-            #roll an additional talent class and add it to the list
-            print("Adding Contact!")
-            min +=1
-            self.contact_bought += 1
-            self.resources_rank -= 1
-            self.number_of_contacts["min"] = min
-            print(f"contact min={min}/max={max}")
-            if self.number_of_contacts["min"] > 0:
+            if self.character.number_of_contacts["min"] > 0:
                 self.contacts_classes_listbox.setEnabled(True)
-            self.num_contacts_label.setText(f"Min: {min} / Max: {max}")
-            print(f"resources_rank={self.resources_rank}")
-            print(f"self.contact_bought={self.contact_bought}")
+            self.show_contacts()
 
 
 
     def save_button_clicked(self):
-        print(f"Saving File!")
         file_path, _ = QFileDialog.getSaveFileName(self, "Save to File", "", "Text Files (*.txt);;All Files (*)")
         if file_path:
+            #copy the details typed in by the user to the character
+            self.character.name = self.name_textbox.text()
+            self.character.identity = self.identity_textbox.text()
             #determine which radion button is checked
             if self.secret_radio.isChecked():
-                secret = "(Secret)"
-                public = " "
+                self.character.identity_type = "Secret"
             elif self.public_radio.isChecked():
-                secret = " "
-                public = "(Public)"
+                self.character.identity_type = "Public"
             else:
-                secret = " "
-                public = " "
-
-            #get the physical form and any optional or compound/changeling forms
-            physical_form = self.physical_form_list.currentItem()
-            physical_form_name = physical_form.text()
-            print(f"physical_form_name={physical_form_name}")
-            if physical_form_name == "Compound" or physical_form_name == "Changeling":
-                if physical_form_name == "Compound":
-                    physical_form_name = "Compound Form: "
-                else:
-                    physical_form_name = "Changeling Form: "
-                num = self.compound_forms
-                for index in reversed(range(num)):
-                    form = self.compound_form_list[index]
-                    print(f"form={form}")
-                    print(f"physical_form_name={physical_form_name}")
-                    compound_index = self.compound_form_list.index(form)
-                    print(f"compound_index={compound_index}")
-                    option_form = self.compound_form_options_list[compound_index]
-                    print(f"option_form={option_form}")
-                    if option_form != "":
-                        print(f"option_form!=''")
-                        physical_form_name = physical_form_name + f"{form} "
-                        if index == 0:
-                            physical_form_name = physical_form_name + f"({option_form})"
-                        else:
-                            physical_form_name = physical_form_name + f"({option_form}), "
-                    elif index == 0:
-                        physical_form_name = physical_form_name + f"{form}"
-                    else:
-                        physical_form_name = physical_form_name + f"{form}, "
-            elif self.options_list.count() > 0:
-                item = self.options_list.currentItem()
-                item_text = item.text()
-                physical_form_name = f"{physical_form_name} ({item_text})"
-            print(f"physical_form_name={physical_form_name}")
-            print(f"Physical Form={physical_form}")
+                self.character.identity_type = ""
+            self.character.sex = self.sex_combobox.currentText()
+            self.character.age = self.age_textbox.text()
+            self.character.group = self.group_textbox.text()
+            self.character.base = self.base_textbox.text()
+            self.character.notes = self.notes_textbox.toPlainText()
 
             try:
                 with open(file_path, "w") as file:
-                    file.write(f"NAME: {self.name_textbox.text()}\n")
-                    file.write(f"IDENTITY: {self.identity_textbox.text()}   {secret}{public}\n")
-                    file.write(f"SEX: {self.sex_combobox.currentText()}     AGE: {self.age_textbox.text()}\n")
-                    file.write(f"GROUP AFFILIATION: {self.group_textbox.text()}     BASE OF OPERATIONS: {self.base_textbox.text()}\n\n")
-                    file.write(f"PHYSICAL FORM: {physical_form_name}\nORIGIN OF POWER: {self.origin_textbox.text()}\n")
-                    file.write(f"Bonuses: {self.bonuses_textbox.toPlainText()}\n")
-                    file.write(f"Penalties: {self.penalties_textbox.toPlainText()}\n")
-                    file.write(f"Weaknesses: {self.weakness_textbox.toPlainText()}\n")
-                    #exclude the Compound Form notes if they exist
-                    exclude_text = "Click each Compound form to determine which Table to use to roll Abilities and which Bonuses, Penalties, etc. are part of the Compound Form;"
-                    notes = self.notes_textbox.toPlainText()
-                    if notes.startswith(exclude_text):
-                        notes = notes[len(exclude_text):].lstrip()
-                    file.write(f"Notes: {notes}\n\n\n")
-                    file.write(f"ATTRIBUTES:\n")
-                    for ability in self.ability_inputs:
-                        rank_textbox = self.ability_inputs[ability]["rank"]
-                        score_textbox = self.ability_inputs[ability]["score"]
-                        rank = rank_textbox.text()
-                        score = score_textbox.text()
-                        file.write(f"{ability.capitalize()}: {rank} ({score})\n")
-                    file.write(f"\nHealth: {self.health}     Karma: {self.karma}     ")
-                    for ability in self.secondary_ability_inputs:
-                        if ability != "":
-                            rank_textbox = self.secondary_ability_inputs[ability]["rank"]
-                            score_textbox = self.secondary_ability_inputs[ability]["score"]
-                            rank = rank_textbox.text()
-                            score = score_textbox.text()
-                            file.write(f"{ability.capitalize()}: {rank} ({score})     ")
-                    file.write(f"\n\n\nPOWERS:\n")
-                    for power in self.powers_listbox.findItems("", Qt.MatchFlag.MatchContains):
-                        text = power.text()
-                        file.write(f"{text}\n")
-                    file.write(f"\n\nTALENTS:\n")
-                    for talent in self.talents_listbox.findItems("", Qt.MatchFlag.MatchContains):
-                        text = talent.text()
-                        file.write(f"{text}\n")
-                    file.write(f"\n\nCONTACTS:\n")
-                    for contact in self.contacts_listbox.findItems("", Qt.MatchFlag.MatchContains):
-                        text = contact.text()
-                        file.write(f"{text}\n")
+                    file.write(self.character.character_sheet())
 
                 QMessageBox.information(self, "Success", "File saved successfully!")
             except IOError:
@@ -3439,7 +1934,7 @@ class MainWindow(QMainWindow):
 
 
     def exit_button_clicked(self):
-        result = self.display_message(resource_path('images/question.jpg'), "Confirm Exit", "Are you sure you want to exit?", "question", buttons=1)
+        result = self.display_message('question.jpg', "Confirm Exit", "Are you sure you want to exit?", "question", buttons=1)
         if result == QMessageBox.StandardButton.Ok:
             QApplication.instance().quit()
 
@@ -3447,447 +1942,124 @@ class MainWindow(QMainWindow):
 
 
 ################### BACKEND FUNTIONS ###################
-    def ability_roll(self,table,roll):
-        print(f"Rolling Ability or Power Rank - roll={roll}; table={table}")
-        self.table_text_box.setText(f"Table {table}")
-        if table == 1:
-            if roll < 6:
-                power_rank_index = 1
-            elif roll < 11:
-                power_rank_index = 2
-            elif roll < 21:
-                power_rank_index = 3
-            elif roll < 41:
-                power_rank_index = 4
-            elif roll < 61:
-                power_rank_index = 5
-            elif roll < 81:
-                power_rank_index = 6
-            elif roll < 97:
-                power_rank_index = 7
-            else:
-                power_rank_index = 8
-
-        if table == 2:
-            if roll < 6:
-                power_rank_index = 1
-            elif roll < 26:
-                power_rank_index = 2
-            elif roll < 78:
-                power_rank_index = 3
-            elif roll < 96:
-                power_rank_index = 4
-            else:
-                power_rank_index = 5
-
-        if table == 3:
-            if roll < 6:
-                power_rank_index = 1
-            elif roll < 11:
-                power_rank_index = 2
-            elif roll < 41:
-                power_rank_index = 3
-            elif roll < 81:
-                power_rank_index = 4
-            elif roll < 96:
-                power_rank_index = 5
-            else:
-                power_rank_index = 6
-
-        if table == 4:
-            if roll < 6:
-                power_rank_index = 1
-            elif roll < 11:
-                power_rank_index = 2
-            elif roll < 16:
-                power_rank_index = 3
-            elif roll < 41:
-                power_rank_index = 4
-            elif roll < 51:
-                power_rank_index = 5
-            elif roll < 71:
-                power_rank_index = 6
-            elif roll < 91:
-                power_rank_index = 7
-            elif roll < 99:
-                power_rank_index = 8
-            else:
-                power_rank_index = 9
-        
-        if table == 5:
-            if roll < 11:
-                power_rank_index = 1
-            elif roll < 21:
-                power_rank_index = 2
-            elif roll < 31:
-                power_rank_index = 3
-            elif roll < 41:
-                power_rank_index = 4
-            elif roll < 61:
-                power_rank_index = 5
-            elif roll < 71:
-                power_rank_index = 6
-            elif roll < 81:
-                power_rank_index = 7
-            elif roll < 96:
-                power_rank_index = 8
-            else:
-                power_rank_index = 9
-
-        return power_rank_index
-    
-
-
-    #clear attributes
-    def clear_info(self):
-        self.fighting_bonus = 0
-        self.agility_bonus = 0
-        self.strength_bonus = 0
-        self.endurance_bonus = 0
-        self.reason_bonus = 0
-        self.intuition_bonus = 0
-        self.psyche_bonus = 0
-        self.resources_bonus = 0
-        self.popularity_bonus = 0
-        #resource/popularity_rank is used to make adding and subtracting 
-        #calculations using the current rank
-        self.resources_rank = -1
-        self.popularity_rank = -1
-        #pf_resources/popularity is used to determine ability set by physical form
-        self.pf_resources_rank = -1
-        self.pf_popularity_rank = -1
-        #original_resources is used to easily reset Resources back to original 
-        #if powers were purchased
-        self.original_resources_rank = -1
-        self.ability_bonus = 0
-        self.health = 0
-        self.karma = 0
-        self.health_multiplier = 1
-        self.power_bonus = 0
-        self.initial_contacts = -1
-        self.compound_forms = 0
-        self.current_compound_form_index = 0
-        self.current_compound_form = ""
-        self.compound_form_list = ["","","","",""]
-        self.compound_form_options_list = ["","","","",""]
-        self.std_rank_scores = 0
-        self.ability_bonus_button_was_clicked = 0
-        self.power_rank_above_remarkable = 0
-        self.number_of_powers = {"min": 0, "max": 0}
-        self.number_of_talents = {"min": 0, "max": 0}
-        self.number_of_contacts = {"min": 0, "max": 0}
-        self.purchased_powers = []
-        self.talent_bought = 0
-        self.contact_bought = 0
-        self.animal_detection = 0
-        self.energy_form = 0
-        self.deity_travel_power = 0
-        self.wings_travel_power = 0
-        self.detection_power = 0
-
-
-
     #toggle Standard Rank Scores on and off
     def toggle_std_rank(self):
-        print("Toggling Minimum/Standard ranks scores...")
         checked = self.std_rank_scores_action.isChecked()
-        self.health = 0
-        self.karma = 0
 
         if checked:#using standard rank scores
-            self.std_rank_scores = 1
+            self.character.set_std_rank_scores(1)
 
         else:#using minimun rank scores
-            self.std_rank_scores = 0
-
-        if self.abilities_button_rolled:
-            self.update_rank_scores(self.std_rank_scores)
+            self.character.set_std_rank_scores(0)
 
-            self.health = self.health * self.health_multiplier
-            self.health_textbox.setText(str(self.health))
-            self.karma_textbox.setText(str(self.karma))
+        if self.character.abilities_rolled:
+            self.show_powers()
 
 
 
-    def update_rank_scores(self, index):
-        #update the score boxes and Health and Karma totals on the Abilities tab
-        for ability, inputs in self.ability_inputs.items():
-            rank_textbox = self.ability_inputs[ability]["rank"]
-            rank_name = rank_textbox.text()
-            if ability in {"fighting", "agility", "strength", "endurance"}:
-                self.health += self.rank_scores[rank_name][index]
-            elif ability in {"reason", "intuition", "psyche"}:
-                self.karma += self.rank_scores[rank_name][index]
-            inputs["score"].setText(str(self.rank_scores[rank_name][index]))
-        for ability, inputs in self.secondary_ability_inputs.items():
-            rank_textbox = self.secondary_ability_inputs[ability]["rank"]
-            rank_name = rank_textbox.text()
-            inputs["score"].setText(str(self.rank_scores[rank_name][index]))
-        #update the power list
-        for power in self.powers_listbox.findItems("", Qt.MatchFlag.MatchContains):
-            #split words in the power(power - power rank (score))
-            text = power.text()
-            words = text.split(" ")
-            print(f"text={text}, words={words}")
-            for i, word in enumerate(words):
-                if "(" in word:
-                    print(f"word has parentheses={word}")
-                    score_index = i
-            #iterate through each word
-            for word in words:
-                #if the word is a rank name
-                if word in self.ranks:
-                    #get the appropriate score based on the rank name
-                    power_rank_score = (str(self.rank_scores[word][index]))
-                    #update the rank score in the list to the new score and 
-                    #update the power item in the power list
-                    #Energy Emission powers have more words with the emission 
-                    #point and should add the semicolon back
-                    if "emitted" in words:
-                        words[score_index] = f"({power_rank_score});"
-                    else:
-                        words[score_index] = f"({power_rank_score})"
-                    power.setText(f"{' '.join(words)}")
-
-
-
-    def fill_roll_textboxes(self, abilities, table):
-        #roll randomly for each ability then display the roll, rank and bonus
-        #for each ability in the Table column
-        print("*************fill_roll_textboxes*************")
-        print(f"resource_rank={self.resources_rank}")
-        for ability, inputs in abilities:
-            print(f"ability={ability}, inputs={inputs}")
-            #randomly roll for each ability on the given table
-            roll = randint(1,100)
-            rankindex = self.ability_roll(table,roll)
-            inputs["roll"].setText(str(roll))
-            inputs["rank_roll"].setText(f"{self.ranks[rankindex]}")
-
-            #get the ability bonus and add it to the bonus field
-            if ability:
-                bonus = getattr(self, f"{ability}_bonus")
-            print(f"bonus={bonus}")
+    #display the roll, rank and bonus for each rolled ability and the rank,
+    #score, Health and Karma on the Abilities tab
+    def show_abilities(self):
+        if not self.character.abilities_rolled:
+            return
+        inputs_list = list(self.ability_inputs.items()) + list(self.secondary_ability_inputs.items())
+        for ability, inputs in inputs_list:
+            rolled = self.character.ability_rolls[ability]
+            inputs["roll"].setText(str(rolled["roll"]))
+            inputs["rank_roll"].setText(f"{self.ranks[rolled['rank_roll']]}")
+            bonus = rolled["bonus"]
             if bonus > 0:
                 inputs["bonus"].setText(f"+{str(bonus)}")
             else:
                 inputs["bonus"].setText(str(bonus))
-            #add the bonus to the rank
-            rankindex += bonus
-            if rankindex < 1:#If rolled rank is Feeble do not lower below Feeble
-                rankindex = 1
-            print(f"rankindex={rankindex}")
-
-            #check if Resources or Popularity was set by the Physical Form else
-            #apply the randomly rolled rank for each primary/secondary ability
-            if self.pf_resources_rank > -1:
-                print(f"pf_resources_rank>-1")
-                if ability == "resources":
-                    print(f"ability=resources")
-                    rankindex = self.pf_resources_rank
-                    self.resources_rank = self.pf_resources_rank
-                    self.original_resources_rank = self.pf_resources_rank
-            else: #set the resource or popularity rank attribute to the rolled one
-                if ability == "resources":
-                    self.resources_rank = rankindex
-                    self.original_resources_rank = rankindex
-            
-            if self.pf_popularity_rank > -1:
-                print(f"pf_popularity_rank>-1")
-                if ability == "popularity":
-                    print(f"ability=popularity")
-                    rankindex = self.pf_popularity_rank
-                    self.popularity_rank = self.pf_popularity_rank
-            else: #set the resource or popularity rank attribute to the rolled one
-                if ability == "popularity":
-                    self.popularity_rank = rankindex
-            print(f"resource_rank={self.resources_rank}")
-
-            rank_name = self.ranks[rankindex]
-            inputs["rank"].setText(f"{rank_name}")
-            print(f"rank_name={rank_name}")
-            if self.std_rank_scores == 0:
-                #minimum rank scores
-                score1 = self.rank_scores[rank_name][0]
-                score2 = str(self.rank_scores[rank_name][0])
-                print(f"score1={score1}, score2={score2}")
-                inputs["score"].setText(str(self.rank_scores[rank_name][0]))
-                if ability in {"fighting", "agility", "strength", "endurance"}:
-                    self.health += self.rank_scores[rank_name][0]
-                elif ability in {"reason", "intuition", "psyche"}:
-                    self.karma += self.rank_scores[rank_name][0]
-            else:
-                #standard rank scores
-                inputs["score"].setText(str(self.rank_scores[rank_name][1]))
-                if ability in {"fighting", "agility", "strength", "endurance"}:
-                    self.health += self.rank_scores[rank_name][1]
-                elif ability in {"reason", "intuition", "psyche"}:
-                    self.karma += self.rank_scores[rank_name][1]
-
-
-
-    def roll_number_powers(self, type):
-        roll = randint(1,100)
-        print(f"roll_number_powers roll={roll}, type={type}")
-        # Define ranges and corresponding values for each type
-        ranges = [
-            (13, {"powers": {"min": 1, "max": 3}, "talents": {"min": 0, "max": 3}, "contacts": {"min": 0, "max": 2}}),
-            (27, {"powers": {"min": 2, "max": 4}, "talents": {"min": 1, "max": 4}, "contacts": {"min": 0, "max": 4}}),
-            (42, {"powers": {"min": 3, "max": 5}, "talents": {"min": 1, "max": 6}, "contacts": {"min": 1, "max": 4}}),
-            (56, {"powers": {"min": 4, "max": 6}, "talents": {"min": 2, "max": 4}, "contacts": {"min": 2, "max": 4}}),
-            (67, {"powers": {"min": 5, "max": 7}, "talents": {"min": 2, "max": 6}, "contacts": {"min": 2, "max": 6}}),
-            (76, {"powers": {"min": 6, "max": 8}, "talents": {"min": 2, "max": 8}, "contacts": {"min": 3, "max": 3}}),
-            (84, {"powers": {"min": 7, "max": 9}, "talents": {"min": 3, "max": 4}, "contacts": {"min": 3, "max": 4}}),
-            (90, {"powers": {"min": 8, "max": 10}, "talents": {"min": 3, "max": 6}, "contacts": {"min": 3, "max": 6}}),
-            (95, {"powers": {"min": 9, "max": 12}, "talents": {"min": 4, "max": 4}, "contacts": {"min": 4, "max": 4}}),
-            (98, {"powers": {"min": 10, "max": 12}, "talents": {"min": 4, "max": 8}, "contacts": {"min": 4, "max": 5}}),
-            (100, {"powers": {"min": 12, "max": 14}, "talents": {"min": 5, "max": 6}, "contacts": {"min": 5, "max": 5}}),
-            (101, {"powers": {"min": 14, "max": 18}, "talents": {"min": 6, "max": 8}, "contacts": {"min": 6, "max": 6}})
-        ]
-
-        # Find the appropriate range and set the values
-        for threshold, values in ranges:
-            if roll < threshold:
-                setattr(self, f"number_of_{type}", values[type])
-                break
-            
-        #apply any number of powers bonuses/penalties
-        if type == "powers":
-            if self.number_of_powers["min"] == 1 and self.power_bonus == -1:
-                self.number_of_powers["min"] = 1
-            else:
-                self.number_of_powers["min"] += self.power_bonus
-                self.number_of_powers["max"] += self.power_bonus
-        elif type == "contacts":
-            if self.initial_contacts == 0: #0 initial contants
-                self.number_of_contacts["min"] = 0
-            elif self.initial_contacts > 2:#at least one initial contant
-                if self.number_of_contacts["min"] == 0:
-                    self.number_of_contacts["min"] = 1
-                elif self.number_of_contacts["min"] == 1:
-                    self.contacts_classes_listbox.setEnabled(False)
-            elif self.initial_contacts == 1:#only one initial contact
-                if self.number_of_contacts["min"] == 0:
-                    self.number_of_contacts["min"] = 1
-                else:
-                    self.number_of_contacts["min"] = 1
-                self.contacts_classes_listbox.setEnabled(False)
+            inputs["rank"].setText(f"{self.ranks[self.character.ability_rank(ability)]}")
+            inputs["score"].setText(str(self.character.ability_score(ability)))
+        self.health_textbox.setText(str(self.character.health))
+        self.karma_textbox.setText(str(self.character.karma))
+
 
-                
-
-    def roll_power_class(self):
-        roll = randint(1,100)
-        print(f"Roll Power Classes roll={roll}")
-        if roll < 6:
-             power_class = "Defensive"
-        elif roll < 12:
-            power_class = "Detection"
-        elif roll < 17:
-            power_class = "Energy Control"
-        elif roll < 25:
-            power_class = "Energy Emission"
-        elif roll < 30:
-            power_class = "Fighting"
-        elif roll < 32:
-            power_class = "Illusory"
-        elif roll < 36:
-            power_class = "Lifeform Control"
-        elif roll < 41:
-            power_class = "Magical"
-        elif roll < 48:
-            power_class = "Matter Control"
-        elif roll < 54:
-            power_class = "Matter Conversion"
-        elif roll < 58:
-            power_class = "Matter Creation"
-        elif roll < 72:
-            power_class = "Mental Enhancement"
-        elif roll < 86:
-            power_class = "Physical Enhancement"
-        elif roll < 89:
-            power_class = "Power Control"
-        elif roll < 93:
-            power_class = "Self-Alteration"
-        else:
-            power_class = "Travel"
-        return power_class
-
-
-
-    def energy_emission_body_part(self):
-        roll = randint(1,100)
-        if roll < 15:
-            epoint = "Entire body"
-        elif roll < 23:
-            epoint = "Head"
-        elif roll < 31:
-            epoint = "Eyes"
-        elif roll < 39:
-            epoint = "Mouth and nose"
-        elif roll < 47:
-            epoint = "Torso"
-        elif roll < 55:
-            epoint = "Arms"
-        elif roll < 63:
-            epoint = "Hands"
-        elif roll < 68:
-            epoint = "Fingers"
-        elif roll < 71:
-            epoint = "Legs"
-        elif roll < 74:
-            epoint = "Feet"
-        elif roll < 77:
-            #check if the extra body part exists and use an existing one if not
-            row = self.physical_form_list.currentRow()
-            if self.wings_travel_power == 1 or row == 16:
-                epoint = "Wings"
-            else:
-                epoint = "Hands"
-        elif roll < 82:
-            item = self.options_list.currentItem()
-            if item and item.text() == "Antennae give a Detection Power":
-                epoint = "Antennae"
-            elif item and item.text() == "Horns give +1CS to Charging attacks":
-                epoint = "Horns"
-            else:
-                epoint = "Eyes"
-        elif roll < 87:
-            item = self.options_list.currentItem()
-            if item and item.text() == "Tails give the hero +1 attack":
-                epoint = "Tail"
-            else:
-                epoint = "Torso"
-        elif roll <= 100:
-            epoint = "Any location"
-        return epoint
 
+    #keep the ranks, scores, Health and Karma on the Abilities tab up to date
+    #as buying powers, talents and contacts, ability bonuses and the rank
+    #scores option change them
+    def bind_character(self):
+        values = self.character.derived
+        inputs_list = list(self.ability_inputs.items()) + list(self.secondary_ability_inputs.items())
+        for ability, inputs in inputs_list:
+            values.bind(f"{ability}_rank", partial(self.show_rank, inputs["rank"]))
+            values.bind(f"{ability}_score", partial(self.show_number, inputs["score"]))
+        values.bind("health", partial(self.show_number, self.health_textbox))
+        values.bind("karma", partial(self.show_number, self.karma_textbox))
 
 
-    def roll_talent_class(self):
-        roll = randint(1,100)
-        print(f"Roll Talent Classes roll={roll}")
-        if roll < 21:
-            item = QListWidgetItem("Weapon Skills")
-        elif roll < 46:
-            item = QListWidgetItem("Fighting Skills")
-        elif roll < 66:
-            item = QListWidgetItem("Professional Skills")
-        elif roll < 86:
-            item = QListWidgetItem("Scientific Skills")
-        elif roll < 91:
-            item = QListWidgetItem("Mystical and Mental Skills")
-        elif roll <= 100:
-            item = QListWidgetItem("Other Skills")
-        item.setSizeHint(QSize(0, 22))
-        self.talent_classes_listbox.addItem(item)
 
+    def show_rank(self, textbox, rank):
+        if self.character.abilities_rolled:
+            textbox.setText(self.ranks[rank])
 
 
+
+    def show_number(self, textbox, number):
+        if self.character.abilities_rolled:
+            textbox.setText(str(number))
+
+
+
+    def show_power_classes(self):
+        self.power_classes_listbox.clear()
+        for power_class in self.character.power_classes:
+            item = QListWidgetItem(power_class)
+            item.setSizeHint(QSize(0, 22))
+            self.power_classes_listbox.addItem(item)
+
+
+
+    #display the powers and the min/max label; powers given by the physical
+    #form cannot be removed
+    def show_powers(self):
+        if not self.tab_built(2):
+            return
+        self.powers_model.refresh()
+        number_of_powers = self.character.number_of_powers
+        if number_of_powers["max"]:
+            self.num_powers_label.setText(f"Min: {number_of_powers['min']} / Max: {number_of_powers['max']}")
+
+
+
+    def show_talent_classes(self):
+        self.talent_classes_listbox.clear()
+        for talent_class in self.character.talent_classes:
+            item = QListWidgetItem(talent_class)
+            item.setSizeHint(QSize(0, 22))
+            self.talent_classes_listbox.addItem(item)
+
+
+
+    def show_talents(self):
+        self.talents_model.refresh()
+        number_of_talents = self.character.number_of_talents
+        self.num_talents_label.setText(f"Min: {number_of_talents['min']} / Max: {number_of_talents['max']}")
+
+
+
+    #display the contacts and the min/max label; contacts given by the
+    #physical form cannot be removed
+    def show_contacts(self):
+        if not self.tab_built(4):
+            return
+        self.contacts_model.refresh()
+        number_of_contacts = self.character.number_of_contacts
+        if number_of_contacts["max"]:
+            self.num_contacts_label.setText(f"Min: {number_of_contacts['min']} / Max: {number_of_contacts['max']}")
+
+
+
+    #icon is the file name of an image in images/
     def display_message(self, icon, title, text, type, buttons=0):
         msg = QMessageBox()
         font = QFont("Comic Sans MS", 12)
         msg.setFont(font)
-        msg.setWindowIcon(QIcon(icon))
+        msg.setWindowIcon(QIcon(images.pixmap(icon)))
         msg.setWindowTitle(title)
         msg.setText(text)
         if type == "warning":
@@ -3902,37 +2074,6 @@ class MainWindow(QMainWindow):
 
 
 
-    def min_std_rank_score(self, rank):
-        if self.std_rank_scores == 0:
-            #minimum rank scores
-            score = self.rank_scores[rank][0]
-        else:
-            #standard rank scores
-            score = self.rank_scores[rank][1]
-        return score
-
-
-
-    def biophysical_random_option(self):
-        roll = randint(1,100)
-        if roll < 25:
-            text = 'Healing'
-        elif roll < 45:
-            text = 'Regeneration'
-        elif roll < 49:
-            text = 'Revival'
-        elif roll < 69:
-            text = 'Damage Transferral'
-        elif roll < 77:
-            text = 'Decay'
-        elif roll < 93:
-            text = 'Disruption'
-        elif roll <= 100:
-            text = 'Aging'
-        return text
-    
-
-
     def show_instructions(self):
         instructions_dialog = QDialog()
         instructions_dialog.setWindowIcon(QIcon(resource_path('images/mshJudge.jpg')))
@@ -4026,7 +2167,7 @@ taskmasterxff@yahoo.com
         about_dialog.resize(650, 320)
 
         #add the image
-        pixmap = QPixmap(resource_path('images/mshPlayer.jpg'))
+        pixmap = images.pixmap('mshPlayer.jpg')
         about_image = QLabel()
         about_image.setPixmap(pixmap)
         about_image.setAlignment(Qt.AlignmentFlag.AlignLeft)
@@ -4085,6 +2226,59 @@ taskmasterxff@yahoo.com
 
 
 
+################### LIST MODELS ###################
+#A list model over one of the character's lists (powers, talents or
+#contacts). records returns the list, as the window starts a new Character
+#for each physical form; text gives a record's display text, made when the
+#view asks for it, and locked whether the record at a row was given by the
+#physical form and cannot be removed. Anything that changes the list or the
+#text of its records (e.g. switching to standard rank scores) is shown with
+#a single refresh.
+class RecordListModel(QAbstractListModel):
+    def __init__(self, records, text=str, locked=None, row_height=0, parent=None):
+        super().__init__(parent)
+        self.records = records
+        self.text = text
+        self.locked = locked
+        self.row_height = row_height
+
+
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.records())
+
+
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        records = self.records()
+        if not index.isValid() or index.row() >= len(records):
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.text(records[index.row()])
+        elif role == Qt.ItemDataRole.UserRole:
+            return records[index.row()]
+        elif role == Qt.ItemDataRole.SizeHintRole and self.row_height:
+            return QSize(0, self.row_height)
+        return None
+
+
+
+    def flags(self, index):
+        flags = super().flags(index)
+        if self.locked and index.isValid() and index.row() < len(self.records()) and self.locked(index.row()):
+            flags &= ~Qt.ItemFlag.ItemIsEnabled
+        return flags
+
+
+
+    def refresh(self):
+        self.beginResetModel()
+        self.endResetModel()
+
+
+
 class BiophysicalOptionDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -4111,12 +2305,14 @@ class BiophysicalOptionDialog(QDialog):
 
 
 
-#show splashscreen
-def show_splash():
+#show splashscreen while the main window is built, then swap them once the
+#window is ready and the splash has been up for at least minimum milliseconds
+def show_splash(minimum=splash_time):
     app = QApplication(sys.argv)
+    images.preload(resource_path("images"))
 
     # Load splash image
-    pixmap = QPixmap(resource_path('images/UPB_sm.jpg'))
+    pixmap = images.pixmap('UPB_sm.jpg')
     
     # Create QLabel for splash screen
     splash = QLabel()
@@ -4137,20 +2333,27 @@ def show_splash():
     version_label.setStyleSheet("color: black; font-size: 12px; background-color: rgba(0, 0, 0, 0);")
     version_label.setFont(QFont('Arial'))
 
-    # Show splash screen
+    # Show splash screen and paint it before building the main window
     splash.show()
+    app.processEvents()
+    started = time.monotonic()
+    window = MainWindow()
 
-    # Close splash and open main window after 3 seconds
-    QTimer.singleShot(3000, lambda: (splash.close(), show_main_window()))
+    # Close splash and open main window once it has been shown long enough
+    remaining = minimum - int((time.monotonic() - started) * 1000)
+    QTimer.singleShot(max(remaining, 0), lambda: (splash.close(), window.show()))
 
     sys.exit(app.exec())
 
 
 
-# Show main window
+# Show main window without the splash screen
 def show_main_window():
-    window= MainWindow()
+    app = QApplication(sys.argv)
+    images.preload(resource_path("images"))
+    window = MainWindow()
     window.show()
+    sys.exit(app.exec())
 
 
 
@@ -4166,4 +2369,15 @@ def resource_path(relative_path):
 
 
 if __name__ == "__main__":
-    show_splash()
+    parser = argparse.ArgumentParser(description="Marvel Super Heroes Character Generator")
+    parser.add_argument("--no-splash", action="store_true", help="open the main window without the splash screen")
+    parser.add_argument("--splash-time", type=int, default=splash_time,
+                        help=f"shortest time to show the splash screen, in milliseconds (default {splash_time})")
+    #anything else is left for Qt
+    args, qt_args = parser.parse_known_args()
+    sys.argv = sys.argv[:1] + qt_args
+    tablehits.enable_from_environment()
+    if args.no_splash:
+        show_main_window()
+    else:
+        show_splash(args.splash_time)
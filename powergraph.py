@@ -0,0 +1,75 @@
+import powerindex
+
+
+################### POWER GRAPH ###################
+#The bonus and optional powers in powerlists make a directed graph from each
+#power to the powers it can grant. The forward and reverse edges and their
+#transitive closures are built once when the module is imported so every
+#query is a dictionary lookup returning a frozenset.
+#Nodes are power names, so a power listed in two classes (Energy Source) is
+#one node. Optional powers that are power classes (Energy Emission, Energy
+#Control, Magical Power) are nodes of their own and do not expand to the
+#powers of the class.
+
+#power name: powers it grants directly as bonus powers
+bonus_edges = {}
+#power name: powers it grants directly as optional powers
+option_edges = {}
+#power name: powers it grants directly either way
+forward = {}
+#power name: powers that grant it directly
+reverse = {}
+
+for power in powerindex.powers.values():
+    bonus_edges.setdefault(power.name, set()).update(power.bonus)
+    option_edges.setdefault(power.name, set()).update(power.option)
+    forward.setdefault(power.name, set()).update(power.bonus, power.option)
+    reverse.setdefault(power.name, set())
+    for target in power.bonus + power.option:
+        forward.setdefault(target, set())
+        reverse.setdefault(target, set()).add(power.name)
+
+
+
+#every node reachable from each node by following edges (not including the
+#node itself unless it is on a cycle)
+def transitive_closure(edges):
+    closure = {}
+    for start in edges:
+        reached = set()
+        stack = list(edges[start])
+        while stack:
+            node = stack.pop()
+            if node not in reached:
+                reached.add(node)
+                stack.extend(edges[node])
+        closure[start] = frozenset(reached)
+    return closure
+
+
+
+bonus_edges = {name: frozenset(targets) for name, targets in bonus_edges.items()}
+option_edges = {name: frozenset(targets) for name, targets in option_edges.items()}
+forward = {name: frozenset(targets) for name, targets in forward.items()}
+reverse = {name: frozenset(sources) for name, sources in reverse.items()}
+#power name: everything it can ultimately grant
+reachable = transitive_closure(forward)
+#power name: every power that can ultimately grant it
+granted_by = transitive_closure(reverse)
+
+
+
+#everything reachable from the power through its bonus and optional powers
+def reachable_from(name):
+    return reachable.get(name, frozenset())
+
+
+
+#every power that can ultimately grant the power
+def powers_granting(name):
+    return granted_by.get(name, frozenset())
+
+
+
+def can_grant(source, target):
+    return target in reachable.get(source, ())
@@ -0,0 +1,65 @@
+from collections import namedtuple
+
+import powerlists
+import tables
+
+
+################### POWER INDEX ###################
+#Built once from powerlists.all_power_lists when the module is imported so
+#rolling a power and looking up its cost, bonus and optional powers does not
+#scan or copy the power lists.
+
+#names: the powers in the class in powerlists order
+#thresholds: the d100 roll thresholds matching names
+#table: the compiled roll table (with its alias sampler)
+PowerClass = namedtuple("PowerClass", ["name", "names", "thresholds", "table"])
+
+#cost: number of power slots the power uses
+#bonus/option: the power's bonus and optional powers
+Power = namedtuple("Power", ["name", "power_class", "cost", "bonus", "option"])
+
+#power class name: PowerClass
+power_classes = {}
+#(power class, power name): Power
+powers = {}
+#power name: Power in the first class it is listed in (Energy Source is in two)
+powers_by_name = {}
+
+for power_class, powerslist in powerlists.all_power_lists.items():
+    power_classes[power_class] = PowerClass(power_class, tuple(powerslist),
+                                            tuple(tables.power_thresholds[power_class]),
+                                            tables.power_tables[power_class])
+    for name, data in powerslist.items():
+        extra = data[1] if len(data) > 1 else {}
+        power = Power(name, power_class, data[0], tuple(extra.get("bonus", ())),
+                      tuple(extra.get("option", ())))
+        powers[(power_class, name)] = power
+        powers_by_name.setdefault(name, power)
+
+
+
+def roll_power(power_class, rng):
+    return power_classes[power_class].table.roll(rng)
+
+
+
+#the bonus and optional powers of a power; empty if it has none
+def bonus_optional_powers(power_class, name):
+    power = powers.get((power_class, name))
+    if power is None:
+        return (), ()
+    return power.bonus, power.option
+
+
+
+#the power class a power belongs to; "" if it is not in any power list
+def power_class_of(name):
+    power = powers_by_name.get(name)
+    if power is None:
+        return ""
+    return power.power_class
+
+
+
+def power_cost(power_class, name):
+    return powers[(power_class, name)].cost
@@ -0,0 +1,222 @@
+import math
+from fractions import Fraction
+
+import numpy as np
+
+import engine
+import tables
+import library
+from rng import RNG
+
+
+################### EXACT ABILITY DISTRIBUTIONS ###################
+#The exact chance of every rank, Health and Karma a physical form rolls,
+#counted from the d100 ability tables instead of simulated. Each ability is
+#one d100 roll on the form's table shifted by the form's column shifts, so a
+#rank distribution is the table's row widths moved along the rank list;
+#Health and Karma are sums of independent ability scores, so their
+#distributions are convolutions of the score distributions.
+#
+#Counts are kept as integers out of 100 per roll, so the probabilities are
+#exact fractions. These are the abilities as rolled (Character.roll_abilities);
+#ability bonuses the player spends afterwards are not included. A Compound or
+#Changeling's shifts and table depend on the forms rolled for it, so those
+#two forms are not supported.
+
+abilities = engine.primary_abilities + engine.secondary_abilities
+#physical forms the rolled abilities can not be counted for
+unsupported_forms = ["Compound", "Changeling"]
+
+#(rules hash, physical form, option, std_rank_scores): distributions
+cache = {}
+
+
+
+class Distribution:
+    #counts[i] of total equally likely outcomes have the value values[i]
+    def __init__(self, values, counts, total):
+        self.values = np.asarray(values, dtype=np.int64)
+        self.counts = np.asarray(counts, dtype=np.int64)
+        self.total = int(total)
+
+
+
+    #a distribution from a dense count array, counts[value]
+    @classmethod
+    def from_dense(cls, counts, total):
+        values = np.flatnonzero(counts)
+        return cls(values, counts[values], total)
+
+
+
+    def dense(self):
+        counts = np.zeros(self.values[-1] + 1, dtype=np.int64)
+        counts[self.values] = self.counts
+        return counts
+
+
+
+    def probabilities(self):
+        return self.counts / self.total
+
+
+
+    def probability(self, value):
+        matches = self.counts[self.values == value]
+        return Fraction(int(matches.sum()), self.total)
+
+
+
+    #value: exact probability
+    def pmf(self):
+        return {int(value): Fraction(int(count), self.total)
+                for value, count in zip(self.values, self.counts)}
+
+
+
+    #P(X <= value)
+    def cdf(self, value):
+        return Fraction(int(self.counts[self.values <= value].sum()), self.total)
+
+
+
+    def mean(self):
+        return Fraction(int((self.values * self.counts).sum()), self.total)
+
+
+
+    def scale(self, factor):
+        return Distribution(self.values * factor, self.counts, self.total)
+
+
+
+    #the distribution of the sum of independent X and Y
+    def __add__(self, other):
+        counts = np.convolve(self.dense(), other.dense())
+        return Distribution.from_dense(counts, self.total * other.total)
+
+
+
+    #the mixture of distributions with equal weights
+    @classmethod
+    def mix(cls, distributions):
+        total = math.lcm(*(distribution.total for distribution in distributions))
+        size = max(distribution.values[-1] for distribution in distributions) + 1
+        counts = np.zeros(size, dtype=np.int64)
+        for distribution in distributions:
+            counts[distribution.values] += distribution.counts * (total // distribution.total)
+        return cls.from_dense(counts, total * len(distributions))
+
+
+
+#a point mass at value
+def certain(value):
+    return Distribution([value], [1], 1)
+
+
+
+#the table, column shifts and set ranks a physical form (with one of its
+#options) gives its abilities; the same steps Character takes, whose chance
+#rolls all succeed for a single physical form
+def form_inputs(physical_form, option=None):
+    if physical_form in unsupported_forms:
+        raise ValueError(f"The abilities of a {physical_form} depend on the forms rolled for it")
+    character = engine.Character(RNG(0))
+    character.select_physical_form(engine.physical_form_names.index(physical_form))
+    if character.form_options:
+        character.select_form_option(option or 0)
+    elif option:
+        raise ValueError(f"{physical_form} has no options")
+    return {"table": character.ability_table(),
+            "bonuses": {ability: getattr(character, f"{ability}_bonus") for ability in abilities},
+            "resources_rank": character.pf_resources_rank,
+            "popularity_rank": character.pf_popularity_rank,
+            "health_multiplier": character.health_multiplier,
+            "power_bonus": character.power_bonus}
+
+
+
+#rank index distribution of one ability from the inputs
+def rank_distribution_of(inputs, ability):
+    if ability == "resources" and inputs["resources_rank"] > -1:
+        return certain(inputs["resources_rank"])
+    if ability == "popularity" and inputs["popularity_rank"] > -1:
+        return certain(inputs["popularity_rank"])
+    table = tables.ability_tables[inputs["table"]]
+    counts = np.zeros(len(engine.ranks), dtype=np.int64)
+    for rank, count in zip(table.outcomes, table.row_counts()):
+        #a bonus or penalty can not lower a rank below Feeble
+        shifted = min(max(rank + inputs["bonuses"][ability], 1), len(engine.ranks) - 1)
+        counts[shifted] += count
+    return Distribution.from_dense(counts, table.sides)
+
+
+
+def score_distribution_of(rank_distribution, std_rank_scores):
+    counts = {}
+    for rank, count in zip(rank_distribution.values, rank_distribution.counts):
+        score = engine.rank_score(rank, std_rank_scores)
+        counts[score] = counts.get(score, 0) + count
+    values = sorted(counts)
+    return Distribution(values, [counts[value] for value in values], rank_distribution.total)
+
+
+
+def sum_of(distributions):
+    result = certain(0)
+    for distribution in distributions:
+        result = result + distribution
+    return result
+
+
+
+def compute(physical_form, option, std_rank_scores):
+    inputs = form_inputs(physical_form, option)
+    ranks = {ability: rank_distribution_of(inputs, ability) for ability in abilities}
+    scores = {ability: score_distribution_of(ranks[ability], std_rank_scores) for ability in abilities}
+    health = sum_of(scores[ability] for ability in engine.primary_abilities
+                    if ability in engine.health_abilities)
+    karma = sum_of(scores[ability] for ability in engine.primary_abilities
+                   if ability in engine.karma_abilities)
+    return {"ranks": ranks, "scores": scores,
+            "health": health.scale(inputs["health_multiplier"]), "karma": karma}
+
+
+
+#the exact distributions of a physical form's rolled abilities:
+#   {"ranks": {ability: rank index Distribution},
+#    "scores": {ability: rank score Distribution},
+#    "health": Distribution, "karma": Distribution}
+#std_rank_scores picks the minimum (0) or standard (1) rank scores. For a
+#form with options, option is the index of the option; None mixes the
+#options evenly, as generate_character chooses them.
+def distributions(physical_form, std_rank_scores=0, option=None):
+    key = (library.rules_hash, physical_form, option, std_rank_scores)
+    if key not in cache:
+        options = engine.form_options.get(engine.physical_form_names.index(physical_form), [])
+        if option is None and options:
+            parts = [distributions(physical_form, std_rank_scores, index) for index in range(len(options))]
+            cache[key] = {"ranks": {ability: Distribution.mix([part["ranks"][ability] for part in parts])
+                                    for ability in abilities},
+                          "scores": {ability: Distribution.mix([part["scores"][ability] for part in parts])
+                                     for ability in abilities},
+                          "health": Distribution.mix([part["health"] for part in parts]),
+                          "karma": Distribution.mix([part["karma"] for part in parts])}
+        else:
+            cache[key] = compute(physical_form, option, std_rank_scores)
+    return cache[key]
+
+
+
+def rank_distribution(physical_form, ability, option=None):
+    return distributions(physical_form, 0, option)["ranks"][ability]
+
+
+
+def health_distribution(physical_form, std_rank_scores=0, option=None):
+    return distributions(physical_form, std_rank_scores, option)["health"]
+
+
+
+def karma_distribution(physical_form, std_rank_scores=0, option=None):
+    return distributions(physical_form, std_rank_scores, option)["karma"]
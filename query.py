@@ -0,0 +1,313 @@
+import ast
+import sys
+import argparse
+
+import numpy as np
+
+import engine
+import codec
+import columnar
+
+
+################### QUERIES ###################
+#Filters over a columnar.ColumnStore, written as Python expressions, e.g.
+#   strength >= "Amazing" and power_class == "Travel"
+#   endurance >= "Monstrous" and power_class == "Defensive" and physical_form != "Normal Human"
+#   health > 100 or talent in ("Martial Arts A", "Martial Arts B")
+#A filter is parsed with ast and compiled to a NumPy boolean mask, one entry
+#per stored character. Rank names compare by rank, so "Amazing" > "Incredible".
+#power, power_class, talent and contact are true if any of the character's
+#powers/talents/contacts match.
+#
+#From the command line:
+#   python query.py npcs 'endurance >= "Monstrous" and power_class == "Defensive"' --list 10
+#   python query.py npcs 'origin == "Natal"' --group-by physical_form --aggregate mean:health
+
+#field: vocabulary the field's text values are indexed in
+rank_fields = {ability: engine.ranks for ability in columnar.abilities}
+named_fields = {"physical_form": engine.physical_form_names, "origin": codec.origins}
+number_fields = ["health", "karma", "power_count", "talent_count", "contact_count",
+                 "std_rank_scores", "form_option"]
+#field: (ragged column, name of each vocabulary entry)
+ragged_fields = {"power": ("power_ids", [name for power_class, name in codec.powers]),
+                 "power_class": ("power_ids", [power_class for power_class, name in codec.powers]),
+                 "talent": ("talent_ids", codec.talents),
+                 "contact": ("contact_ids", codec.contacts)}
+group_fields = ["physical_form", "origin", "std_rank_scores"] + list(rank_fields)
+aggregates = ["count", "sum", "mean", "min", "max"]
+
+operators = {ast.Eq: np.equal, ast.NotEq: np.not_equal,
+             ast.Lt: np.less, ast.LtE: np.less_equal,
+             ast.Gt: np.greater, ast.GtE: np.greater_equal}
+#the operator with its operands swapped
+swapped = {ast.Eq: ast.Eq, ast.NotEq: ast.NotEq, ast.Lt: ast.Gt,
+           ast.LtE: ast.GtE, ast.Gt: ast.Lt, ast.GtE: ast.LtE}
+
+
+
+class QueryError(ValueError):
+    pass
+
+
+
+#values of a scalar field: ranks as rank indices, names as vocabulary indices
+def column(store, field):
+    if field in rank_fields:
+        return store.rank(field)
+    if field in named_fields or field in number_fields:
+        return store.column(field)
+    raise QueryError(f"Unknown field: {field}")
+
+
+
+#the vocabulary index of a text value of a field
+def value_index(field, value):
+    vocabulary = rank_fields.get(field) or named_fields.get(field)
+    if vocabulary is None:
+        if not isinstance(value, (int, float)) or isinstance(value, bool):
+            raise QueryError(f"{field} must be compared with a number, not {value!r}")
+        return value
+    if isinstance(value, str):
+        if value not in vocabulary:
+            raise QueryError(f"{value!r} is not a {field.replace('_', ' ')}")
+        return vocabulary.index(value)
+    #rank and form indices can be given as numbers too
+    return value
+
+
+
+#True for rows with any ragged value in ids
+def any_value(store, field, ids):
+    column_name, names = ragged_fields[field]
+    values, starts, ends = store.ragged(column_name)
+    rows = np.repeat(np.arange(len(store)), ends - starts)
+    mask = np.zeros(len(store), dtype=bool)
+    mask[rows[np.isin(values, ids)]] = True
+    return mask
+
+
+
+def ragged_ids(field, value):
+    names = ragged_fields[field][1]
+    if not isinstance(value, str):
+        raise QueryError(f"{field} must be compared with a name, not {value!r}")
+    ids = [id for id, name in enumerate(names) if name == value]
+    if not ids:
+        raise QueryError(f"{value!r} is not a {field.replace('_', ' ')}")
+    return ids
+
+
+
+class Compiler:
+    def __init__(self, store):
+        self.store = store
+
+
+
+    def compile(self, expression):
+        try:
+            tree = ast.parse(expression, mode="eval")
+        except SyntaxError as error:
+            raise QueryError(f"Bad filter: {error.msg}") from None
+        mask = self.visit(tree.body)
+        if not isinstance(mask, np.ndarray) or mask.dtype != bool:
+            raise QueryError("A filter must be a comparison")
+        return mask
+
+
+
+    def visit(self, node):
+        if isinstance(node, ast.BoolOp):
+            masks = [self.visit(value) for value in node.values]
+            function = np.logical_and if isinstance(node.op, ast.And) else np.logical_or
+            return function.reduce(masks)
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+            return ~self.visit(node.operand)
+        if isinstance(node, ast.Compare):
+            #a < b < c is a < b and b < c
+            masks = []
+            left = node.left
+            for op, right in zip(node.ops, node.comparators):
+                masks.append(self.compare(left, op, right))
+                left = right
+            return np.logical_and.reduce(masks)
+        raise QueryError(f"Unsupported filter: {ast.unparse(node)}")
+
+
+
+    #a field name or a constant (or a tuple/list of constants)
+    def operand(self, node):
+        if isinstance(node, ast.Name):
+            return ("field", node.id)
+        if isinstance(node, ast.Constant):
+            return ("value", node.value)
+        if isinstance(node, (ast.Tuple, ast.List, ast.Set)):
+            values = []
+            for item in node.elts:
+                kind, value = self.operand(item)
+                if kind != "value":
+                    raise QueryError(f"Only values can be listed: {ast.unparse(node)}")
+                values.append(value)
+            return ("values", values)
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+            kind, value = self.operand(node.operand)
+            if kind == "value" and isinstance(value, (int, float)):
+                return ("value", -value)
+        raise QueryError(f"Unsupported value: {ast.unparse(node)}")
+
+
+
+    def compare(self, left_node, op, right_node):
+        left = self.operand(left_node)
+        right = self.operand(right_node)
+        op_type = type(op)
+        if isinstance(op, (ast.In, ast.NotIn)):
+            if left[0] != "field" or right[0] != "values":
+                raise QueryError("Use 'field in (value, ...)'")
+            field, values = left[1], right[1]
+            if field in ragged_fields:
+                mask = any_value(self.store, field, [id for value in values
+                                                     for id in ragged_ids(field, value)])
+            else:
+                mask = np.isin(column(self.store, field), [value_index(field, value) for value in values])
+            return ~mask if isinstance(op, ast.NotIn) else mask
+        if op_type not in operators:
+            raise QueryError(f"Unsupported comparison: {type(op).__name__}")
+        if left[0] != "field":
+            left, right = right, left
+            op_type = swapped[op_type]
+        if left[0] != "field":
+            raise QueryError("A comparison needs a field")
+        field = left[1]
+        if field in ragged_fields:
+            if right[0] != "value" or op_type not in (ast.Eq, ast.NotEq):
+                raise QueryError(f"{field} can only be compared with == or !=")
+            mask = any_value(self.store, field, ragged_ids(field, right[1]))
+            return mask if op_type is ast.Eq else ~mask
+        values = column(self.store, field)
+        if right[0] == "field":
+            if right[1] in ragged_fields:
+                raise QueryError(f"{right[1]} can not be compared with another field")
+            other = column(self.store, right[1])
+        elif right[0] == "value":
+            other = value_index(field, right[1])
+        else:
+            raise QueryError("Use 'in' to compare with several values")
+        return operators[op_type](values, other)
+
+
+
+#boolean mask of the rows matching a filter; all rows for an empty filter
+def select(store, expression):
+    if not expression or not expression.strip():
+        return np.ones(len(store), dtype=bool)
+    return Compiler(store).compile(expression)
+
+
+
+#an aggregate of a field over the selected rows, by group if by is given;
+#returns the value, or {group name: value} for the groups that have rows
+def aggregate(store, function, field=None, mask=None, by=None):
+    if function not in aggregates:
+        raise QueryError(f"Unknown aggregate: {function}")
+    if mask is None:
+        mask = np.ones(len(store), dtype=bool)
+    if function != "count":
+        if field is None:
+            raise QueryError(f"{function} needs a field")
+        values = np.asarray(column(store, field)[mask], dtype=np.float64)
+    if by is None:
+        if function == "count":
+            return int(mask.sum())
+        if len(values) == 0:
+            return None
+        return getattr(np, function)(values).item()
+
+    if by not in group_fields:
+        raise QueryError(f"Can not group by {by}")
+    vocabulary = rank_fields.get(by) or named_fields.get(by) or ["Minimum", "Standard"]
+    groups = np.asarray(column(store, by)[mask], dtype=np.int64)
+    counts = np.bincount(groups, minlength=len(vocabulary))
+    if function == "count":
+        results = counts
+    elif function in ("sum", "mean"):
+        results = np.bincount(groups, weights=values, minlength=len(vocabulary))
+        if function == "mean":
+            results = results / np.maximum(counts, 1)
+    else:
+        start = np.inf if function == "min" else -np.inf
+        results = np.full(len(vocabulary), start)
+        getattr(np, function + "imum").at(results, groups, values)
+    return {vocabulary[group]: results[group].item() for group in np.flatnonzero(counts)}
+
+
+
+#one line about a stored row
+def row_text(store, row):
+    ranks = store.column("ranks")[row]
+    abilities = ", ".join(f"{ability.upper()[0] if ability in engine.primary_abilities else ability.title()} "
+                          f"{engine.ranks[rank]}" for ability, rank in zip(columnar.abilities, ranks))
+    values, starts, ends = store.ragged("power_ids")
+    powers = ", ".join(codec.powers[id][1] for id in values[starts[row]:ends[row]])
+    return (f"{row}: {engine.physical_form_names[store.column('physical_form')[row]]} "
+            f"({codec.origins[store.column('origin')[row]]}); {abilities}; "
+            f"Health {store.column('health')[row]}, Karma {store.column('karma')[row]}; "
+            f"Powers: {powers}")
+
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Search a columnar store of generated characters.")
+    parser.add_argument("store", help="column store directory (see columnar.py)")
+    parser.add_argument("filter", nargs="?", default="",
+                        help='e.g. \'strength >= "Amazing" and power_class == "Travel"\'')
+    parser.add_argument("--group-by", choices=group_fields, default=None,
+                        help="report the aggregates for each group")
+    parser.add_argument("--aggregate", action="append", default=[], metavar="FUNCTION:FIELD",
+                        help="count, or sum/mean/min/max of a field, e.g. mean:health (repeatable)")
+    parser.add_argument("--list", type=int, default=0, metavar="N",
+                        help="print the first N matching characters")
+    return parser.parse_args(argv)
+
+
+
+#a result as text; min and max of a rank are shown as the rank name
+def result_text(value, function, field):
+    if value is None:
+        return "none"
+    if field in rank_fields and function in ("min", "max"):
+        return engine.ranks[int(value)]
+    return f"{value:g}"
+
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    try:
+        store = columnar.ColumnStore(args.store, create=False)
+    except (OSError, ValueError) as error:
+        print(f"query.py: {error}", file=sys.stderr)
+        return 2
+    try:
+        mask = select(store, args.filter)
+        print(f"{int(mask.sum())} of {len(store)} characters match")
+        for row in np.flatnonzero(mask)[:args.list]:
+            print(row_text(store, row))
+        for spec in args.aggregate or (["count"] if args.group_by else []):
+            function, _, field = spec.partition(":")
+            result = aggregate(store, function, field or None, mask, args.group_by)
+            if isinstance(result, dict):
+                print(f"{spec} by {args.group_by}:")
+                for group, value in result.items():
+                    print(f"   {group}: {result_text(value, function, field)}")
+            else:
+                print(f"{spec}: {result_text(result, function, field)}")
+    except QueryError as error:
+        print(f"query.py: {error}", file=sys.stderr)
+        return 2
+    return 0
+
+
+
+if __name__ == "__main__":
+    sys.exit(main())
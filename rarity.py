@@ -0,0 +1,223 @@
+import math
+
+import engine
+import tables
+import powerindex
+
+
+################### RARITY ###################
+#The log probability of the rolls that made a generated character, read off
+#the compiled tables: physical form, origin, compound forms, the d100 ability
+#rolls and how the ability bonuses were spent, the number of power, talent
+#and contact slots, each power's class, power and rank, the weakness, and
+#each talent and contact. Each recorded result is scored with the chance of
+#its table row (summed over every row that gives the same result), the same
+#choices generate_character makes are scored as even choices, and rolls the
+#character does not record (the chance rolls of a Compound's bonuses, power
+#classes dropped for lack of slots) are left out.
+#
+#A result that no roll can give scores 0 (a log probability of -inf), which
+#is how a hand-edited sheet shows up. rarity() is the same score in bits;
+#higher is rarer.
+
+#table: {outcome: number of rolls that give it}
+outcome_counts = {}
+
+
+
+def chance(table, outcome):
+    counts = outcome_counts.get(table.name)
+    if counts is None:
+        counts = outcome_counts[table.name] = table.outcome_counts()
+    return counts.get(outcome, 0) / table.sides
+
+
+
+#chance of the slot table row giving this maximum number of slots; the rows
+#only differ by their minimum once the maximum is known
+def slots_chance(character, type):
+    maximum = getattr(character, f"number_of_{type}")["max"]
+    total = 0
+    for (low, high), count in tables.number_tables[type].outcome_counts().items():
+        if type == "powers" and not (low == 1 and character.power_bonus == -1):
+            high += character.power_bonus
+        if high == maximum:
+            total += count
+    return total / tables.number_tables[type].sides
+
+
+
+#chance of rolling a talent: talent class, then the row, then one of the
+#row's talents
+def talent_chance(talent):
+    total = 0
+    for talent_class, table in tables.talent_tables.items():
+        for row, count in table.outcome_counts().items():
+            if talent in row:
+                total += (chance(tables.talent_class_table, talent_class) *
+                          count / table.sides / len(row))
+    return total
+
+
+
+def contact_chance(contact):
+    classes = engine.contact_classes
+    return sum(1 / len(classes) / len(contacts)
+               for contacts in classes.values() if contact in contacts)
+
+
+
+#chance of the emission point note of an Energy Emission power
+def emission_chance(character, note):
+    counts = tables.energy_emission_table.outcome_counts()
+    return sum(count for epoint, count in counts.items()
+               if f"emitted from {character.emission_point(epoint)}" == note) / tables.energy_emission_table.sides
+
+
+
+#the chance of each of the ability rolls and of how the ability bonuses
+#were spent
+def ability_factors(character):
+    table = character.ability_table()
+    raised = []
+    for ability, inputs in character.ability_rolls.items():
+        yield (f"{ability} roll", chance(tables.ability_tables[table], inputs["rank_roll"]))
+        rolled = max(inputs["rank_roll"] + inputs["bonus"], 1)
+        if ability == "resources" and character.pf_resources_rank > -1:
+            rolled = character.pf_resources_rank
+        if ability == "popularity" and character.pf_popularity_rank > -1:
+            rolled = character.pf_popularity_rank
+        if ability in engine.primary_abilities:
+            raised.append(inputs["rank"] - rolled)
+        elif inputs["rank"] != rolled and not (ability == "resources" and
+                                               inputs["rank"] < rolled):
+            #Resources can be spent on slots; nothing else raises them
+            yield (f"{ability} rank", 0)
+    #each bonus goes to one of the primary abilities at random
+    if min(raised) < 0 or sum(raised) != character.ability_bonus_button_was_clicked:
+        yield ("ability bonuses", 0)
+        return
+    spent = sum(raised)
+    ways = math.factorial(spent)
+    for count in raised:
+        ways //= math.factorial(count)
+    yield ("ability bonuses", ways / len(engine.primary_abilities) ** spent)
+
+
+
+def power_factors(character):
+    table = tables.ability_tables[character.ability_table()]
+    detection = tables.power_tables["Detection"]
+    animal_detection = [] #row counts of the animal's automatic detection powers
+    energy_control_added = bool(character.energy_form)
+    bonus_powers = ()
+    for power in character.powers:
+        name, power_class = power["name"], power["class"]
+        label = f"power {name}"
+        if power["locked"]:
+            if character.animal_detection and power_class == "Detection" and len(animal_detection) < 2:
+                #the second detection power is rerolled until it differs from the first
+                count = detection.outcome_counts().get(name, 0)
+                yield (label, count / (detection.sides - sum(animal_detection)))
+                animal_detection.append(count)
+                continue
+            if name != "Winged Flight":
+                yield (label, chance(powerindex.power_classes[power_class].table, name))
+        elif name in bonus_powers:
+            #generate_character picks one of the bonus powers at random
+            yield (label, 1 / len(bonus_powers))
+            bonus_powers = ()
+        else:
+            if (power_class, name) not in powerindex.powers:
+                yield (label, 0)
+                continue
+            if power_class == "Energy Control" and energy_control_added:
+                #the Energy Control class an Energy form gets is not rolled
+                energy_control_added = False
+            else:
+                yield (f"{label} class", chance(tables.power_class_table, power_class))
+            yield (label, chance(powerindex.power_classes[power_class].table, name))
+            bonus_powers = powerindex.powers[(power_class, name)].bonus
+        yield (f"{label} rank", chance(table, power["rank"]))
+        note = power["note"]
+        if note.startswith("emitted from "):
+            yield (f"{label} emission point", emission_chance(character, note))
+        elif note.startswith("growth type: "):
+            yield (f"{label} growth type", chance(tables.growth_table, note[len("growth type: "):]))
+        elif note.startswith("shrink type: "):
+            yield (f"{label} shrink type", chance(tables.shrink_table, note[len("shrink type: "):]))
+        if power["variant"]:
+            yield (f"{label} option", chance(tables.biophysical_table, power["variant"]))
+
+
+
+def weakness_factors(character):
+    if not character.weakness:
+        return
+    stimulus, rest = character.weakness.split(" causes ")
+    effect, duration = rest.split(" that is ")
+    yield ("weakness stimulus", chance(tables.weakness_stimulus_table, stimulus))
+    effect_chance = chance(tables.weakness_effect_table, effect)
+    #without a power rank above Remarkable a Fatal weakness is Incapacitation
+    if not character.power_rank_above_remarkable:
+        if effect == "Fatal":
+            effect_chance = 0
+        elif effect == "Incapacitation":
+            effect_chance += chance(tables.weakness_effect_table, "Fatal")
+    yield ("weakness effect", effect_chance)
+    yield ("weakness duration", chance(tables.weakness_duration_table, duration))
+
+
+
+#(what was rolled, its chance) for every scored roll of a character;
+#physical_form_given leaves out the physical form roll for characters
+#generated with a chosen physical form
+def factors(character, physical_form_given=False):
+    if not physical_form_given:
+        yield ("physical form", chance(tables.physical_form_table, character.form_index))
+    yield ("origin", chance(tables.origin_table, character.origin))
+    if character.compound_forms:
+        count = character.compound_forms
+        yield ("compound forms", chance(tables.compound_forms_table, count))
+        for form, option in zip(character.compound_form_list[:count],
+                                character.compound_form_options_list[:count]):
+            form_index = engine.physical_form_names.index(form)
+            yield (f"compound form {form}", chance(tables.compound_form_table, form_index))
+            if option:
+                yield (f"compound form {form} option", 1 / len(engine.form_options[form_index]))
+    elif character.form_option > -1:
+        yield ("physical form option", 1 / len(character.form_options))
+    yield from ability_factors(character)
+    yield ("power slots", slots_chance(character, "powers"))
+    yield from power_factors(character)
+    yield from weakness_factors(character)
+    yield ("talent slots", slots_chance(character, "talents"))
+    for talent in character.talents:
+        yield (f"talent {talent['name']}", talent_chance(talent["name"]))
+    yield ("contact slots", slots_chance(character, "contacts"))
+    for contact in character.contacts[character.form_contacts:]:
+        yield (f"contact {contact['name']}", contact_chance(contact["name"]))
+
+
+
+#natural log of the chance of a character's rolls; -inf if one of them is
+#impossible
+def log_likelihood(character, physical_form_given=False):
+    total = 0.0
+    for what, probability in factors(character, physical_form_given):
+        if probability <= 0:
+            return -math.inf
+        total += math.log(probability)
+    return total
+
+
+
+#the log likelihood in bits, as a positive number; higher is rarer
+def rarity(character, physical_form_given=False):
+    return -log_likelihood(character, physical_form_given) / math.log(2)
+
+
+
+#the rolls of a character that no roll can give
+def impossible(character, physical_form_given=False):
+    return [what for what, probability in factors(character, physical_form_given) if probability <= 0]
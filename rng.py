@@ -0,0 +1,50 @@
+import random
+from hashlib import blake2b
+
+
+################### RANDOM NUMBER STREAMS ###################
+#Every roll takes an RNG so a run can be reproduced from its seed. Streams
+#are derived from a master seed and a key path by hashing, like a
+#counter-based generator: character k of a run is RNG.stream(seed, k) and
+#can be generated on any worker without generating characters 0..k-1.
+#RNG is a random.Random, so it has randint, random, choice, etc.
+class RNG(random.Random):
+
+    #the stream for a key path under a master seed
+    @classmethod
+    def stream(cls, seed, *keys):
+        return cls(derive_seed(seed, *keys))
+
+
+
+    #a child stream of this one; the parent stream is not advanced
+    def spawn(self, *keys):
+        return RNG(derive_seed(self.seed_key, *keys))
+
+
+
+    def seed(self, a=None, version=2):
+        #remember the seed so child streams can be derived from it
+        if a is None:
+            a = random.SystemRandom().getrandbits(128)
+        self.seed_key = a
+        super().seed(a, version)
+
+
+
+    #keep the seed when the stream is sent to a worker process
+    def __reduce__(self):
+        return (self.__class__, (self.seed_key,), self.getstate())
+
+
+
+    #an index from 0 to count - 1
+    def index(self, count):
+        return self.randint(0, count - 1)
+
+
+
+#a 128-bit integer seed for a key path under a master seed
+def derive_seed(seed, *keys):
+    key = "/".join(str(part) for part in (seed,) + keys)
+    return int.from_bytes(blake2b(key.encode(), digest_size=16).digest(), "little")
@@ -0,0 +1,121 @@
+import os
+import json
+from collections import Counter
+
+import numpy as np
+
+import engine
+import columnar
+
+
+################### RUNNING STATISTICS ###################
+#Distributions of a stream of generated characters, kept as counts so two
+#Stats (e.g. from two worker processes) merge by adding them together:
+#rank histograms per ability, Health and Karma values, physical forms,
+#origins, power classes and powers, weakness parts, talents, contacts and
+#the number of powers/talents/contacts. Health and Karma are sums of a few
+#rank scores, so they take a few thousand different values at most; their
+#counts are kept exactly, which makes the quantiles exact and costs less
+#than a quantile sketch would.
+
+counters = ["physical_forms", "origins", "power_classes", "powers",
+            "weakness_stimuli", "weakness_effects", "weakness_durations",
+            "talents", "contacts", "health", "karma",
+            "power_counts", "talent_counts", "contact_counts"]
+
+
+
+class Stats:
+    def __init__(self):
+        self.characters = 0
+        #[ability, rank index]: number of characters
+        self.ranks = np.zeros((len(columnar.abilities), len(engine.ranks)), dtype=np.int64)
+        for name in counters:
+            setattr(self, name, Counter())
+
+
+
+    def add(self, character):
+        self.characters += 1
+        for column, ability in enumerate(columnar.abilities):
+            self.ranks[column, character.ability_rank(ability)] += 1
+        self.physical_forms[character.physical_form] += 1
+        self.origins[character.origin] += 1
+        self.health[character.health] += 1
+        self.karma[character.karma] += 1
+        for power in character.powers:
+            self.power_classes[power["class"]] += 1
+            self.powers[power["name"]] += 1
+        if character.weakness:
+            stimulus, rest = character.weakness.split(" causes ")
+            effect, duration = rest.split(" that is ")
+            self.weakness_stimuli[stimulus] += 1
+            self.weakness_effects[effect] += 1
+            self.weakness_durations[duration] += 1
+        self.talents.update(talent["name"] for talent in character.talents)
+        self.contacts.update(contact["name"] for contact in character.contacts)
+        self.power_counts[len(character.powers)] += 1
+        self.talent_counts[len(character.talents)] += 1
+        self.contact_counts[len(character.contacts)] += 1
+
+
+
+    #pass the characters of a stream through, counting each one
+    def tally(self, characters):
+        for character in characters:
+            self.add(character)
+            yield character
+
+
+
+    #add the counts of another Stats to these
+    def merge(self, other):
+        self.characters += other.characters
+        self.ranks += other.ranks
+        for name in counters:
+            getattr(self, name).update(getattr(other, name))
+        return self
+
+
+
+    #the smallest value with at least fraction q of the counts at or below it
+    #("health" or "karma")
+    def quantile(self, name, q):
+        counts = getattr(self, name)
+        if not counts:
+            return None
+        values = sorted(counts)
+        cumulative = np.cumsum([counts[value] for value in values])
+        return values[int(np.searchsorted(cumulative, q * cumulative[-1]))]
+
+
+
+    def mean(self, name):
+        counts = getattr(self, name)
+        total = sum(counts.values())
+        return sum(value * count for value, count in counts.items()) / total if total else None
+
+
+
+    def to_dict(self):
+        record = {"characters": self.characters,
+                  "ranks": {ability: {engine.ranks[rank]: int(count)
+                                      for rank, count in enumerate(self.ranks[column]) if count}
+                            for column, ability in enumerate(columnar.abilities)}}
+        for name in ("health", "karma"):
+            record[name] = {"mean": self.mean(name),
+                            "quantiles": {str(q): self.quantile(name, q)
+                                          for q in (0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99)}}
+        for name in counters:
+            if name not in ("health", "karma"):
+                record[name] = dict(getattr(self, name).most_common())
+        return record
+
+
+
+    #write to_dict to a JSON file, replacing it in one step so it can be
+    #read while a batch is still running
+    def save(self, file_path):
+        with open(file_path + ".tmp", "w") as file:
+            json.dump(self.to_dict(), file, indent=1)
+        os.replace(file_path + ".tmp", file_path)
@@ -0,0 +1,165 @@
+import csv
+import json
+import itertools
+
+import engine
+import codec
+import library
+import columnar
+import conditioned
+from rng import RNG
+
+
+################### CHARACTER STREAMS ###################
+#Generate characters one at a time and hand them to a sink a chunk at a
+#time, so memory use does not grow with the number of characters, e.g.
+#   with open("npcs.jsonl", "w") as file:
+#       write_stream(iter_characters(42, count=1000000), JSONLSink(file))
+#The character at index i of a run is always generated from
+#RNG.stream(seed, i), the same as in batch.py and library.py.
+
+#number of characters a sink is given at once
+chunk_size = 1000
+
+
+
+#yield the characters of a run from index start on (forever if count is
+#None); rules is the rules hash the run was made with, to stop a stored run
+#being regenerated with different rules; constraints are the
+#conditioned.generate_character arguments (physical_forms, min_ranks,
+#power_classes); physical_form generates only that form, with or without
+#constraints (which then can not give physical_forms as well)
+def iter_characters(seed, rules=None, constraints=None, count=None, start=0, physical_form=None):
+    if rules is not None and rules != library.rules_hash:
+        raise ValueError(f"The characters were generated with different rules ({rules})")
+    if constraints and physical_form:
+        if constraints.get("physical_forms"):
+            raise ValueError("Give either physical_form or constraints with physical_forms, not both")
+        constraints = dict(constraints, physical_forms=[physical_form])
+    indices = itertools.count(start) if count is None else range(start, start + count)
+    for index in indices:
+        rng = RNG.stream(seed, index)
+        if constraints:
+            yield conditioned.generate_character(rng=rng, **constraints)
+        else:
+            yield engine.generate_character(physical_form, rng)
+
+
+
+#write the characters to the sink a chunk at a time and close it; returns
+#the number of characters written
+def write_stream(characters, sink, size=chunk_size):
+    written = 0
+    characters = iter(characters)
+    try:
+        while True:
+            chunk = list(itertools.islice(characters, size))
+            if not chunk:
+                break
+            sink.write(chunk)
+            written += len(chunk)
+    finally:
+        sink.close()
+    return written
+
+
+
+################### SINKS ###################
+#A sink takes chunks of characters with write(characters) and finishes with
+#close(). File sinks write to an open file and leave closing it to the
+#caller; score is a function giving a number to add to each character (e.g.
+#rarity.rarity) or None.
+
+class TextSink:
+    def __init__(self, file, score=None):
+        self.file = file
+        self.score = score
+
+
+
+    def write(self, characters):
+        for character in characters:
+            self.file.write(character.character_sheet() + "\n")
+            if self.score:
+                self.file.write(f"Rarity: {self.score(character):.1f} bits\n")
+            self.file.write("\n")
+
+
+
+    def close(self):
+        self.file.flush()
+
+
+
+class JSONLSink(TextSink):
+    def write(self, characters):
+        for character in characters:
+            record = character.to_dict()
+            if self.score:
+                record["rarity"] = round(self.score(character), 2)
+            self.file.write(json.dumps(record) + "\n")
+
+
+
+#one row per character; powers, talents and contacts are joined with "; "
+class CSVSink(TextSink):
+    def __init__(self, file, score=None, header=True):
+        super().__init__(file, score)
+        self.writer = csv.writer(file)
+        self.header = header
+
+
+
+    def write(self, characters):
+        if self.header:
+            self.writer.writerow(["physical_form", "origin"] +
+                                 [ability.capitalize() for ability in columnar.abilities] +
+                                 ["health", "karma", "powers", "weakness", "talents", "contacts"] +
+                                 (["rarity"] if self.score else []))
+            self.header = False
+        for character in characters:
+            row = [character.physical_form_text(), character.origin]
+            row += [engine.ranks[character.ability_rank(ability)] for ability in columnar.abilities]
+            row += [character.health, character.karma,
+                    "; ".join(character.power_text(power) for power in character.powers),
+                    character.weakness, "; ".join(talent["name"] for talent in character.talents),
+                    "; ".join(contact["name"] for contact in character.contacts)]
+            if self.score:
+                row.append(round(self.score(character), 2))
+            self.writer.writerow(row)
+
+
+
+#codec.py records; file must be opened in binary mode
+class BinarySink:
+    def __init__(self, file, header=True):
+        self.file = file
+        if header:
+            file.write(codec.header())
+
+
+
+    def write(self, characters):
+        self.file.write(codec.encode_many(characters))
+
+
+
+    def close(self):
+        self.file.flush()
+
+
+
+#appends to a columnar.ColumnStore directory
+class ColumnarSink:
+    def __init__(self, path):
+        self.store = columnar.ColumnStore(path)
+
+
+
+    def write(self, characters):
+        self.store.append(characters)
+
+
+
+    def close(self):
+        pass
@@ -0,0 +1,120 @@
+import os
+import sys
+import json
+import atexit
+import argparse
+from collections import Counter, defaultdict
+
+import tables
+
+
+################### TABLE HIT COUNTS ###################
+#Opt-in counts of how often each row of each roll table is rolled, to check
+#the rows that come up against the chances the tables give them. Counting
+#costs one check per roll while it is off. The report lists, for each
+#table, every row's width out of the die and its hits, the rows that can
+#never be rolled (zero width, like Limited Duration after Contact) and the
+#rows that were never hit, plus branches that change a rolled result (a
+#Fatal weakness without a power rank above Remarkable).
+#
+#Count a GUI session by setting MSH_TABLE_HITS to the JSON file to write on
+#exit, a batch with batch.py --table-hits, or a generation run with
+#   python tablehits.py --count 100000 --seed 1 -o hits.json
+
+environment_variable = "MSH_TABLE_HITS"
+
+
+
+def enable():
+    if tables.hits is None:
+        tables.hits = defaultdict(Counter)
+
+
+
+def disable():
+    tables.hits = None
+
+
+
+def reset():
+    if tables.hits is not None:
+        tables.hits.clear()
+
+
+
+#the counts so far, starting new ones; a worker process hands these back
+#with each chunk of characters it generates
+def take():
+    counts = {name: dict(table_counts) for name, table_counts in tables.hits.items()}
+    tables.hits.clear()
+    return counts
+
+
+
+#add counts taken in another process to this process's counts
+def merge(counts):
+    for name, table_counts in counts.items():
+        tables.hits[name].update(table_counts)
+
+
+
+#{table name: {"rolls", "rows": [{"outcome", "width", "expected", "hits"}],
+#  "unreachable": [outcome], "never_hit": [outcome]}} plus "branches"
+def report():
+    hits = tables.hits or {}
+    result = {}
+    for table in tables.all_tables():
+        counts = hits.get(table.name, Counter())
+        rolls = sum(counts.values())
+        rows = []
+        for index, (outcome, width) in enumerate(zip(table.outcomes, table.row_counts())):
+            rows.append({"outcome": outcome, "width": width,
+                         "expected": rolls * width / table.sides, "hits": counts[index]})
+        result[table.name] = {"rolls": rolls, "rows": rows,
+                              "unreachable": [row["outcome"] for row in rows if row["width"] == 0],
+                              "never_hit": [row["outcome"] for row in rows
+                                            if row["width"] and not row["hits"]]}
+    table_names = set(result)
+    result["branches"] = {name: dict(counts) for name, counts in hits.items()
+                          if name not in table_names}
+    return result
+
+
+
+def dump(file_path):
+    with open(file_path, "w") as file:
+        json.dump(report(), file, indent=1)
+
+
+
+#count this process's rolls and write them to the file named by
+#MSH_TABLE_HITS when it exits, if the variable is set
+def enable_from_environment():
+    file_path = os.environ.get(environment_variable)
+    if file_path:
+        enable()
+        atexit.register(dump, file_path)
+
+
+
+def main(argv=None):
+    import stream
+
+    parser = argparse.ArgumentParser(description="Count the table rows rolled while generating characters.")
+    parser.add_argument("--count", type=int, default=10000, help="number of characters (default 10000)")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the run (default 0)")
+    parser.add_argument("-o", "--output", required=True, help="JSON file to write")
+    args = parser.parse_args(argv)
+    enable()
+    for character in stream.iter_characters(args.seed, count=args.count):
+        pass
+    dump(args.output)
+    for name, table in report().items():
+        if name != "branches" and table["unreachable"]:
+            print(f"{name}: can never roll {', '.join(map(str, table['unreachable']))}")
+    return 0
+
+
+
+if __name__ == "__main__":
+    sys.exit(main())
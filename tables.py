@@ -0,0 +1,407 @@
+from bisect import bisect
+
+import powerlists
+
+
+#{table name: {row index: times rolled}} while table hits are being counted
+#(see tablehits.py); None when they are not
+hits = None
+
+
+
+#count a hit on a row or branch that is not a table roll
+def count_hit(name, key):
+    if hits is not None:
+        hits[name][key] += 1
+
+
+################### TABLE COMPILER ###################
+#Walker/Vose alias table for drawing row indices with the given integer
+#weights in constant time: one uniform draw picks a column and whether to
+#take the column's own row or its alias. Rows with weight 0 are never drawn.
+class AliasTable:
+    __slots__ = ("probability", "alias")
+
+    def __init__(self, weights):
+        count = len(weights)
+        total = sum(weights)
+        if total <= 0:
+            raise ValueError("Alias table needs at least one row with a weight")
+        #scale so the average column holds exactly total
+        scaled = [weight * count for weight in weights]
+        probability = [0.0] * count
+        alias = list(range(count))
+        small = [index for index, weight in enumerate(scaled) if weight < total]
+        large = [index for index, weight in enumerate(scaled) if weight >= total]
+        while small and large:
+            less = small.pop()
+            more = large.pop()
+            probability[less] = scaled[less] / total
+            alias[less] = more
+            scaled[more] -= total - scaled[less]
+            if scaled[more] < total:
+                small.append(more)
+            else:
+                large.append(more)
+        for index in small + large:
+            probability[index] = 1.0
+        object.__setattr__(self, "probability", tuple(probability))
+        object.__setattr__(self, "alias", tuple(alias))
+
+
+
+    def __setattr__(self, name, value):
+        raise AttributeError("AliasTable is immutable")
+
+
+
+    def __len__(self):
+        return len(self.probability)
+
+
+
+    #draw a row index; uniform returns a float in [0, 1)
+    def sample(self, uniform):
+        column = uniform() * len(self.probability)
+        index = int(column)
+        if column - index < self.probability[index]:
+            return index
+        return self.alias[index]
+
+
+
+    #draw size row indices at once with a numpy Generator
+    def sample_array(self, rng, size):
+        import numpy as np
+        column = rng.random(size) * len(self.probability)
+        index = column.astype(np.intp)
+        probability = np.asarray(self.probability)
+        alias = np.asarray(self.alias, dtype=np.intp)
+        return np.where(column - index < probability[index], index, alias[index])
+
+
+
+#A die roll table compiled from (threshold, outcome) rows, where each outcome
+#covers the rolls below its threshold and at or above the previous one (the
+#"if roll < N" ladders of the rulebook). Rows may share a threshold, which
+#leaves an outcome that can never be rolled, the same as the rulebook.
+#The thresholds and outcomes are tuples and every roll from 1 to sides is
+#resolved to its outcome when the table is compiled, so a lookup is a
+#single index into by_roll. Random draws go through an alias table built
+#from the same rows, which takes one uniform draw instead of a die roll.
+class Table:
+    __slots__ = ("name", "sides", "thresholds", "outcomes", "by_roll", "indices", "alias")
+
+    def __init__(self, name, rows, sides=100):
+        thresholds = tuple(threshold for threshold, outcome in rows)
+        if not thresholds:
+            raise ValueError(f"Table {name} has no rows")
+        for low, high in zip(thresholds, thresholds[1:]):
+            if high < low:
+                raise ValueError(f"Table {name} thresholds are not in order: {low} > {high}")
+        if thresholds[-1] <= sides:
+            raise ValueError(f"Table {name} does not cover a roll of {sides}")
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "sides", sides)
+        object.__setattr__(self, "thresholds", thresholds)
+        object.__setattr__(self, "outcomes", tuple(outcome for threshold, outcome in rows))
+        #index 0 is never rolled; it resolves to the first row
+        indices = tuple(bisect(thresholds, roll) for roll in range(sides + 1))
+        object.__setattr__(self, "indices", indices)
+        object.__setattr__(self, "by_roll", tuple(self.outcomes[index] for index in indices))
+        object.__setattr__(self, "alias", AliasTable(self.row_counts()))
+
+
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Table {self.name} is immutable")
+
+
+
+    def __getitem__(self, roll):
+        return self.by_roll[roll]
+
+
+
+    def __len__(self):
+        return len(self.outcomes)
+
+
+
+    def __repr__(self):
+        return f"Table({self.name!r}, {len(self.outcomes)} rows, d{self.sides})"
+
+
+
+    #the row index a roll lands on
+    def index(self, roll):
+        return self.indices[roll]
+
+
+
+    #draw an outcome with rng (an rng.RNG or anything with random())
+    def roll(self, rng):
+        index = self.alias.sample(rng.random)
+        if hits is not None:
+            hits[self.name][index] += 1
+        return self.outcomes[index]
+
+
+
+    def roll_index(self, rng):
+        index = self.alias.sample(rng.random)
+        if hits is not None:
+            hits[self.name][index] += 1
+        return index
+
+
+
+    #the outcome of a die roll made by the caller; unlike table[roll] it
+    #counts as a roll of the table
+    def lookup(self, roll):
+        index = self.indices[roll]
+        if hits is not None:
+            hits[self.name][index] += 1
+        return self.outcomes[index]
+
+
+
+    #number of rolls (out of sides) that land on each row, in row order;
+    #rows that share a threshold with the row before them get 0
+    def row_counts(self):
+        counts = []
+        low = 1
+        for threshold in self.thresholds:
+            high = min(max(threshold, low), self.sides + 1)
+            counts.append(high - low)
+            low = high
+        return counts
+
+
+
+    #number of rolls (out of sides) that land on each outcome
+    def outcome_counts(self):
+        counts = {}
+        for outcome, count in zip(self.outcomes, self.row_counts()):
+            counts[outcome] = counts.get(outcome, 0) + count
+        return counts
+
+
+
+#a table without the rows whose outcome is in excluded, the rest keeping
+#their relative chances; rolling it is the same as rerolling the full table
+#until the outcome is not excluded
+def excluding(table, excluded, name):
+    rows = []
+    total = 0
+    for outcome, count in zip(table.outcomes, table.row_counts()):
+        if count and outcome not in excluded:
+            total += count
+            rows.append((total + 1, outcome))
+    return Table(name, rows, sides=total)
+
+
+
+#(table name, row index): alias table of the table's other rows
+other_rows = {}
+
+
+
+#draw a row index other than index, as if rerolling until it differs
+def roll_other_index(table, index, rng):
+    alias = other_rows.get((table.name, index))
+    if alias is None:
+        counts = table.row_counts()
+        counts[index] = 0
+        alias = other_rows[(table.name, index)] = AliasTable(counts)
+    other = alias.sample(rng.random)
+    if hits is not None:
+        hits[table.name][other] += 1
+    return other
+
+
+
+################### ROLL TABLES ###################
+#physical form list index for each d100 roll
+physical_form_table = Table("Physical Form", [
+    (27, 0), (31, 1), (34, 2), (36, 3), (39, 4), (47, 5), (50, 7),
+    (52, 8), (54, 9), (58, 10), (59, 11), (60, 12), (61, 13), (63, 14),
+    (65, 15), (67, 16), (68, 17), (69, 18), (70, 19), (73, 21), (75, 22),
+    (77, 23), (80, 24), (83, 25), (85, 26), (86, 27), (87, 28), (88, 29),
+    (89, 30), (90, 31), (91, 32), (92, 33), (93, 34), (94, 35), (95, 36),
+    (96, 37), (97, 38), (98, 39), (99, 40), (100, 41), (101, 42)])
+
+origin_table = Table("Origin of Power", [
+    (11, "Natal"), (21, "Maturity"), (31, "Self-Achievement"),
+    (36, "Endowment"), (51, "Technical Mishap"), (61, "Technical Procedure"),
+    (66, "Creation"), (77, "Biological Exposure"), (88, "Chemical Exposure"),
+    (99, "Energy Exposure"), (101, "Rebirth")])
+
+#number of compound/changeling forms
+compound_forms_table = Table("Compound Forms", [(51, 2), (76, 3), (96, 4), (101, 5)])
+#the forms a Compound or Changeling can be made of: not Robot-Metamorphic,
+#Compound or Changeling
+compound_form_table = excluding(physical_form_table, (27, 40, 41), "Compound Physical Form")
+
+#ability table number: rank index for each d100 roll
+ability_tables = {
+    1: Table("Ability Table 1", [(6, 1), (11, 2), (21, 3), (41, 4), (61, 5),
+                                 (81, 6), (97, 7), (101, 8)]),
+    2: Table("Ability Table 2", [(6, 1), (26, 2), (78, 3), (96, 4), (101, 5)]),
+    3: Table("Ability Table 3", [(6, 1), (11, 2), (41, 3), (81, 4), (96, 5),
+                                 (101, 6)]),
+    4: Table("Ability Table 4", [(6, 1), (11, 2), (16, 3), (41, 4), (51, 5),
+                                 (71, 6), (91, 7), (99, 8), (101, 9)]),
+    5: Table("Ability Table 5", [(11, 1), (21, 2), (31, 3), (41, 4), (61, 5),
+                                 (71, 6), (81, 7), (96, 8), (101, 9)]),
+}
+
+#number of power, talent and contact slots
+number_ranges = [
+    (13, {"powers": {"min": 1, "max": 3}, "talents": {"min": 0, "max": 3}, "contacts": {"min": 0, "max": 2}}),
+    (27, {"powers": {"min": 2, "max": 4}, "talents": {"min": 1, "max": 4}, "contacts": {"min": 0, "max": 4}}),
+    (42, {"powers": {"min": 3, "max": 5}, "talents": {"min": 1, "max": 6}, "contacts": {"min": 1, "max": 4}}),
+    (56, {"powers": {"min": 4, "max": 6}, "talents": {"min": 2, "max": 4}, "contacts": {"min": 2, "max": 4}}),
+    (67, {"powers": {"min": 5, "max": 7}, "talents": {"min": 2, "max": 6}, "contacts": {"min": 2, "max": 6}}),
+    (76, {"powers": {"min": 6, "max": 8}, "talents": {"min": 2, "max": 8}, "contacts": {"min": 3, "max": 3}}),
+    (84, {"powers": {"min": 7, "max": 9}, "talents": {"min": 3, "max": 4}, "contacts": {"min": 3, "max": 4}}),
+    (90, {"powers": {"min": 8, "max": 10}, "talents": {"min": 3, "max": 6}, "contacts": {"min": 3, "max": 6}}),
+    (95, {"powers": {"min": 9, "max": 12}, "talents": {"min": 4, "max": 4}, "contacts": {"min": 4, "max": 4}}),
+    (98, {"powers": {"min": 10, "max": 12}, "talents": {"min": 4, "max": 8}, "contacts": {"min": 4, "max": 5}}),
+    (100, {"powers": {"min": 12, "max": 14}, "talents": {"min": 5, "max": 6}, "contacts": {"min": 5, "max": 5}}),
+    (101, {"powers": {"min": 14, "max": 18}, "talents": {"min": 6, "max": 8}, "contacts": {"min": 6, "max": 6}})
+]
+#type ("powers", "talents", "contacts"): (min, max) for each d100 roll
+number_tables = {type: Table(f"Number of {type.capitalize()}",
+                             [(threshold, (values[type]["min"], values[type]["max"]))
+                              for threshold, values in number_ranges])
+                 for type in ("powers", "talents", "contacts")}
+
+power_class_table = Table("Power Class", [
+    (6, "Defensive"), (12, "Detection"), (17, "Energy Control"),
+    (25, "Energy Emission"), (30, "Fighting"), (32, "Illusory"),
+    (36, "Lifeform Control"), (41, "Magical"), (48, "Matter Control"),
+    (54, "Matter Conversion"), (58, "Matter Creation"),
+    (72, "Mental Enhancement"), (86, "Physical Enhancement"),
+    (89, "Power Control"), (93, "Self-Alteration"), (101, "Travel")])
+
+#power class: d100 roll thresholds matching the order of the powers in powerlists
+power_thresholds = {
+    "Defensive": [16, 21, 24, 31, 36, 41, 49, 51, 54, 66, 71, 78,
+                  83, 88, 95, 98, 101],
+    "Detection": [3, 5, 11, 15, 21, 29, 35, 41, 43, 45, 51, 55, 57,
+                  59, 60, 63, 70, 80, 91, 95, 99, 101],
+    "Energy Control": [8, 11, 16, 19, 26, 29, 32, 37, 39, 46, 50, 54, 60,
+                       67, 74, 78, 81, 85, 91, 98, 101],
+    "Energy Emission": [11, 21, 23, 35, 38, 43, 53, 63, 73, 76, 79, 84,
+                        94, 101],
+    "Fighting": [21, 61, 76, 81, 99, 101],
+    "Illusory": [16, 71, 86, 101],
+    "Lifeform Control": [15, 16, 19, 27, 33, 35, 36, 40, 52, 61, 63, 66, 67,
+                         70, 72, 81, 84, 90, 91, 96, 101],
+    "Magical": [9, 16, 18, 26, 29, 34, 40, 42, 72, 78, 80, 96, 99, 101],
+    "Matter Control": [6, 18, 23, 30, 40, 47, 52, 62, 69, 74, 84, 94, 101],
+    "Matter Conversion": [11, 26, 46, 71, 81, 101],
+    "Matter Creation": [11, 25, 30, 36, 60, 70, 89, 101],
+    "Mental Enhancement": [5, 9, 12, 13, 14, 16, 17, 23, 24, 27, 28, 32, 41,
+                           48, 49, 59, 66, 67, 68, 70, 73, 74, 75, 76, 77,
+                           79, 80, 81, 82, 86, 87, 97, 99, 101],
+    "Physical Enhancement": [15, 29, 31, 34, 41, 43, 46, 48, 61, 63, 68, 72, 77,
+                             79, 83, 91, 95, 97, 99, 101],
+    "Power Control": [9, 13, 19, 24, 38, 40, 50, 56, 61, 65, 74, 84, 97,
+                      101],
+    "Self-Alteration": [3, 10, 11, 14, 20, 21, 28, 31, 34, 38, 39, 43, 45,
+                        50, 56, 58, 59, 61, 62, 63, 64, 68, 71, 72, 75,
+                        79, 82, 85, 91, 95, 100, 101],
+    "Travel": [3, 7, 11, 13, 15, 20, 27, 29, 35, 43, 47, 52, 57,
+               59, 65, 73, 77, 79, 81, 83, 94, 98, 99, 101],
+}
+
+#power class: power name for each d100 roll
+power_tables = {power_class: Table(power_class,
+                                   list(zip(thresholds, powerlists.all_power_lists[power_class])))
+                for power_class, thresholds in power_thresholds.items()}
+
+talent_class_table = Table("Talent Class", [
+    (21, "Weapon Skills"), (46, "Fighting Skills"), (66, "Professional Skills"),
+    (86, "Scientific Skills"), (91, "Mystical and Mental Skills"),
+    (101, "Other Skills")])
+
+#talent class: talents to choose from for each d10 roll
+talent_tables = {
+    "Weapon Skills": Table("Weapon Skills", [
+        (3, ("Guns",)), (6, ("Thrown Weapons",)), (7, ("Bows",)),
+        (9, ("Blunt Weapons",)), (10, ("Sharp Weapons",)),
+        (11, ("Oriental Weapons", "Marksman*", "Weapons Master*",
+              "Weapon Specialist*"))], sides=10),
+    "Fighting Skills": Table("Fighting Skills", [
+        (2, ("Martial Arts A",)), (3, ("Martial Arts B",)),
+        (4, ("Martial Arts C",)), (5, ("Martial Arts D",)),
+        (6, ("Martial Arts E",)), (7, ("Wrestling",)),
+        (8, ("Thrown Objects",)), (9, ("Tumbling",)),
+        (11, ("Acrobatics",))], sides=10),
+    "Professional Skills": Table("Professional Skills", [
+        (2, ("Medicine*",)), (3, ("Law", "Law Enforcement")),
+        (4, ("Pilot",)), (5, ("Military",)),
+        (6, ("Business/Finance",)), (7, ("Journalism",)),
+        (8, ("Engineering",)), (9, ("Crime",)),
+        (10, ("Psychiatry",)), (11, ("Detective/Espionage",))], sides=10),
+    "Scientific Skills": Table("Scientific Skills", [
+        (3, ("Chemistry",)), (5, ("Biology",)), (7, ("Geology",)),
+        (8, ("Genetics",)), (9, ("Archeology",)),
+        (10, ("Physics", "Computers")), (11, ("Electronics",))], sides=10),
+    "Mystical and Mental Skills": Table("Mystical and Mental Skills", [
+        (3, ("Trance",)), (6, ("Mesmerism and Hypnosis",)),
+        (8, ("Sleight of Hand",)),
+        (10, ("Resist Domination", "Mystic Origin*")),
+        (11, ("Occult Lore",))], sides=10),
+    "Other Skills": Table("Other Skills", [
+        (3, ("Artist",)), (5, ("Languages",)), (7, ("First Aid",)),
+        (9, ("Repair/Tinkering",)),
+        (11, ("Trivia", "Performer", "Animal Training*",
+              "Heir to Fortune*", "Student*", "Leadership*"))], sides=10),
+}
+
+#Wings, Antennae and Tail are replaced by another body part if the character
+#does not have them (see Character.energy_emission_body_part)
+energy_emission_table = Table("Energy Emission Body Part", [
+    (15, "Entire body"), (23, "Head"), (31, "Eyes"), (39, "Mouth and nose"),
+    (47, "Torso"), (55, "Arms"), (63, "Hands"), (68, "Fingers"), (71, "Legs"),
+    (74, "Feet"), (77, "Wings"), (82, "Antennae"), (87, "Tail"),
+    (101, "Any location")])
+
+biophysical_table = Table("Biophysical Control", [
+    (25, "Healing"), (45, "Regeneration"), (49, "Revival"),
+    (69, "Damage Transferral"), (77, "Decay"), (93, "Disruption"),
+    (101, "Aging")])
+
+growth_table = Table("Growth", [
+    (26, "Atomic Dispersal"), (76, "Atomic Gain"), (101, "Atomic Growth")])
+
+shrink_table = Table("Shrinking", [
+    (21, "Atomic Collapse"), (41, "Atomic Reduction"), (101, "Atomic Shrinkage")])
+
+weakness_stimulus_table = Table("Weakness Stimulus", [
+    (14, "Elemental Allergy"), (19, "Molecular Allergy"), (44, "Energy Allergy"),
+    (69, "Energy Depletion"), (82, "Energy Dampening"), (95, "Finite Limit"),
+    (101, "Psychological")])
+
+#Fatal is only possible if a power rank is above Remarkable, else it is Incapacitation
+weakness_effect_table = Table("Weakness Effect", [
+    (51, "Power Negation"), (91, "Incapacitation"), (101, "Fatal")])
+
+#Limited Duration after Contact shares its threshold with Limited Duration
+#with Contact in the rulebook table, so it is never rolled
+weakness_duration_table = Table("Weakness Duration", [
+    (41, "Continuous with Contact"), (61, "Limited Duration with Contact"),
+    (61, "Limited Duration after Contact"), (101, "Permanent")])
+
+
+
+#every roll table
+def all_tables():
+    return [physical_form_table, origin_table, compound_forms_table, compound_form_table,
+            *ability_tables.values(), *number_tables.values(), power_class_table,
+            *power_tables.values(), talent_class_table, *talent_tables.values(),
+            energy_emission_table, biophysical_table, growth_table, shrink_table,
+            weakness_stimulus_table, weakness_effect_table, weakness_duration_table]
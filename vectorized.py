@@ -0,0 +1,104 @@
+import numpy as np
+
+import engine
+import tables
+
+
+################### VECTORIZED ABILITY ROLLS ###################
+#Rolls the abilities of a whole batch of characters at once instead of one
+#randint and ability_roll per ability (see Character.roll_abilities, which
+#this matches roll for roll apart from the random numbers used).
+
+#columns of the (N, 9) ability matrices
+abilities = engine.primary_abilities + engine.secondary_abilities
+health_columns = [abilities.index(ability) for ability in engine.primary_abilities
+                  if ability in engine.health_abilities]
+karma_columns = [abilities.index(ability) for ability in engine.primary_abilities
+                 if ability in engine.karma_abilities]
+resources_column = abilities.index("resources")
+popularity_column = abilities.index("popularity")
+
+#rank index for [ability table number, d100 roll]; row 0 is unused
+rank_lookup = np.zeros((len(tables.ability_tables) + 1, 101), dtype=np.int8)
+for table_number, table in tables.ability_tables.items():
+    rank_lookup[table_number] = table.by_roll
+
+#rank score for [std_rank_scores, rank index]
+score_lookup = np.array([[engine.rank_scores[rank][std_rank_scores] for rank in engine.ranks]
+                         for std_rank_scores in (0, 1)], dtype=np.int64)
+
+
+
+#roll the nine abilities for every character in one go
+#   table_numbers: (N,) ability table (1-5) for each character
+#   bonuses: (N, 9) or (9,) column shifts from the physical form (*_bonus)
+#   pf_resources_rank/pf_popularity_rank: (N,) rank set by the physical form or -1
+#   health_multiplier: (N,) or a single multiplier
+#returns {"roll", "rank_roll", "bonus", "rank"} as (N, 9) arrays, the same
+#keys as Character.ability_rolls, plus (N,) "health" and "karma"
+def roll_abilities(table_numbers, bonuses=0, pf_resources_rank=-1, pf_popularity_rank=-1,
+                   health_multiplier=1, std_rank_scores=0, rng=None):
+    if rng is None:
+        rng = np.random.default_rng()
+    table_numbers = np.asarray(table_numbers, dtype=np.intp)
+    count = len(table_numbers)
+    rolls = rng.integers(1, 101, size=(count, len(abilities)))
+    rank_rolls = rank_lookup[table_numbers[:, None], rolls]
+    bonuses = np.broadcast_to(np.asarray(bonuses, dtype=np.int8), rank_rolls.shape)
+    #a bonus or penalty can not lower a rank below Feeble
+    rank = np.maximum(rank_rolls + bonuses, 1)
+
+    #Resources or Popularity set by the Physical Form replace the rolled rank
+    pf_resources_rank = np.broadcast_to(np.asarray(pf_resources_rank, dtype=np.int8), (count,))
+    pf_popularity_rank = np.broadcast_to(np.asarray(pf_popularity_rank, dtype=np.int8), (count,))
+    rank[:, resources_column] = np.where(pf_resources_rank > -1, pf_resources_rank,
+                                         rank[:, resources_column])
+    rank[:, popularity_column] = np.where(pf_popularity_rank > -1, pf_popularity_rank,
+                                          rank[:, popularity_column])
+
+    scores = score_lookup[std_rank_scores][rank]
+    health = scores[:, health_columns].sum(axis=1) * np.asarray(health_multiplier, dtype=np.int64)
+    karma = scores[:, karma_columns].sum(axis=1)
+    return {"roll": rolls, "rank_roll": rank_rolls, "bonus": bonuses,
+            "rank": rank, "health": health, "karma": karma}
+
+
+
+#the roll_abilities arguments for characters whose physical form (and any
+#options or compound forms) has been chosen
+def character_inputs(characters):
+    table_numbers = np.array([character.ability_table() for character in characters], dtype=np.int64)
+    bonuses = np.array([[getattr(character, f"{ability}_bonus") for ability in abilities]
+                        for character in characters], dtype=np.int64).reshape(-1, len(abilities))
+    pf_resources_rank = np.array([character.pf_resources_rank for character in characters], dtype=np.int64)
+    pf_popularity_rank = np.array([character.pf_popularity_rank for character in characters], dtype=np.int64)
+    health_multiplier = np.array([character.health_multiplier for character in characters], dtype=np.int64)
+    return table_numbers, bonuses, pf_resources_rank, pf_popularity_rank, health_multiplier
+
+
+
+#roll the abilities of the characters and store them as if each character
+#had called roll_abilities
+def roll_character_abilities(characters, rng=None):
+    if not characters:
+        return
+    std_rank_scores = characters[0].std_rank_scores
+    if any(character.std_rank_scores != std_rank_scores for character in characters):
+        raise ValueError("Characters must all use the same rank scores")
+    result = roll_abilities(*character_inputs(characters), std_rank_scores=std_rank_scores, rng=rng)
+    rolls = result["roll"].tolist()
+    rank_rolls = result["rank_roll"].tolist()
+    bonuses = result["bonus"].tolist()
+    rank = result["rank"].tolist()
+    for row, character in enumerate(characters):
+        if character.ability_bonus_button_was_clicked > 0:
+            character.ability_bonus += 1
+            character.ability_bonus_button_was_clicked = 0
+        character.abilities_rolled = True
+        for column, ability in enumerate(abilities):
+            character.ability_rolls[ability] = {"roll": rolls[row][column],
+                                                "rank_roll": rank_rolls[row][column],
+                                                "bonus": bonuses[row][column],
+                                                "rank": rank[row][column]}
+        #Health, Karma and Resources follow from the ranks
+        character.set_ability_ranks(dict(zip(abilities, rank[row])))